@@ -3,12 +3,30 @@
 import asyncio
 from nicegui import ui
 
-from nicegui_ugform import BooleanField, FloatField, Form, FormDisplay, FormEditor, IntegerField, TextField, __version__
+from nicegui_ugform import (
+    BooleanField,
+    FloatField,
+    Form,
+    FormDisplay,
+    FormEditor,
+    FormResults,
+    IntegerField,
+    SchemaCache,
+    TextField,
+    __version__,
+)
+from nicegui_ugform.data import RecordsSource
 
 
 def main():
     """Runs the test application."""
 
+    # Repeated loads of the same shared schema are decoded only once
+    schema_cache = SchemaCache(maxsize=32)
+
+    # Submissions of all sessions, browsed page by page on the results page
+    submissions = []
+
     # Create a sample form
     form = Form(title="Sample Registration Form", description="Please fill out this registration form", locale="en")
 
@@ -76,6 +94,7 @@ def main():
             with ui.row().classes("w-full justify-center gap-8 p-4 bg-gray-100 rounded"):
                 ui.link("Editor", "/editor").classes("text-lg font-bold")
                 ui.link("Display", "/display").classes("text-lg font-bold")
+                ui.link("Results", "/results").classes("text-lg font-bold")
                 ui.link("Schema", "/schema").classes("text-lg font-bold")
 
     @ui.page("/")
@@ -106,15 +125,17 @@ def main():
         with ui.column().classes("w-full gap-4"):
 
             async def on_submit():
-                data = form.dump_data()
+                data = display.state.dump_data()
                 globals()["last_submission_data"] = data
+                submissions.append(data)
                 print("Form submitted:", data)
                 result_editor.properties["content"]["json"].update(data)
                 ui.notify("Submitting...", type="info")
                 await asyncio.sleep(1)
                 ui.notify("Submitted!", type="positive")
 
-            display = FormDisplay(form, on_submit=on_submit)
+            # Every session shares the same immutable schema and keeps its own values
+            display = FormDisplay(form.freeze(), on_submit=on_submit)
             display.render()
 
             # Result display (initially hidden)
@@ -129,6 +150,13 @@ def main():
     # Initialize global state for submission data
     globals()["last_submission_data"] = None
 
+    @ui.page("/results")
+    def results_page():
+        """Form results page."""
+        menu()
+        results = FormResults(form, RecordsSource(submissions))
+        results.render()
+
     @ui.page("/schema")
     def schema_page():
         """Schema view page."""
@@ -141,7 +169,7 @@ def main():
 
             # Base64 Schema
             with ui.expansion("Base64 Compressed Schema", icon="compress").classes("w-full"):
-                schema_b64 = form.dump_schema_b64(compression_flag=1)
+                schema_b64 = form.dump_schema_b64(compression_flag="auto")
                 ui.textarea(value=schema_b64).classes("w-full").props("readonly")
 
                 def copy_b64():
@@ -158,7 +186,7 @@ def main():
 
                 def load_b64():
                     try:
-                        loaded_form = Form.load_schema_b64(b64_input.value)
+                        loaded_form = Form.load_schema_b64(b64_input.value, cache=schema_cache)
                         ui.notify(f"Loaded form: {loaded_form.title}", type="positive")
                         print("Loaded form schema:", loaded_form.dump_schema())
                     except Exception as e:
@@ -6,10 +6,15 @@ from .core import (
     BooleanField,
     FloatField,
     Form,
+    FormSchema,
+    FormState,
     IntegerField,
+    SchemaCache,
+    SchemaLimitError,
+    SchemaLimits,
     TextField,
 )
-from .ui import FormDisplay, FormEditor
+from .ui import FormDisplay, FormEditor, FormResults
 
 __version__ = "1.1.0"
 
@@ -21,6 +26,12 @@ __all__ = [
     "IntegerField",
     "BooleanField",
     "Form",
+    "FormSchema",
+    "FormState",
     "FormEditor",
     "FormDisplay",
+    "FormResults",
+    "SchemaCache",
+    "SchemaLimitError",
+    "SchemaLimits",
 ]
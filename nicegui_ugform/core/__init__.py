@@ -1,5 +1,8 @@
 """Core module for form management."""
 
+from .batch import BatchValidationResult
+from .cache import SchemaCache, SchemaCacheStats
+from .compression import CompressionType
 from .fields import (
     BaseFormField,
     BaseFormNode,
@@ -8,14 +11,26 @@ from .fields import (
     IntegerField,
     TextField,
 )
-from .form import Form
+from .form import FieldList, Form
+from .limits import SchemaLimitError, SchemaLimits
+from .schema import FormSchema, FormState, ValidationReport
 
 __all__ = [
     "BaseFormField",
     "BaseFormNode",
+    "BatchValidationResult",
     "BooleanField",
+    "CompressionType",
+    "FieldList",
     "FloatField",
     "Form",
+    "FormSchema",
+    "FormState",
     "IntegerField",
+    "SchemaCache",
+    "SchemaCacheStats",
+    "SchemaLimitError",
+    "SchemaLimits",
     "TextField",
+    "ValidationReport",
 ]
@@ -0,0 +1,309 @@
+"""Batch validation of many submissions against the fields of a form."""
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from operator import attrgetter
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from .fields import BaseFormField, FloatField, IntegerField, TextField, ValidationResultType
+from .limits import NO_SCHEMA_LIMITS
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+_OKAY = ValidationResultType.okay.value
+_REQUIRED_MISSING = ValidationResultType.required_missing.value
+_TOO_SHORT = ValidationResultType.too_short.value
+_TOO_LONG = ValidationResultType.to_long.value
+_TOO_SMALL = ValidationResultType.too_small.value
+_TOO_LARGE = ValidationResultType.too_large.value
+_NONE_TYPE = type(None)
+_RESULT_TYPES = tuple(ValidationResultType)
+_code_of = attrgetter("value")
+
+
+class BatchValidationResult(NamedTuple):
+    """Validation results of many records, stored as one column of result codes per field.
+
+    Each code is the value of a `ValidationResultType`. Columns are NumPy `uint8` arrays when NumPy
+    is available, and `array("B")` otherwise.
+    """
+
+    names: Tuple[str, ...]
+    codes: Tuple[Sequence[int], ...]
+    size: int
+
+    def column(self, name: str) -> List[ValidationResultType]:
+        """Gets the results of one field for all records.
+
+        Args:
+            name: The name of the field.
+
+        Returns:
+            List of ValidationResultType in record order.
+
+        Raises:
+            ValueError: If no field has the given name.
+        """
+        return [_RESULT_TYPES[code] for code in self.codes[self.names.index(name)]]
+
+    def record(self, index: int) -> Dict[str, ValidationResultType]:
+        """Gets the results of all fields for one record.
+
+        Args:
+            index: The position of the record.
+
+        Returns:
+            Dictionary mapping field names to ValidationResultType.
+        """
+        return {name: _RESULT_TYPES[codes[index]] for name, codes in zip(self.names, self.codes)}
+
+    def records(self) -> Iterator[Dict[str, ValidationResultType]]:
+        """Iterates over the results of all records.
+
+        Yields:
+            Dictionary mapping field names to ValidationResultType, in record order.
+        """
+        for index in range(self.size):
+            yield self.record(index)
+
+    def invalid_indices(self) -> List[int]:
+        """Gets the positions of the records having at least one invalid field.
+
+        Returns:
+            List of record positions in ascending order.
+        """
+        if np is not None and all(isinstance(codes, np.ndarray) for codes in self.codes):
+            invalid = np.zeros(self.size, dtype=bool)
+            for codes in self.codes:
+                invalid |= codes != _OKAY
+            return np.flatnonzero(invalid).tolist()
+        return [i for i in range(self.size) if any(codes[i] != _OKAY for codes in self.codes)]
+
+
+def validate_batch(
+    fields: Sequence[BaseFormField],
+    records: Optional[Iterable[Mapping[str, Any]]] = None,
+    columns: Optional[Mapping[str, Sequence[Any]]] = None,
+) -> BatchValidationResult:
+    """Validates many records against the given fields.
+
+    Exactly one of `records` and `columns` must be given. Missing values are treated as None.
+    With NumPy available, bounds of `IntegerField`/`FloatField` and lengths of `TextField` are checked
+    with vectorized operations; other checks fall back to the compiled validators of the fields.
+
+    Args:
+        fields: The fields holding values.
+        records: Iterable of dictionaries mapping field names to values.
+        columns: Dictionary mapping field names to sequences of values, all of the same length.
+
+    Returns:
+        A BatchValidationResult with the result of every field for every record.
+
+    Raises:
+        ValueError: If not exactly one of records and columns is given, or the columns differ in length.
+    """
+    if (records is None) == (columns is None):
+        raise ValueError("Exactly one of records and columns must be given")
+
+    if records is not None:
+        records = records if isinstance(records, list) else list(records)
+        size = len(records)
+        columns = {f.name: [r.get(f.name) for r in records] for f in fields}
+    else:
+        assert columns is not None
+        sizes = {len(column) for column in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError("All columns must have the same length")
+        size = sizes.pop() if sizes else 0
+
+    codes = []
+    for field in fields:
+        column = columns.get(field.name)
+        if column is None:
+            column = [None] * size
+        codes.append(_validate_column(field, column))
+    return BatchValidationResult(tuple(f.name for f in fields), tuple(codes), size)
+
+
+def iter_validate_batch_parallel(
+    schema_bin: bytes,
+    records: Iterable[Mapping[str, Any]],
+    chunk_size: int = 10000,
+    max_workers: Optional[int] = None,
+) -> Iterator[BatchValidationResult]:
+    """Validates records in chunks on a pool of worker processes.
+
+    The binary schema is sent once to each worker, which loads and compiles it a single time.
+    Records are consumed lazily, with a bounded number of chunks in flight, so the input can be
+    an unbounded stream.
+
+    Args:
+        schema_bin: The binary schema, as returned by `Form.dump_schema_bin`.
+        records: Iterable of dictionaries mapping field names to values.
+        chunk_size: Number of records per chunk.
+        max_workers: Number of worker processes. If None, uses the number of processors.
+
+    Yields:
+        A BatchValidationResult per chunk, in input order.
+
+    Raises:
+        ValueError: If chunk_size is not positive.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    max_workers = max_workers or os.cpu_count() or 1
+    max_pending = 2 * max_workers
+    iterator = iter(records)
+    with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(schema_bin,)) as executor:
+        pending: Deque[Future] = deque()
+        while True:
+            while len(pending) < max_pending:
+                chunk = list(islice(iterator, chunk_size))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_validate_chunk, chunk))
+            if not pending:
+                return
+            names, columns, size = pending.popleft().result()
+            yield BatchValidationResult(names, tuple(_codes_from_bytes(c) for c in columns), size)
+
+
+def concat_batch_results(names: Tuple[str, ...], results: Iterable[BatchValidationResult]) -> BatchValidationResult:
+    """Concatenates the results of consecutive chunks of records.
+
+    Args:
+        names: The names of the fields, in the order of the results.
+        results: The results to concatenate.
+
+    Returns:
+        A BatchValidationResult covering all records.
+    """
+    parts: List[List[Sequence[int]]] = [[] for _ in names]
+    size = 0
+    for result in results:
+        for part, codes in zip(parts, result.codes):
+            part.append(codes)
+        size += result.size
+
+    if np is not None:
+        codes = tuple(np.concatenate(part) if part else np.empty(0, dtype=np.uint8) for part in parts)
+    else:
+        codes = tuple(array("B", b"".join(bytes(c) for c in part)) for part in parts)
+    return BatchValidationResult(names, codes, size)
+
+
+_worker_fields: List[BaseFormField] = []
+
+
+def _init_worker(schema_bin: bytes) -> None:
+    from .form import Form
+
+    fields = [
+        f for f in Form.load_schema_bin(schema_bin, limits=NO_SCHEMA_LIMITS).fields if isinstance(f, BaseFormField)
+    ]
+    for field in fields:
+        field.compile()
+    _worker_fields[:] = fields
+
+
+def _validate_chunk(records: List[Mapping[str, Any]]) -> Tuple[Tuple[str, ...], List[bytes], int]:
+    result = validate_batch(_worker_fields, records)
+    # Plain bytes keep the results compact to send back, whichever backend the worker used
+    return result.names, [bytes(codes) for codes in result.codes], result.size
+
+
+def _codes_from_bytes(data: bytes) -> Sequence[int]:
+    if np is not None:
+        return np.frombuffer(data, dtype=np.uint8)
+    return array("B", data)
+
+
+def _validate_column(field: BaseFormField, column: Sequence[Any]) -> Sequence[int]:
+    if np is not None:
+        codes = None
+        # Custom checks of subclasses overriding validate cannot be vectorized
+        if isinstance(field, (IntegerField, FloatField)) and not field._overrides_validate():
+            codes = _validate_numeric_column(field, column)
+        elif isinstance(field, TextField) and not field._overrides_validate():
+            codes = _validate_text_column(field, column)
+        if codes is not None:
+            return codes
+        return np.fromiter(map(_code_of, map(field.compile(), column)), dtype=np.uint8, count=len(column))
+    return array("B", map(_code_of, map(field.compile(), column)))
+
+
+def _none_mask(column: Sequence[Any]) -> Tuple[Any, Any]:
+    """Copies a column into an object array and gets the mask of its missing values."""
+    objects = np.empty(len(column), dtype=object)
+    objects[:] = column
+    mask = np.equal(objects, None)
+    return mask, objects
+
+
+def _validate_numeric_column(field: BaseFormField, column: Sequence[Any]) -> Optional[Any]:
+    is_integer = isinstance(field, IntegerField)
+    if isinstance(column, np.ndarray):
+        if column.dtype.kind not in ("iu" if is_integer else "iuf"):
+            return None
+        mask = np.zeros(len(column), dtype=bool)
+        values = column
+    else:
+        types = set(map(type, column))
+        if not types <= ({int, _NONE_TYPE} if is_integer else {int, float, _NONE_TYPE}):
+            return None
+        if _NONE_TYPE in types:
+            mask, objects = _none_mask(column)
+            objects[mask] = 0
+        else:
+            mask, objects = np.zeros(len(column), dtype=bool), column
+        try:
+            values = np.asarray(objects, dtype=np.int64 if is_integer else np.float64)
+        except OverflowError:
+            return None
+
+    min_value = getattr(field, "min_value", None)
+    max_value = getattr(field, "max_value", None)
+    if not is_integer:
+        min_value = float(min_value) if min_value is not None else None
+        max_value = float(max_value) if max_value is not None else None
+
+    codes = np.full(len(values), _OKAY, dtype=np.uint8)
+    # Lower priority results are written first so that higher priority ones win
+    if max_value is not None:
+        codes[values > max_value] = _TOO_LARGE
+    if min_value is not None:
+        codes[values < min_value] = _TOO_SMALL
+    codes[mask] = _REQUIRED_MISSING if field.required else _OKAY
+    return codes
+
+
+def _validate_text_column(field: TextField, column: Sequence[Any]) -> Optional[Any]:
+    types = set(map(type, column))
+    if not types <= {str, _NONE_TYPE}:
+        return None
+    if _NONE_TYPE in types:
+        mask, objects = _none_mask(column)
+        objects[mask] = ""
+    else:
+        mask, objects = np.zeros(len(column), dtype=bool), column
+    lengths = np.fromiter(map(len, objects), dtype=np.int64, count=len(column))
+
+    codes = np.full(len(column), _OKAY, dtype=np.uint8)
+    if field.max_length is not None:
+        codes[lengths > field.max_length] = _TOO_LONG
+    if field.min_length is not None:
+        codes[lengths < field.min_length] = _TOO_SHORT
+    codes[mask] = _REQUIRED_MISSING if field.required else _OKAY
+    if field.regex is not None:
+        # Only values passing all other checks still need the regex of the compiled validator
+        validator = field.compile()
+        for i in np.flatnonzero((codes == _OKAY) & ~mask).tolist():
+            codes[i] = validator(objects[i]).value
+    return codes
@@ -0,0 +1,116 @@
+"""Cache of parsed form schemas keyed by the digest of their serialized payload."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Union
+
+from .form import Form
+from .limits import SchemaLimits
+from .schema import FormSchema
+
+
+class SchemaCacheStats(NamedTuple):
+    """Counters of a schema cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class SchemaCache:
+    """Bounded, thread-safe LRU cache of parsed form schemas.
+
+    Payloads are the strings of `Form.dump_schema_b64` or the bytes of `Form.dump_schema_bin`. Each is
+    decoded once; later loads of the same payload reuse the immutable `FormSchema`.
+    """
+
+    def __init__(self, maxsize: int = 128, limits: Optional[SchemaLimits] = None):
+        """Initializes the schema cache.
+
+        Args:
+            maxsize: Maximum number of schemas to keep. The least recently used one is evicted first.
+            limits: Limits applied when decoding payloads, as for `Form.load_schema_bin`. If None, uses the
+                default `SchemaLimits`.
+
+        Raises:
+            ValueError: If maxsize is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.limits = limits
+        self._entries: "OrderedDict[bytes, FormSchema]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def load_schema(self, payload: Union[str, bytes, bytearray, memoryview]) -> FormSchema:
+        """Gets the immutable schema of a payload, decoding it only on a cache miss.
+
+        Args:
+            payload: Base64-encoded schema string or binary schema data.
+
+        Returns:
+            The shared FormSchema of the payload.
+
+        Raises:
+            SchemaLimitError: If the schema exceeds a limit of the cache.
+            ValueError: If the payload format is invalid.
+        """
+        data = payload.encode("ascii") if isinstance(payload, str) else bytes(payload)
+        key = hashlib.sha256(data).digest()
+        with self._lock:
+            schema = self._entries.get(key)
+            if schema is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return schema
+            self._misses += 1
+
+        # Decode outside of the lock, a concurrent miss of the same payload only costs a redundant decode
+        if isinstance(payload, str):
+            schema = Form.load_schema_b64(payload, limits=self.limits).freeze()
+        else:
+            schema = Form.load_schema_bin(data, limits=self.limits).freeze()
+
+        with self._lock:
+            self._entries[key] = schema
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return schema
+
+    def load_form(self, payload: Union[str, bytes, bytearray, memoryview]) -> Form:
+        """Gets an editable copy of the form of a payload, decoding it only on a cache miss.
+
+        Args:
+            payload: Base64-encoded schema string or binary schema data.
+
+        Returns:
+            A new Form instance.
+
+        Raises:
+            SchemaLimitError: If the schema exceeds a limit of the cache.
+            ValueError: If the payload format is invalid.
+        """
+        return self.load_schema(payload).to_form()
+
+    def stats(self) -> SchemaCacheStats:
+        """Gets the counters of the cache.
+
+        Returns:
+            A SchemaCacheStats snapshot.
+        """
+        with self._lock:
+            return SchemaCacheStats(self._hits, self._misses, self._evictions, len(self._entries), self.maxsize)
+
+    def clear(self) -> None:
+        """Removes all cached schemas and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
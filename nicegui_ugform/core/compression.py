@@ -0,0 +1,146 @@
+"""Compression codecs of the binary form schema encoding."""
+
+import gzip
+import lzma
+import zlib
+from enum import IntEnum
+from typing import Any, Iterable, Literal, Optional, Tuple, Union
+
+from .limits import SchemaLimitError
+
+
+class CompressionType(IntEnum):
+    """Compression flag values of the binary schema header."""
+
+    none = 0
+    gzip = 1
+    deflate = 2
+    """Raw deflate stream primed with the `PRESET_DICTIONARY`."""
+    lzma = 3
+    """Raw LZMA2 stream, best suited to large schemas."""
+
+
+CompressionFlag = Union[Literal[0, 1, 2, 3, "auto"], CompressionType]
+Buffer = Union[bytes, bytearray, memoryview]
+
+# Keys and values of the schema format itself, most frequent last as zlib favours short distances. It holds
+# no content of any particular form, such as labels or patterns, since it is frozen into the wire format.
+# Existing payloads depend on these exact bytes: never change them, add a new compression flag instead.
+PRESET_DICTIONARY = (
+    b'"show_reset_button":false,"show_submit_button":false,"locale":"zh_cn","locale":"en"}'
+    b'"default_value":false,"default_value":true,"default_value":'
+    b'{"type":"BooleanField","name":"{"type":"FloatField","name":"{"type":"IntegerField","name":"'
+    b'"min_value":"max_value":"min_length":"max_length":"regex":"'
+    b'{"uuid":"","title":"","fields":[{"type":"TextField","name":"","label":"","required":false,'
+    b'"required":true,"description":"},"show_reset_button":true,"show_submit_button":true,"description":"'
+)
+
+_LZMA_FILTERS = [{"id": lzma.FILTER_LZMA2, "preset": 9 | lzma.PRESET_EXTREME, "dict_size": 1 << 20}]
+
+
+def compress(data: bytes, compression_flag: CompressionFlag) -> Tuple[int, bytes]:
+    """Compresses data with the given codec.
+
+    Args:
+        data: The data to compress.
+        compression_flag: The compression type, or "auto" to pick the one giving the smallest output.
+
+    Returns:
+        Tuple of the compression flag actually used and the compressed data.
+
+    Raises:
+        ValueError: If the compression flag is invalid.
+    """
+    if compression_flag == "auto":
+        candidates = [(flag, compress(data, flag)[1]) for flag in CompressionType]
+        return min(candidates, key=lambda candidate: len(candidate[1]))
+
+    if compression_flag == CompressionType.none:
+        return CompressionType.none, data
+    if compression_flag == CompressionType.gzip:
+        return CompressionType.gzip, gzip.compress(data)
+    if compression_flag == CompressionType.deflate:
+        compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=PRESET_DICTIONARY)
+        return CompressionType.deflate, compressor.compress(data) + compressor.flush()
+    if compression_flag == CompressionType.lzma:
+        return CompressionType.lzma, lzma.compress(data, format=lzma.FORMAT_RAW, filters=_LZMA_FILTERS)
+    raise ValueError(f"Invalid compression flag: {compression_flag}")
+
+
+def decompress(chunks: Iterable[Buffer], compression_flag: int, max_size: Optional[int] = None) -> bytes:
+    """Decompresses data compressed with the given codec, incrementally.
+
+    Output is produced in bounded steps, so that a small payload inflating to a huge size is rejected
+    once the limit is exceeded instead of after being fully decompressed.
+
+    Args:
+        chunks: Consecutive chunks of the compressed data, e.g. a single memoryview or blocks read from a file.
+        compression_flag: The compression type read from the header.
+        max_size: Maximum size of the decompressed data. If None, the size is unbounded.
+
+    Returns:
+        The decompressed data.
+
+    Raises:
+        SchemaLimitError: If the decompressed data exceeds max_size.
+        ValueError: If the compression flag is invalid or the compressed data is corrupted.
+    """
+    output = bytearray()
+
+    def check_size(size: int) -> None:
+        if max_size is not None and size > max_size:
+            raise SchemaLimitError(f"Schema exceeds the limit of {max_size} decompressed bytes")
+
+    def append(data: bytes) -> None:
+        output.extend(data)
+        check_size(len(output))
+
+    # Asks for one byte more than allowed, so that exceeding the limit is detected without going further
+    def step() -> int:
+        return 0 if max_size is None else max_size - len(output) + 1
+
+    try:
+        if compression_flag == CompressionType.none:
+            # Copied once, after the size of every chunk was checked
+            parts = []
+            size = 0
+            for chunk in chunks:
+                size += len(chunk)
+                check_size(size)
+                parts.append(chunk)
+            return b"".join(parts)
+
+        if compression_flag == CompressionType.gzip or compression_flag == CompressionType.deflate:
+            decompressor = _new_zlib_decompressor(compression_flag)
+            for chunk in chunks:
+                data = chunk
+                while data:
+                    append(decompressor.decompress(data, step()))
+                    data = decompressor.unconsumed_tail
+                    if decompressor.eof and compression_flag == CompressionType.gzip and decompressor.unused_data:
+                        # Concatenated gzip members, as accepted by gzip.decompress
+                        data = decompressor.unused_data + data
+                        decompressor = _new_zlib_decompressor(compression_flag)
+            if not decompressor.eof:
+                raise ValueError("Invalid binary schema: truncated compressed data")
+            return bytes(output)
+
+        if compression_flag == CompressionType.lzma:
+            decompressor = lzma.LZMADecompressor(format=lzma.FORMAT_RAW, filters=_LZMA_FILTERS)
+            for chunk in chunks:
+                append(decompressor.decompress(chunk, step() or -1))
+                while not decompressor.eof and not decompressor.needs_input:
+                    append(decompressor.decompress(b"", step() or -1))
+            if not decompressor.eof:
+                raise ValueError("Invalid binary schema: truncated compressed data")
+            return bytes(output)
+    except (zlib.error, lzma.LZMAError, EOFError) as e:
+        raise ValueError(f"Invalid binary schema: corrupted compressed data ({e})") from None
+
+    raise ValueError(f"Invalid compression flag: {compression_flag}")
+
+
+def _new_zlib_decompressor(compression_flag: int) -> Any:
+    if compression_flag == CompressionType.gzip:
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    return zlib.decompressobj(-zlib.MAX_WBITS, zdict=PRESET_DICTIONARY)
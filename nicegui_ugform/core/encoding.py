@@ -0,0 +1,413 @@
+"""Compact binary encodings of form schemas and submission data.
+
+Schemas (body of UGFS version 2) start with a string table holding every distinct string once (keys,
+type names, labels...), followed by the form record and the field records. A record is a varint entry
+count and, for each entry, the string index of its key and a tagged value:
+
+- 0x00: None
+- 0x01: False
+- 0x02: True
+- 0x03: Integer, as a zigzag varint
+- 0x04: Float, as a little-endian float64
+- 0x05: String, as the varint index in the string table
+
+Submission data (UGFD) is positional, see `DataCodec`.
+
+Varints are little-endian base 128.
+"""
+
+import struct
+from typing import Any, Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Type, Union
+
+from .fields import FIELD_TYPES, BaseFormField, BooleanField, FloatField, IntegerField, TextField
+from .limits import NO_SCHEMA_LIMITS, SchemaLimits
+
+_NONE = 0x00
+_FALSE = 0x01
+_TRUE = 0x02
+_INT = 0x03
+_FLOAT = 0x04
+_STR = 0x05
+
+_float64 = struct.Struct("<d")
+
+
+class _FieldTemplate(NamedTuple):
+    """Attributes of a new field of a built-in type, to decode field records directly into."""
+
+    field_class: Type[BaseFormField]
+    attributes: Dict[str, Any]
+    """Attributes of a field constructed with the default arguments, and `_MISSING` for required ones."""
+    parameters: FrozenSet[str]
+    """Names of the constructor arguments, each stored in the attribute of the same name."""
+
+
+_MISSING = object()
+
+
+def _field_template(field_class: Type[BaseFormField]) -> _FieldTemplate:
+    attributes = field_class(name=_MISSING, label=_MISSING).__dict__.copy()  # type: ignore[arg-type]
+    parameters = frozenset(attributes) - set(field_class._RUNTIME_ATTRS)
+    return _FieldTemplate(field_class, attributes, parameters)
+
+
+_FIELD_TEMPLATES = {cls.__name__: _field_template(cls) for cls in (TextField, IntegerField, FloatField, BooleanField)}
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else (~value << 1) | 1
+
+
+def _unzigzag(value: int) -> int:
+    return ~(value >> 1) if value & 1 else value >> 1
+
+
+def encode_schema(schema: Mapping[str, Any]) -> bytes:
+    """Encodes a schema dictionary, as returned by `Form.dump_schema`, into the compact body.
+
+    Args:
+        schema: Dictionary containing form schema.
+
+    Returns:
+        The encoded body.
+
+    Raises:
+        ValueError: If the schema holds a value of an unsupported type.
+    """
+    strings: Dict[str, int] = {}
+    records = bytearray()
+    write_varint = _write_varint
+
+    def write_record(items: List[Tuple[str, Any]]) -> None:
+        write_varint(records, len(items))
+        for key, value in items:
+            write_varint(records, strings.setdefault(key, len(strings)))
+            if value is None:
+                records.append(_NONE)
+            elif value is True or value is False:
+                records.append(_TRUE if value else _FALSE)
+            elif isinstance(value, int):
+                records.append(_INT)
+                write_varint(records, _zigzag(value))
+            elif isinstance(value, float):
+                records.append(_FLOAT)
+                records.extend(_float64.pack(value))
+            elif isinstance(value, str):
+                records.append(_STR)
+                write_varint(records, strings.setdefault(value, len(strings)))
+            else:
+                raise ValueError(f"Unsupported schema value for {key!r}: {type(value).__name__}")
+
+    write_record([(key, value) for key, value in schema.items() if key != "fields"])
+    fields = schema.get("fields", [])
+    write_varint(records, len(fields))
+    for field_data in fields:
+        write_record(list(field_data.items()))
+
+    body = bytearray()
+    write_varint(body, len(strings))
+    for string in strings:
+        encoded = string.encode("utf-8")
+        write_varint(body, len(encoded))
+        body += encoded
+    return bytes(body + records)
+
+
+def decode_schema(
+    body: memoryview, limits: SchemaLimits = NO_SCHEMA_LIMITS
+) -> Tuple[Dict[str, Any], List[BaseFormField]]:
+    """Decodes a compact body straight into field objects.
+
+    Fields of unknown types are skipped, as when loading JSON schemas.
+
+    Args:
+        body: The encoded body. Strings are decoded from it without copying the other bytes.
+        limits: Limits on the number of fields and the length of strings, checked before reading them.
+
+    Returns:
+        Tuple of the form attributes (schema keys other than "fields") and the fields.
+
+    Raises:
+        SchemaLimitError: If the body exceeds a limit.
+        ValueError: If the body is malformed.
+    """
+    pos = 0
+
+    def read_varint() -> int:
+        nonlocal pos
+        byte = body[pos]
+        pos += 1
+        if byte < 0x80:
+            return byte
+        result = byte & 0x7F
+        shift = 7
+        while True:
+            byte = body[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def read_value() -> Any:
+        nonlocal pos
+        tag = body[pos]
+        pos += 1
+        if tag == _STR:
+            return strings[read_varint()]
+        if tag == _TRUE or tag == _FALSE:
+            return tag == _TRUE
+        if tag == _INT:
+            return _unzigzag(read_varint())
+        if tag == _NONE:
+            return None
+        if tag == _FLOAT:
+            (value,) = _float64.unpack_from(body, pos)
+            pos += 8
+            return value
+        raise ValueError(f"Invalid binary schema: unknown value tag {tag}")
+
+    def read_record(count: int) -> Dict[str, Any]:
+        return {strings[read_varint()]: read_value() for _ in range(count)}
+
+    def read_field() -> Optional[BaseFormField]:
+        nonlocal pos
+        count = read_varint()
+        start = pos
+        # Records of built-in fields start with their type, as written by `to_dict`, and are decoded
+        # into the attributes of the field without passing through keyword arguments
+        template = None
+        if count and strings[read_varint()] == "type":
+            type_name = read_value()
+            template = _FIELD_TEMPLATES.get(type_name)
+            if template is not None and FIELD_TYPES.get(type_name) is not template.field_class:
+                template = None
+        if template is None:
+            pos = start
+            kwargs = read_record(count)
+            field_class = FIELD_TYPES.get(kwargs.pop("type", None))
+            return field_class(**kwargs) if field_class is not None else None
+
+        field = template.field_class.__new__(template.field_class)
+        attributes = field.__dict__
+        attributes.update(template.attributes)
+        parameters = template.parameters
+        for _ in range(count - 1):
+            key = strings[read_varint()]
+            if key not in parameters:
+                raise ValueError(f"Invalid binary schema: unknown attribute {key!r} of {type_name}")
+            attributes[key] = read_value()
+        if attributes["name"] is _MISSING or attributes["label"] is _MISSING:
+            raise ValueError(f"Invalid binary schema: {type_name} without a name or label")
+        attributes["current_value"] = attributes["default_value"]
+        return field
+
+    try:
+        strings: List[str] = []
+        for _ in range(read_varint()):
+            length = read_varint()
+            limits.check_string_length(length)
+            if pos + length > len(body):
+                raise IndexError
+            strings.append(str(body[pos : pos + length], "utf-8"))
+            pos += length
+
+        attributes = read_record(read_varint())
+        fields = []
+        count = read_varint()
+        limits.check_fields(count)
+        for _ in range(count):
+            field = read_field()
+            if field is not None:
+                fields.append(field)
+    except (IndexError, struct.error):
+        raise ValueError("Invalid binary schema: truncated body") from None
+
+    if pos != len(body):
+        raise ValueError("Invalid binary schema: unexpected trailing data")
+    return attributes, fields
+
+
+_DATA_MAGIC = b"UGFD"
+_DATA_VERSION = 1
+_DATA_HEADER_SIZE = 13
+
+_KIND_TEXT = 0
+_KIND_INT = 1
+_KIND_FLOAT = 2
+_KIND_BOOL = 3
+
+
+class DataCodec:
+    """Positional binary encoding of the values of a sequence of fields, tied to a schema fingerprint.
+
+    Encoding:
+    - 0x00~0x03: Magic number 'UGFD' (User Generated Form Data)
+    - 0x04: Data version number
+    - 0x05~0x0C: First 8 bytes of the schema fingerprint
+    - Null bitmap, one bit per field in field order (least significant bit first)
+    - Boolean bitmap, one bit per `BooleanField` in field order
+    - Remaining values in field order: varint (zigzag) for integers, little-endian float64 for floats,
+      varint length and UTF-8 bytes for text
+    """
+
+    def __init__(self, fields: Sequence[BaseFormField], fingerprint: str):
+        """Initializes the codec.
+
+        Args:
+            fields: The fields holding the values.
+            fingerprint: The fingerprint of the schema of the fields.
+        """
+        self.names = tuple(f.name for f in fields)
+        self._kinds = tuple(_field_kind(f) for f in fields)
+        bool_count = self._kinds.count(_KIND_BOOL)
+        self._header = _DATA_MAGIC + bytes([_DATA_VERSION]) + bytes.fromhex(fingerprint[:16])
+        self._null_size = (len(fields) + 7) // 8
+        self._bool_size = (bool_count + 7) // 8
+
+    def encode(self, values: Sequence[Any]) -> bytes:
+        """Encodes the values of the fields.
+
+        Args:
+            values: The values in field order. None values are stored in the null bitmap only.
+
+        Returns:
+            The encoded data.
+
+        Raises:
+            ValueError: If the number of values does not match, or a value does not have the type of its field
+                or does not fit in it.
+        """
+        if len(values) != len(self._kinds):
+            raise ValueError(f"Expected {len(self._kinds)} values, got {len(values)}")
+
+        nulls = bools = bool_bit = 0
+        body = bytearray()
+        for i, (kind, value) in enumerate(zip(self._kinds, values)):
+            if kind == _KIND_BOOL:
+                if value is True:
+                    bools |= 1 << bool_bit
+                elif value is None:
+                    nulls |= 1 << i
+                elif value is not False:
+                    raise self._type_error(i, value)
+                bool_bit += 1
+            elif value is None:
+                nulls |= 1 << i
+            elif kind == _KIND_TEXT:
+                if not isinstance(value, str):
+                    raise self._type_error(i, value)
+                encoded = value.encode("utf-8")
+                _write_varint(body, len(encoded))
+                body += encoded
+            elif kind == _KIND_INT:
+                if not isinstance(value, int) or isinstance(value, bool):
+                    raise self._type_error(i, value)
+                _write_varint(body, _zigzag(value))
+            else:
+                if not isinstance(value, (int, float)) or isinstance(value, bool):
+                    raise self._type_error(i, value)
+                try:
+                    body += _float64.pack(value)
+                except (OverflowError, struct.error):
+                    # Integers too large for a float
+                    raise ValueError(f"Cannot encode integer as a float for field '{self.names[i]}'") from None
+
+        return b"".join(
+            (
+                self._header,
+                nulls.to_bytes(self._null_size, "little"),
+                bools.to_bytes(self._bool_size, "little"),
+                body,
+            )
+        )
+
+    def decode(self, data: Union[bytes, bytearray, memoryview]) -> List[Any]:
+        """Decodes values encoded by `encode`.
+
+        Args:
+            data: The encoded data.
+
+        Returns:
+            The values in field order.
+
+        Raises:
+            ValueError: If the data is malformed or belongs to another schema.
+        """
+        data = memoryview(data)
+        if len(data) < _DATA_HEADER_SIZE:
+            raise ValueError("Invalid binary data: too short")
+        if data[0:4] != _DATA_MAGIC:
+            raise ValueError("Invalid binary data: magic number mismatch")
+        if data[4] != _DATA_VERSION:
+            raise ValueError(f"Invalid binary data: unsupported version {data[4]}")
+        if data[5:_DATA_HEADER_SIZE] != self._header[5:]:
+            raise ValueError("Invalid binary data: schema fingerprint mismatch")
+
+        pos = _DATA_HEADER_SIZE + self._null_size + self._bool_size
+        if len(data) < pos:
+            raise ValueError("Invalid binary data: truncated")
+        nulls = int.from_bytes(data[_DATA_HEADER_SIZE : _DATA_HEADER_SIZE + self._null_size], "little")
+        bools = int.from_bytes(data[_DATA_HEADER_SIZE + self._null_size : pos], "little")
+
+        values: List[Any] = []
+        append = values.append
+        bool_bit = 0
+        try:
+            for i, kind in enumerate(self._kinds):
+                if kind == _KIND_BOOL:
+                    append(None if nulls >> i & 1 else bool(bools >> bool_bit & 1))
+                    bool_bit += 1
+                elif nulls >> i & 1:
+                    append(None)
+                elif kind == _KIND_TEXT:
+                    length, pos = _read_varint(data, pos)
+                    if pos + length > len(data):
+                        raise IndexError
+                    append(str(data[pos : pos + length], "utf-8"))
+                    pos += length
+                elif kind == _KIND_INT:
+                    value, pos = _read_varint(data, pos)
+                    append(_unzigzag(value))
+                else:
+                    append(_float64.unpack_from(data, pos)[0])
+                    pos += 8
+        except (IndexError, struct.error):
+            raise ValueError("Invalid binary data: truncated") from None
+
+        if pos != len(data):
+            raise ValueError("Invalid binary data: unexpected trailing data")
+        return values
+
+    def _type_error(self, index: int, value: Any) -> ValueError:
+        return ValueError(f"Cannot encode value of type {type(value).__name__} for field '{self.names[index]}'")
+
+
+def _field_kind(field: BaseFormField) -> int:
+    if isinstance(field, TextField):
+        return _KIND_TEXT
+    if isinstance(field, IntegerField):
+        return _KIND_INT
+    if isinstance(field, FloatField):
+        return _KIND_FLOAT
+    if isinstance(field, BooleanField):
+        return _KIND_BOOL
+    raise ValueError(f"Unsupported field type for binary data: {type(field).__name__}")
+
+
+def _read_varint(data: memoryview, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
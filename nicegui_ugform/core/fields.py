@@ -1,8 +1,8 @@
 """Field classes for form construction."""
 
-from abc import ABC, abstractmethod
+from abc import ABC
 from enum import Enum
-from typing import Any, Generic, Optional, TypeVar
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, Type, TypeVar
 import re
 
 
@@ -20,6 +20,9 @@ class ValidationResultType(Enum):
 class BaseFormNode(ABC):
     """Base class for all form nodes."""
 
+    _RUNTIME_ATTRS: Tuple[str, ...] = ()
+    """Names of the attributes that hold runtime state rather than the node definition."""
+
     def __init__(self, name: str):
         """Initializes the form node.
 
@@ -28,13 +31,62 @@ class BaseFormNode(ABC):
         """
         self.name = name
 
+    def __setattr__(self, key: str, value: Any) -> None:
+        form = self.__dict__.get("_form")
+        if key.startswith("_") or (form is None and "_frozen" not in self.__dict__):
+            # Fast path of private attributes and of nodes under construction
+            super().__setattr__(key, value)
+            return
+
+        if self.__dict__.get("_frozen"):
+            raise AttributeError(f"Cannot modify '{key}' of frozen form node '{self.name}'")
+        if form is not None and key == "name":
+            # Lets the owner keep its name index consistent, or reject a duplicate name
+            form._on_field_renamed(self, value)
+        super().__setattr__(key, value)
+        if form is not None and key not in self._RUNTIME_ATTRS:
+            form._on_field_changed(self, key)
+
+    def __getstate__(self) -> dict:
+        # Copies of a node are always mutable and detached from their owner
+        state = self.__dict__.copy()
+        state.pop("_frozen", None)
+        state.pop("_form", None)
+        return state
+
+    @property
+    def frozen(self) -> bool:
+        """Whether this node belongs to an immutable schema and rejects modifications."""
+        return self.__dict__.get("_frozen", False)
+
+    def freeze(self) -> None:
+        """Marks this node as immutable. Public attributes can no longer be modified afterwards."""
+        self.__dict__["_frozen"] = True
+
+    def _attach(self, form: Any) -> None:
+        owner = self.__dict__.get("_form")
+        if owner is not None and owner is not form:
+            raise ValueError(f"Form node '{self.name}' already belongs to another form")
+        self.__dict__["_form"] = form
+
+    def _detach(self, form: Any) -> None:
+        if self.__dict__.get("_form") is form:
+            del self.__dict__["_form"]
+
 
 T = TypeVar("T")
 
+# A compiled validation closure, mapping a value to its validation result
+Validator = Callable[[Any], ValidationResultType]
+
 
 class BaseFormField(BaseFormNode, Generic[T], ABC):
     """Base class for all form fields with type safety."""
 
+    _RUNTIME_ATTRS = ("current_value",)
+    _CONSTRAINTS: Tuple[str, ...] = ("required",)
+    """Names of the attributes that the compiled validator depends on."""
+
     def __init__(
         self,
         name: str,
@@ -77,9 +129,53 @@ class BaseFormField(BaseFormNode, Generic[T], ABC):
         """
         return self.current_value
 
-    @abstractmethod
+    def __setattr__(self, key: str, value: Any) -> None:
+        super().__setattr__(key, value)
+        if "_validator" in self.__dict__ and key in self._CONSTRAINTS:
+            del self.__dict__["_validator"]
+
+    def __getstate__(self) -> dict:
+        state = super().__getstate__()
+        state.pop("_validator", None)
+        return state
+
+    def compile(self) -> Validator:
+        """Gets the compiled validator of this field.
+        The validator is built once and rebuilt only after a constraint attribute changes. If the field class
+        overrides `validate`, the validator is that method.
+
+        Returns:
+            A closure that validates a value against the current constraints.
+        """
+        if self._overrides_validate():
+            return self.validate
+        return self._compiled_validator()
+
+    def _compiled_validator(self) -> Validator:
+        validator = self.__dict__.get("_validator")
+        if validator is None:
+            validator = self._build_validator()
+            self.__dict__["_validator"] = validator
+        return validator
+
+    def _overrides_validate(self) -> bool:
+        return type(self).validate is not BaseFormField.validate
+
+    def _build_validator(self) -> Validator:
+        """Builds a validator closure from a snapshot of the constraints of this field.
+        Custom fields implement either this or `validate`.
+
+        Returns:
+            A closure that validates a value and returns a ValidationResultType.
+
+        Raises:
+            NotImplementedError: If the field class implements neither this nor `validate`.
+        """
+        raise NotImplementedError(f"{type(self).__name__} must implement _build_validator or validate")
+
     def validate(self, value: Any) -> ValidationResultType:
         """Validates the given value and returns a detailed result.
+        Custom fields may override this, e.g. to add checks to those of a built-in field.
 
         Args:
             value: The value to validate.
@@ -87,7 +183,7 @@ class BaseFormField(BaseFormNode, Generic[T], ABC):
         Returns:
             A ValidationResultType indicating the validation status.
         """
-        raise NotImplementedError()
+        return self._compiled_validator()(value)
 
     def is_validated(self, value: Any) -> bool:
         """Validates the given value.
@@ -122,6 +218,8 @@ class BaseFormField(BaseFormNode, Generic[T], ABC):
 class TextField(BaseFormField[str]):
     """Text field for string input."""
 
+    _CONSTRAINTS = ("required", "min_length", "max_length", "regex")
+
     def __init__(
         self,
         name: str,
@@ -150,24 +248,31 @@ class TextField(BaseFormField[str]):
         self.max_length = max_length
         self.regex = regex
 
-    def validate(self, value: Any) -> ValidationResultType:
-        if value is None:
-            return ValidationResultType.okay if not self.required else ValidationResultType.required_missing
+    def _build_validator(self) -> Validator:
+        required = self.required
+        min_length = self.min_length
+        max_length = self.max_length
+        match = re.compile(self.regex).match if self.regex is not None else None
 
-        if not isinstance(value, str):
-            return ValidationResultType.invalid_type
+        def validate(value: Any) -> ValidationResultType:
+            if value is None:
+                return ValidationResultType.required_missing if required else ValidationResultType.okay
 
-        if self.min_length is not None and len(value) < self.min_length:
-            return ValidationResultType.too_short
+            if not isinstance(value, str):
+                return ValidationResultType.invalid_type
 
-        if self.max_length is not None and len(value) > self.max_length:
-            return ValidationResultType.to_long
+            if min_length is not None and len(value) < min_length:
+                return ValidationResultType.too_short
 
-        if self.regex is not None:
-            if not re.match(self.regex, value):
+            if max_length is not None and len(value) > max_length:
+                return ValidationResultType.to_long
+
+            if match is not None and not match(value):
                 return ValidationResultType.regex_mismatch
 
-        return ValidationResultType.okay
+            return ValidationResultType.okay
+
+        return validate
 
     def to_dict(self) -> dict:
         result = super().to_dict()
@@ -183,6 +288,8 @@ class TextField(BaseFormField[str]):
 class FloatField(BaseFormField[float]):
     """Float field for decimal number input."""
 
+    _CONSTRAINTS = ("required", "min_value", "max_value")
+
     def __init__(
         self,
         name: str,
@@ -208,22 +315,29 @@ class FloatField(BaseFormField[float]):
         self.min_value = min_value
         self.max_value = max_value
 
-    def validate(self, value: Any) -> ValidationResultType:
-        if value is None:
-            return ValidationResultType.okay if not self.required else ValidationResultType.required_missing
+    def _build_validator(self) -> Validator:
+        required = self.required
+        min_value = float(self.min_value) if self.min_value is not None else None
+        max_value = float(self.max_value) if self.max_value is not None else None
 
-        if not isinstance(value, (int, float)):
-            return ValidationResultType.invalid_type
+        def validate(value: Any) -> ValidationResultType:
+            if value is None:
+                return ValidationResultType.required_missing if required else ValidationResultType.okay
 
-        value = float(value)
+            if not isinstance(value, (int, float)):
+                return ValidationResultType.invalid_type
 
-        if self.min_value is not None and value < self.min_value:
-            return ValidationResultType.too_small
+            value = float(value)
 
-        if self.max_value is not None and value > self.max_value:
-            return ValidationResultType.too_large
+            if min_value is not None and value < min_value:
+                return ValidationResultType.too_small
 
-        return ValidationResultType.okay
+            if max_value is not None and value > max_value:
+                return ValidationResultType.too_large
+
+            return ValidationResultType.okay
+
+        return validate
 
     def to_dict(self) -> dict:
         result = super().to_dict()
@@ -237,6 +351,8 @@ class FloatField(BaseFormField[float]):
 class IntegerField(BaseFormField[int]):
     """Integer field for whole number input."""
 
+    _CONSTRAINTS = ("required", "min_value", "max_value")
+
     def __init__(
         self,
         name: str,
@@ -262,20 +378,27 @@ class IntegerField(BaseFormField[int]):
         self.min_value = min_value
         self.max_value = max_value
 
-    def validate(self, value: Any) -> ValidationResultType:
-        if value is None:
-            return ValidationResultType.okay if not self.required else ValidationResultType.required_missing
+    def _build_validator(self) -> Validator:
+        required = self.required
+        min_value = self.min_value
+        max_value = self.max_value
 
-        if not isinstance(value, int) or isinstance(value, bool):
-            return ValidationResultType.invalid_type
+        def validate(value: Any) -> ValidationResultType:
+            if value is None:
+                return ValidationResultType.required_missing if required else ValidationResultType.okay
 
-        if self.min_value is not None and value < self.min_value:
-            return ValidationResultType.too_small
+            if not isinstance(value, int) or isinstance(value, bool):
+                return ValidationResultType.invalid_type
 
-        if self.max_value is not None and value > self.max_value:
-            return ValidationResultType.too_large
+            if min_value is not None and value < min_value:
+                return ValidationResultType.too_small
 
-        return ValidationResultType.okay
+            if max_value is not None and value > max_value:
+                return ValidationResultType.too_large
+
+            return ValidationResultType.okay
+
+        return validate
 
     def to_dict(self) -> dict:
         result = super().to_dict()
@@ -308,11 +431,25 @@ class BooleanField(BaseFormField[bool]):
         """
         super().__init__(name, label, description, required, default_value)
 
-    def validate(self, value: Any) -> ValidationResultType:
-        if value is None:
-            return ValidationResultType.okay if not self.required else ValidationResultType.required_missing
+    def _build_validator(self) -> Validator:
+        required = self.required
+
+        def validate(value: Any) -> ValidationResultType:
+            if value is None:
+                return ValidationResultType.required_missing if required else ValidationResultType.okay
+
+            if isinstance(value, bool):
+                return ValidationResultType.okay
+
+            return ValidationResultType.invalid_type
+
+        return validate
 
-        if isinstance(value, bool):
-            return ValidationResultType.okay
 
-        return ValidationResultType.invalid_type
+FIELD_TYPES: Dict[str, Type[BaseFormField]] = {
+    "TextField": TextField,
+    "FloatField": FloatField,
+    "IntegerField": IntegerField,
+    "BooleanField": BooleanField,
+}
+"""Field classes by the type name used in serialized schemas."""
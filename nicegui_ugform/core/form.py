@@ -1,25 +1,109 @@
 """Form class for managing form structure and data."""
 
 import base64
-import gzip
+import copy
+import hashlib
 import json
 import uuid
-from typing import List, Literal, Optional
-
-from .fields import (
-    BaseFormField,
-    BaseFormNode,
-    BooleanField,
-    FloatField,
-    IntegerField,
-    TextField,
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
 )
 
+from .batch import BatchValidationResult, concat_batch_results, iter_validate_batch_parallel, validate_batch
+from .compression import CompressionFlag, compress, decompress
+from .encoding import DataCodec, decode_schema, encode_schema
+from .fields import FIELD_TYPES, BaseFormField, BaseFormNode, ValidationResultType, Validator
+from .limits import DEFAULT_SCHEMA_LIMITS, SchemaLimits
+from .schema import FormSchema, FormState, ValidationReport, validate_and_dump
+
+if TYPE_CHECKING:
+    from .cache import SchemaCache
+
+
+class FieldList(List[BaseFormNode]):
+    """The fields of a form, as returned by `Form.fields`.
+
+    It is a list whose changes in place go through the form, so the name index, the ownership of the
+    fields and the cached dumps stay consistent. For example, `append` is `Form.add_field` and `remove`
+    is `Form.remove_field`. Copies and slices are plain lists.
+    """
+
+    __slots__ = ("_form",)
+
+    def __init__(self, form: "Form"):
+        super().__init__()
+        self._form = form
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        return list, (list(self),)
+
+    def append(self, field: BaseFormNode) -> None:
+        self._form.add_field(field)
+
+    def insert(self, index: Any, field: BaseFormNode) -> None:
+        self._form.insert_field(index, field)
+
+    def extend(self, fields: Iterable[BaseFormNode]) -> None:
+        for field in list(fields):
+            self._form.add_field(field)
+
+    def __iadd__(self, fields: Iterable[BaseFormNode]) -> "FieldList":  # type: ignore[override]
+        self.extend(fields)
+        return self
+
+    def remove(self, field: BaseFormNode) -> None:
+        if not any(f is field for f in self):
+            raise ValueError("The field is not in the form")
+        self._form.remove_field(field.name)
+
+    def pop(self, index: Any = -1) -> BaseFormNode:
+        field = self[index]
+        self._form.remove_field(field.name)
+        return field
+
+    def clear(self) -> None:
+        self._form.fields = []
+
+    def __delitem__(self, index: Any) -> None:
+        fields = self[index] if isinstance(index, slice) else [self[index]]
+        for field in fields:
+            self._form.remove_field(field.name)
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        fields = list(self)
+        fields[index] = value
+        self._form.fields = fields
+
+    def __imul__(self, count: Any) -> "FieldList":  # type: ignore[override]
+        self._form.fields = list(self) * count
+        return self
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._form._touch()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._form._touch()
+
 
 class Form:
     """Represents a form with fields and validation logic."""
 
-    _SCHEMA_VERSION = 1
+    _SCHEMA_VERSIONS = (1, 2)
+    _READ_CHUNK_SIZE = 64 * 1024
 
     def __init__(
         self,
@@ -42,21 +126,136 @@ class Form:
             show_reset_button: Whether to show the reset button (default: True).
             show_submit_button: Whether to show the submit button (default: True).
         """
+        self._revision = 0
+        self._dump_cache: Dict[Any, Any] = {}
         self.uuid = form_uuid or str(uuid.uuid4())
         self.title = title
         self.description = description
         self.locale = locale
         self.show_reset_button = show_reset_button
         self.show_submit_button = show_submit_button
-        self.fields: List[BaseFormNode] = fields or []
+        self._fields = FieldList(self)
+        self._field_index: Dict[str, BaseFormNode] = {}
+        self.fields = fields or []
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        super().__setattr__(key, value)
+        if not key.startswith("_"):
+            self._touch()
+
+    def __getstate__(self) -> dict:
+        # Copies rebuild the index and the dumps, and own the copies of the fields
+        state = self.__dict__.copy()
+        state["_fields"] = list(self._fields)
+        del state["_field_index"]
+        del state["_dump_cache"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        state = state.copy()
+        fields = state.pop("_fields")
+        self.__dict__.update(state)
+        self.__dict__.update(_fields=FieldList(self), _field_index={}, _dump_cache={})
+        self.fields = fields
+
+    @property
+    def revision(self) -> int:
+        """Counter increased by every change of the form structure or of a field definition."""
+        return self._revision
+
+    @property
+    def fingerprint(self) -> str:
+        """Content fingerprint of the form schema, e.g. for use as an HTTP ETag.
+
+        It is the hex digest of the SHA-256 hash of the compact JSON schema, and is cached until the
+        form changes.
+        """
+        return self._cached("fingerprint", lambda: hashlib.sha256(self._dump_schema_json()).hexdigest())
+
+    def _touch(self) -> None:
+        # Invalidates every cached dump of the schema
+        self._revision += 1
+        self._dump_cache.clear()
+
+    def _cached(self, key: Any, build: Callable[[], Any]) -> Any:
+        try:
+            return self._dump_cache[key]
+        except KeyError:
+            value = self._dump_cache[key] = build()
+            return value
+
+    @property
+    def fields(self) -> FieldList:
+        """The fields of the form in display order.
+
+        Changes of the list in place go through `add_field`, `insert_field` and `remove_field`. A new
+        list of fields can also be assigned.
+        """
+        return self._fields
+
+    @fields.setter
+    def fields(self, fields: Iterable[BaseFormNode]) -> None:
+        fields = list(fields)
+        # Checked first, so the fields are left unchanged on error
+        names = set()
+        for field in fields:
+            if field.name in names:
+                raise ValueError(f"Field name '{field.name}' already exists in the form")
+            names.add(field.name)
+        for field in self._fields:
+            field._detach(self)
+        list.clear(self._fields)
+        self._field_index = {}
+        self._touch()
+        for field in fields:
+            self.add_field(field)
 
     def add_field(self, field: BaseFormNode) -> None:
         """Adds a field to the form.
+        A field belongs to a single form, so a copy of a field of another form is added instead.
 
         Args:
             field: The field to add.
+
+        Raises:
+            ValueError: If the field name is already used.
         """
-        self.fields.append(field)
+        self.insert_field(len(self._fields), field)
+
+    def insert_field(self, index: int, field: BaseFormNode) -> None:
+        """Inserts a field into the form at the given position.
+        A field belongs to a single form, so a copy of a field of another form is inserted instead.
+
+        Args:
+            index: The position to insert the field at.
+            field: The field to insert.
+
+        Raises:
+            ValueError: If the field name is already used.
+        """
+        if field.name in self._field_index:
+            raise ValueError(f"Field name '{field.name}' already exists in the form")
+        if field.__dict__.get("_form") is not None:
+            field = copy.deepcopy(field)
+        field._attach(self)
+        list.insert(self._fields, index, field)
+        self._field_index[field.name] = field
+        self._touch()
+
+    def move_field(self, index: int, new_index: int) -> None:
+        """Moves a field to another position.
+
+        Args:
+            index: The current position of the field.
+            new_index: The new position of the field.
+
+        Raises:
+            IndexError: If either position is out of range.
+        """
+        if not (0 <= index < len(self._fields) and 0 <= new_index < len(self._fields)):
+            raise IndexError("Field index out of range")
+        list.insert(self._fields, new_index, list.pop(self._fields, index))
+        self._touch()
 
     def remove_field(self, name: str) -> None:
         """Removes a field from the form by name.
@@ -64,7 +263,24 @@ class Form:
         Args:
             name: The name of the field to remove.
         """
-        self.fields = [f for f in self.fields if f.name != name]
+        field = self._field_index.pop(name, None)
+        if field is not None:
+            list.remove(self._fields, field)
+            field._detach(self)
+            self._touch()
+
+    def rename_field(self, name: str, new_name: str) -> None:
+        """Renames a field. Equivalent to assigning the `name` attribute of the field.
+
+        Args:
+            name: The current name of the field.
+            new_name: The new name of the field.
+
+        Raises:
+            KeyError: If no field has the given name.
+            ValueError: If the new name is already used by another field.
+        """
+        self._field_index[name].name = new_name
 
     def get_field(self, name: str) -> Optional[BaseFormNode]:
         """Gets a field by name.
@@ -75,31 +291,141 @@ class Form:
         Returns:
             The field if found, None otherwise.
         """
-        for field in self.fields:
-            if field.name == name:
-                return field
-        return None
+        return self._field_index.get(name)
+
+    def has_field(self, name: str) -> bool:
+        """Checks whether a field name is used in the form.
+
+        Args:
+            name: The name to check.
+
+        Returns:
+            True if a field has the given name, False otherwise.
+        """
+        return name in self._field_index
+
+    def _on_field_renamed(self, field: BaseFormNode, new_name: str) -> None:
+        # Called by the field before its name changes
+        if new_name == field.name:
+            return
+        if new_name in self._field_index:
+            raise ValueError(f"Field name '{new_name}' already exists in the form")
+        del self._field_index[field.name]
+        self._field_index[new_name] = field
+
+    def _on_field_changed(self, field: BaseFormNode, key: str) -> None:
+        # Called by the field after an attribute of its definition changed
+        self._touch()
+
+    def freeze(self) -> FormSchema:
+        """Gets the immutable schema of the form, which can be shared by concurrent sessions.
+        The schema is only rebuilt if the form has changed since the last call.
 
-    def validate(self) -> bool:
+        Returns:
+            The FormSchema of the form.
+        """
+        return self._cached("frozen", lambda: FormSchema.from_form(self))
+
+    def new_state(self) -> FormState:
+        """Creates a new per-session state holding the default values of the form.
+
+        Returns:
+            A new FormState instance.
+        """
+        return self.freeze().new_state()
+
+    def compile(self) -> Tuple[Validator, ...]:
+        """Gets the compiled validators of the fields that hold values, in field order.
+        Each field caches its validator until one of its constraints changes, so this is cheap to call.
+
+        Returns:
+            Tuple of validator closures.
+        """
+        return tuple(f.compile() for f in self.fields if isinstance(f, BaseFormField))
+
+    def validate(self, state: Optional[FormState] = None) -> bool:
         """Validates the form data for completeness and correctness.
 
+        Args:
+            state: Optional session state to validate. If not provided, validates the field values.
+
         Returns:
             True if all fields are valid, False otherwise.
         """
+        if state is not None:
+            return state.validate()
+
+        okay = ValidationResultType.okay
         for field in self.fields:
             if isinstance(field, BaseFormField):
-                value = field.get_value()
-                if field.required and value is None:
-                    return False
-                if value is not None and not field.is_validated(value):
+                if field.compile()(field.get_value()) is not okay:
                     return False
         return True
 
-    def dump_data(self, allow_invalid: bool = False) -> dict:
+    def validate_and_dump(self, state: Optional[FormState] = None) -> ValidationReport:
+        """Validates the form data and collects it in a single pass.
+        Unlike `validate`, every field is checked, so all errors are reported at once.
+
+        Args:
+            state: Optional session state to validate. If not provided, validates the field values.
+
+        Returns:
+            A ValidationReport with the data and the validation result of every field.
+        """
+        if state is not None:
+            return state.validate_and_dump()
+
+        fields = [f for f in self.fields if isinstance(f, BaseFormField)]
+        return validate_and_dump(fields, [f.get_value() for f in fields])
+
+    def validate_batch(
+        self,
+        records: Optional[Iterable[Mapping[str, Any]]] = None,
+        columns: Optional[Mapping[str, Sequence[Any]]] = None,
+    ) -> BatchValidationResult:
+        """Validates many submissions at once, without loading them into the form.
+        Bounds and lengths are checked with vectorized operations when NumPy is installed.
+
+        Args:
+            records: Iterable of dictionaries mapping field names to values.
+            columns: Dictionary mapping field names to sequences of values. Use instead of records.
+
+        Returns:
+            A BatchValidationResult with the result of every field for every record.
+
+        Raises:
+            ValueError: If not exactly one of records and columns is given, or the columns differ in length.
+        """
+        fields = [f for f in self.fields if isinstance(f, BaseFormField)]
+        return validate_batch(fields, records, columns)
+
+    def validate_batch_parallel(
+        self,
+        records: Iterable[Mapping[str, Any]],
+        chunk_size: int = 10000,
+        max_workers: Optional[int] = None,
+    ) -> BatchValidationResult:
+        """Validates many submissions at once on a pool of worker processes.
+        Suits large jobs dominated by regex matching, which cannot run in parallel in threads.
+
+        Args:
+            records: Iterable of dictionaries mapping field names to values.
+            chunk_size: Number of records sent to a worker at a time.
+            max_workers: Number of worker processes. If None, uses the number of processors.
+
+        Returns:
+            A BatchValidationResult with the result of every field for every record, in input order.
+        """
+        names = tuple(f.name for f in self.fields if isinstance(f, BaseFormField))
+        schema_bin = self.dump_schema_bin(compression_flag=0, schema_version=2)
+        return concat_batch_results(names, iter_validate_batch_parallel(schema_bin, records, chunk_size, max_workers))
+
+    def dump_data(self, allow_invalid: bool = False, state: Optional[FormState] = None) -> dict:
         """Returns the JSON representation of form data.
 
         Args:
             allow_invalid: If False, raises ValueError if validation fails.
+            state: Optional session state to dump. If not provided, dumps the field values.
 
         Returns:
             Dictionary containing form data.
@@ -107,21 +433,63 @@ class Form:
         Raises:
             ValueError: If validation fails and allow_invalid is False.
         """
-        if not allow_invalid and not self.validate():
-            raise ValueError("Form validation failed")
+        if state is not None:
+            return state.dump_data(allow_invalid)
 
-        data = {}
-        for field in self.fields:
-            if isinstance(field, BaseFormField):
-                data[field.name] = field.get_value()
-        return data
+        if allow_invalid:
+            return {f.name: f.get_value() for f in self.fields if isinstance(f, BaseFormField)}
+
+        report = self.validate_and_dump()
+        if not report.is_valid:
+            raise ValueError(f"Form validation failed: {', '.join(report.errors)}")
+        return report.data
+
+    def dump_data_bin(self, allow_invalid: bool = False, state: Optional[FormState] = None) -> bytes:
+        """Returns the compact binary representation of form data.
+
+        Values are stored by field position, so the data is much smaller than the JSON representation,
+        and can only be loaded by a form with the same schema fingerprint.
+
+        Args:
+            allow_invalid: If False, raises ValueError if validation fails.
+            state: Optional session state to dump. If not provided, dumps the field values.
+
+        Returns:
+            Binary data with the encoding of `DataCodec`.
+
+        Raises:
+            ValueError: If validation fails and allow_invalid is False, or a value cannot be encoded.
+        """
+        if state is not None:
+            return state.dump_data_bin(allow_invalid)
+
+        if allow_invalid:
+            values = [f.get_value() for f in self.fields if isinstance(f, BaseFormField)]
+        else:
+            report = self.validate_and_dump()
+            if not report.is_valid:
+                raise ValueError(f"Form validation failed: {', '.join(report.errors)}")
+            values = list(report.data.values())
+        return self._data_codec().encode(values)
+
+    def _data_codec(self) -> DataCodec:
+        return self._cached(
+            "data_codec",
+            lambda: DataCodec([f for f in self.fields if isinstance(f, BaseFormField)], self.fingerprint),
+        )
 
     def dump_schema(self) -> dict:
         """Returns the JSON representation of the form schema.
+        The representation is cached until the form changes.
 
         Returns:
             Dictionary containing form schema.
         """
+        schema = self._cached("schema", self._build_schema)
+        # Hands out a copy, so that changes made by the caller cannot corrupt the cache
+        return {**schema, "fields": [dict(f) for f in schema["fields"]]}
+
+    def _build_schema(self) -> dict:
         schema = {
             "uuid": self.uuid,
             "title": self.title,
@@ -142,11 +510,20 @@ class Form:
 
         return schema
 
-    def dump_schema_bin(self, compression_flag: Literal[0, 1] = 1) -> bytes:
+    def _dump_schema_json(self) -> bytes:
+        return self._cached(
+            "json",
+            lambda: json.dumps(self._cached("schema", self._build_schema), separators=(",", ":")).encode("utf-8"),
+        )
+
+    def dump_schema_bin(self, compression_flag: CompressionFlag = 1, schema_version: Literal[1, 2] = 1) -> bytes:
         """Returns binary representation of the form schema.
+        The representation is cached until the form changes.
 
         Args:
-            compression_flag: Compression type (0 = no compression, 1 = gzip compression).
+            compression_flag: Compression type (0 = no compression, 1 = gzip, 2 = deflate with preset
+                dictionary, 3 = lzma), or "auto" to pick the one giving the smallest output.
+            schema_version: Body format (1 = JSON, 2 = compact binary encoding with a string table).
 
         Returns:
             Binary representation with the following encoding:
@@ -154,35 +531,51 @@ class Form:
             - 0x04: Schema version number
             - 0x05: Compression flag
             - 0x06~0x07: Reserved (0x00)
-            - 0x08~: UTF-8 encoded JSON schema, compressed if flag is 1
+            - 0x08~: UTF-8 encoded JSON schema (version 1) or compact binary schema (version 2),
+              compressed according to the flag
+
+        Raises:
+            ValueError: If the compression flag or the schema version is invalid.
         """
-        schema = self.dump_schema()
-        json_str = json.dumps(schema, separators=(",", ":"))
-        json_bytes = json_str.encode("utf-8")
+        return self._cached(
+            ("bin", compression_flag, schema_version),
+            lambda: self._build_schema_bin(compression_flag, schema_version),
+        )
 
-        # Apply compression if requested
-        if compression_flag == 1:
-            json_bytes = gzip.compress(json_bytes)
+    def _build_schema_bin(self, compression_flag: CompressionFlag, schema_version: int) -> bytes:
+        if schema_version == 1:
+            body = self._dump_schema_json()
+        elif schema_version == 2:
+            body = encode_schema(self._cached("schema", self._build_schema))
+        else:
+            raise ValueError(f"Invalid schema version: {schema_version}")
+
+        # Apply compression, resolving "auto" to the actual flag
+        compression_flag, body = compress(body, compression_flag)
 
         # Build binary format
         magic = b"UGFS"  # 0x00~0x03
-        version = bytes([self._SCHEMA_VERSION])  # 0x04
+        version = bytes([schema_version])  # 0x04
         compression = bytes([compression_flag])  # 0x05
         reserved = b"\x00\x00"  # 0x06~0x07
 
-        return magic + version + compression + reserved + json_bytes
+        return magic + version + compression + reserved + body
 
-    def dump_schema_b64(self, compression_flag: Literal[0, 1] = 1) -> str:
+    def dump_schema_b64(self, compression_flag: CompressionFlag = 1, schema_version: Literal[1, 2] = 1) -> str:
         """Returns Base64-encoded binary representation of the form schema.
+        The representation is cached until the form changes.
 
         Args:
-            compression_flag: Compression type (0 = no compression, 1 = gzip compression).
+            compression_flag: Compression type, as for `dump_schema_bin`.
+            schema_version: Body format, as for `dump_schema_bin`.
 
         Returns:
             Base64-encoded string of the binary schema.
         """
-        binary_data = self.dump_schema_bin(compression_flag)
-        return base64.b64encode(binary_data).decode("ascii")
+        return self._cached(
+            ("b64", compression_flag, schema_version),
+            lambda: base64.b64encode(self.dump_schema_bin(compression_flag, schema_version)).decode("ascii"),
+        )
 
     @classmethod
     def load_schema(cls, schema: dict) -> "Form":
@@ -194,91 +587,143 @@ class Form:
         Returns:
             A new Form instance.
         """
-        form = cls(
-            title=schema["title"],
-            description=schema.get("description"),
-            form_uuid=schema.get("uuid"),
-            locale=schema.get("locale"),
-            show_reset_button=schema.get("show_reset_button", True),
-            show_submit_button=schema.get("show_submit_button", True),
-        )
-
-        field_map = {
-            "TextField": TextField,
-            "FloatField": FloatField,
-            "IntegerField": IntegerField,
-            "BooleanField": BooleanField,
-        }
-
+        fields = []
         for field_data in schema.get("fields", []):
-            field_type = field_data.pop("type")
-            if field_type in field_map:
-                field_class = field_map[field_type]
-                field = field_class(**field_data)
-                form.add_field(field)
+            field_class = FIELD_TYPES.get(field_data["type"])
+            if field_class is not None:
+                # Leave the given schema untouched, it may be shared or cached by the caller
+                fields.append(field_class(**{k: v for k, v in field_data.items() if k != "type"}))
 
-        return form
+        return cls._from_schema(schema, fields)
 
     @classmethod
-    def load_schema_bin(cls, schema_bin: bytes) -> "Form":
+    def _from_schema(cls, attributes: Mapping[str, Any], fields: List[BaseFormNode]) -> "Form":
+        return cls(
+            title=attributes["title"],
+            description=attributes.get("description"),
+            fields=fields,
+            form_uuid=attributes.get("uuid"),
+            locale=attributes.get("locale"),
+            show_reset_button=attributes.get("show_reset_button", True),
+            show_submit_button=attributes.get("show_submit_button", True),
+        )
+
+    @classmethod
+    def load_schema_bin(
+        cls,
+        schema_bin: Union[bytes, bytearray, memoryview, BinaryIO],
+        cache: Optional["SchemaCache"] = None,
+        limits: Optional[SchemaLimits] = None,
+    ) -> "Form":
         """Loads form definition from binary data.
 
+        The body is decompressed incrementally and checked against the limits as early as possible, so
+        untrusted payloads cannot exhaust memory. Bytes-like data is read without copying the body.
+
         Args:
-            schema_bin: Binary data with the schema encoding.
+            schema_bin: Binary data with the schema encoding, or a binary file-like object to read it from.
+            cache: Optional cache of parsed schemas, used for bytes-like data. On a hit, the form is copied
+                from the cached schema. Loads through the cache apply the limits of the cache.
+            limits: Limits on the decompressed size, number of fields and length of strings. If None,
+                uses the default `SchemaLimits`.
 
         Returns:
             A new Form instance.
 
         Raises:
+            SchemaLimitError: If the schema exceeds a limit.
             ValueError: If the binary data format is invalid.
         """
+        if isinstance(schema_bin, (bytes, bytearray, memoryview)):
+            if cache is not None:
+                return cache.load_form(schema_bin)
+            view = memoryview(schema_bin)
+            header = view[:8]
+            chunks: Iterable[Any] = (view[8:],)
+        else:
+            header = schema_bin.read(8)
+            chunks = iter(lambda: schema_bin.read(cls._READ_CHUNK_SIZE), b"")
+        limits = limits or DEFAULT_SCHEMA_LIMITS
+
         # Validate minimum length
-        if len(schema_bin) < 8:
+        if len(header) < 8:
             raise ValueError("Invalid binary schema: too short")
 
         # Validate magic number
-        if schema_bin[0:4] != b"UGFS":
+        if header[0:4] != b"UGFS":
             raise ValueError("Invalid binary schema: magic number mismatch")
 
         # Extract metadata
-        version = schema_bin[4]
-        compression_flag = schema_bin[5]
-        # reserved = schema_bin[6:8]  # Not used currently
-
-        # Extract and decompress JSON data
-        json_bytes = schema_bin[8:]
+        version = header[4]
+        compression_flag = header[5]
+        # reserved = header[6:8]  # Not used currently
+        if version not in cls._SCHEMA_VERSIONS:
+            raise ValueError(f"Invalid binary schema: unsupported version {version}")
 
-        if compression_flag == 1:
-            json_bytes = gzip.decompress(json_bytes)
-        elif compression_flag != 0:
-            raise ValueError(f"Invalid compression flag: {compression_flag}")
+        # Extract and decompress the body
+        body = decompress(chunks, compression_flag, limits.max_bytes)
 
-        # Parse JSON
-        json_str = json_bytes.decode("utf-8")
-        schema = json.loads(json_str)
-
-        return cls.load_schema(schema)
+        if version == 1:
+            schema = json.loads(body)
+            limits.check_schema(schema)
+            return cls.load_schema(schema)
+        return cls._from_schema(*decode_schema(memoryview(body), limits))
 
     @classmethod
-    def load_schema_b64(cls, schema_b64: str) -> "Form":
+    def load_schema_b64(
+        cls, schema_b64: str, cache: Optional["SchemaCache"] = None, limits: Optional[SchemaLimits] = None
+    ) -> "Form":
         """Loads form definition from Base64-encoded string.
 
         Args:
             schema_b64: Base64-encoded binary schema string.
+            cache: Optional cache of parsed schemas. On a hit, the form is copied from the cached schema.
+                Loads through the cache apply the limits of the cache.
+            limits: Limits applied as for `load_schema_bin`.
 
         Returns:
             A new Form instance.
+
+        Raises:
+            SchemaLimitError: If the schema exceeds a limit.
+            ValueError: If the data format is invalid.
         """
+        if cache is not None:
+            return cache.load_form(schema_b64)
+
         binary_data = base64.b64decode(schema_b64.encode("ascii"))
-        return cls.load_schema_bin(binary_data)
+        return cls.load_schema_bin(binary_data, limits=limits)
 
-    def load_data(self, data: dict) -> None:
+    def load_data(self, data: dict, state: Optional[FormState] = None) -> None:
         """Loads form data from dictionary.
 
         Args:
             data: Dictionary containing field values.
+            state: Optional session state to load into. If not provided, loads into the field values.
         """
+        if state is not None:
+            state.load_data(data)
+            return
+
         for field in self.fields:
             if isinstance(field, BaseFormField):
                 if field.name in data:
                     field.set_value(data[field.name])
+
+    def load_data_bin(self, data: Union[bytes, bytearray, memoryview], state: Optional[FormState] = None) -> None:
+        """Loads form data from binary data returned by `dump_data_bin`.
+
+        Args:
+            data: The binary data.
+            state: Optional session state to load into. If not provided, loads into the field values.
+
+        Raises:
+            ValueError: If the data is malformed or belongs to another schema.
+        """
+        if state is not None:
+            state.load_data_bin(data)
+            return
+
+        fields = [f for f in self.fields if isinstance(f, BaseFormField)]
+        for field, value in zip(fields, self._data_codec().decode(data)):
+            field.set_value(value)
@@ -0,0 +1,74 @@
+"""Limits applied while loading untrusted binary schemas."""
+
+from typing import Any, NamedTuple, Optional
+
+
+class SchemaLimitError(ValueError):
+    """Raised when a schema being loaded exceeds one of its `SchemaLimits`."""
+
+
+class SchemaLimits(NamedTuple):
+    """Upper bounds applied while loading a binary schema, checked as early as possible.
+
+    A bound of None disables the check.
+    """
+
+    max_bytes: Optional[int] = 16 * 1024 * 1024
+    """Maximum size of the decompressed schema body, in bytes."""
+    max_fields: Optional[int] = 10000
+    """Maximum number of fields."""
+    max_string_length: Optional[int] = 65536
+    """Maximum length of any string (keys, labels, regex...), in UTF-8 bytes for binary bodies and in
+    characters for JSON bodies."""
+
+    def check_fields(self, count: int) -> None:
+        """Checks the number of fields.
+
+        Args:
+            count: The number of fields.
+
+        Raises:
+            SchemaLimitError: If the number exceeds `max_fields`.
+        """
+        if self.max_fields is not None and count > self.max_fields:
+            raise SchemaLimitError(f"Schema exceeds the limit of {self.max_fields} fields")
+
+    def check_string_length(self, length: int) -> None:
+        """Checks the length of a string.
+
+        Args:
+            length: The length of the string.
+
+        Raises:
+            SchemaLimitError: If the length exceeds `max_string_length`.
+        """
+        if self.max_string_length is not None and length > self.max_string_length:
+            raise SchemaLimitError(f"Schema exceeds the limit of {self.max_string_length} characters per string")
+
+    def check_schema(self, schema: Any) -> None:
+        """Checks the fields and strings of a decoded JSON schema.
+
+        Args:
+            schema: Dictionary containing form schema.
+
+        Raises:
+            SchemaLimitError: If the schema exceeds a limit.
+        """
+        fields = schema.get("fields") if isinstance(schema, dict) else None
+        if isinstance(fields, list):
+            self.check_fields(len(fields))
+        if self.max_string_length is not None:
+            stack = [schema]
+            while stack:
+                value = stack.pop()
+                if isinstance(value, str):
+                    self.check_string_length(len(value))
+                elif isinstance(value, dict):
+                    stack.extend(value)
+                    stack.extend(value.values())
+                elif isinstance(value, list):
+                    stack.extend(value)
+
+
+DEFAULT_SCHEMA_LIMITS = SchemaLimits()
+NO_SCHEMA_LIMITS = SchemaLimits(None, None, None)
@@ -0,0 +1,366 @@
+"""Immutable form schemas and lightweight per-session form states."""
+
+import copy
+import threading
+import weakref
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+from .encoding import DataCodec
+from .fields import BaseFormField, ValidationResultType, Validator
+
+if TYPE_CHECKING:
+    from .form import Form
+
+
+class ValidationReport(NamedTuple):
+    """Form data together with the validation result of every field."""
+
+    data: Dict[str, Any]
+    results: Dict[str, ValidationResultType]
+    is_valid: bool
+
+    @property
+    def errors(self) -> Dict[str, ValidationResultType]:
+        """The validation results of the invalid fields only."""
+        return {name: result for name, result in self.results.items() if result is not ValidationResultType.okay}
+
+
+def validate_and_dump(fields: Iterable[BaseFormField], values: Iterable[Any]) -> ValidationReport:
+    """Validates the values of the given fields and collects them in a single pass.
+
+    Args:
+        fields: The fields holding values.
+        values: The values of the fields, in the same order.
+
+    Returns:
+        A ValidationReport with the data and the result of every field.
+    """
+    okay = ValidationResultType.okay
+    data = {}
+    results = {}
+    is_valid = True
+    for field, value in zip(fields, values):
+        result = field.compile()(value)
+        if result is not okay:
+            is_valid = False
+        data[field.name] = value
+        results[field.name] = result
+    return ValidationReport(data, results, is_valid)
+
+
+class FormSchema:
+    """Immutable and hashable snapshot of a form's structure.
+
+    A schema holds no runtime values, so one instance can safely back any number of concurrent
+    sessions. Values live in `FormState` objects created by `new_state`.
+    """
+
+    __slots__ = (
+        "uuid",
+        "title",
+        "description",
+        "locale",
+        "show_reset_button",
+        "show_submit_button",
+        "fields",
+        "fingerprint",
+        "_index",
+        "_data_codec",
+        "__weakref__",
+    )
+
+    _registry: "weakref.WeakValueDictionary[str, FormSchema]" = weakref.WeakValueDictionary()
+    _registry_lock = threading.Lock()
+
+    uuid: str
+    title: str
+    description: Optional[str]
+    locale: Optional[str]
+    show_reset_button: bool
+    show_submit_button: bool
+    fields: Tuple[BaseFormField, ...]
+    fingerprint: str
+    _index: Mapping[str, int]
+    _data_codec: Optional[DataCodec]
+
+    def __init__(self, form: "Form"):
+        """Initializes the schema from a snapshot of the given form.
+
+        Prefer `FormSchema.from_form` (or `Form.freeze`), which reuses the schema already built for an
+        unchanged form.
+
+        Args:
+            form: The form to take the snapshot of.
+        """
+        fields = []
+        for field in form.fields:
+            if isinstance(field, BaseFormField):
+                field = copy.deepcopy(field)
+                field.current_value = field.default_value
+                field.freeze()
+                fields.append(field)
+
+        setattr_ = object.__setattr__
+        setattr_(self, "uuid", form.uuid)
+        setattr_(self, "title", form.title)
+        setattr_(self, "description", form.description)
+        setattr_(self, "locale", form.locale)
+        setattr_(self, "show_reset_button", form.show_reset_button)
+        setattr_(self, "show_submit_button", form.show_submit_button)
+        setattr_(self, "fields", tuple(fields))
+        setattr_(self, "fingerprint", form.fingerprint)
+        setattr_(self, "_index", MappingProxyType({f.name: i for i, f in enumerate(fields)}))
+        setattr_(self, "_data_codec", None)
+
+    @classmethod
+    def from_form(cls, form: "Form") -> "FormSchema":
+        """Gets the schema of the given form, building it only if the form has changed.
+
+        Schemas are interned per form UUID for as long as they are referenced, so all sessions of
+        an unchanged form share one schema instance.
+
+        Args:
+            form: The form to get the schema of.
+
+        Returns:
+            The schema of the form.
+        """
+        with cls._registry_lock:
+            schema = cls._registry.get(form.uuid)
+            if schema is None or schema.fingerprint != form.fingerprint:
+                schema = cls(form)
+                cls._registry[form.uuid] = schema
+            return schema
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError(f"Cannot modify '{key}' of immutable form schema")
+
+    def __delattr__(self, key: str) -> None:
+        raise AttributeError(f"Cannot delete '{key}' of immutable form schema")
+
+    def __hash__(self) -> int:
+        return hash((self.uuid, self.fingerprint))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FormSchema):
+            return NotImplemented
+        return self.uuid == other.uuid and self.fingerprint == other.fingerprint
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def __repr__(self) -> str:
+        return f"FormSchema(uuid={self.uuid!r}, title={self.title!r}, fields={len(self.fields)})"
+
+    @property
+    def validators(self) -> Tuple[Validator, ...]:
+        """The compiled validators of the fields, in field order. Each is compiled on first use only."""
+        return tuple(f.compile() for f in self.fields)
+
+    @property
+    def data_codec(self) -> DataCodec:
+        """The codec of the binary submission data of this schema. It is built on first use only.
+
+        Raises:
+            ValueError: If a field type is not supported by the binary data encoding.
+        """
+        if self._data_codec is None:
+            object.__setattr__(self, "_data_codec", DataCodec(self.fields, self.fingerprint))
+        return self._data_codec
+
+    def index_of(self, name: str) -> int:
+        """Gets the position of a field by name.
+
+        Args:
+            name: The name of the field.
+
+        Returns:
+            The position of the field.
+
+        Raises:
+            KeyError: If no field has the given name.
+        """
+        return self._index[name]
+
+    def get_field(self, name: str) -> Optional[BaseFormField]:
+        """Gets a field by name.
+
+        Args:
+            name: The name of the field to get.
+
+        Returns:
+            The field if found, None otherwise.
+        """
+        index = self._index.get(name)
+        return None if index is None else self.fields[index]
+
+    def to_form(self) -> "Form":
+        """Creates an editable form with a copy of this schema.
+
+        Returns:
+            A new Form instance.
+        """
+        from .form import Form
+
+        return Form(
+            title=self.title,
+            description=self.description,
+            fields=[copy.copy(f) for f in self.fields],
+            form_uuid=self.uuid,
+            locale=self.locale,
+            show_reset_button=self.show_reset_button,
+            show_submit_button=self.show_submit_button,
+        )
+
+    def new_state(self) -> "FormState":
+        """Creates a new session state holding the default values of this schema.
+
+        Returns:
+            A new FormState instance.
+        """
+        return FormState(self)
+
+
+class FormState:
+    """Per-session values of a form, stored by field position of a shared `FormSchema`."""
+
+    __slots__ = ("schema", "values")
+
+    def __init__(self, schema: FormSchema, values: Optional[List[Any]] = None):
+        """Initializes the form state.
+
+        Args:
+            schema: The schema the values belong to.
+            values: Optional list of values in field order. If not provided, uses the default values.
+        """
+        if values is None:
+            values = [f.default_value for f in schema.fields]
+        elif len(values) != len(schema.fields):
+            raise ValueError(f"Expected {len(schema.fields)} values, got {len(values)}")
+        self.schema = schema
+        self.values = values
+
+    def __repr__(self) -> str:
+        return f"FormState(schema={self.schema!r})"
+
+    def get_value(self, name: str) -> Any:
+        """Gets the current value of a field by name.
+
+        Args:
+            name: The name of the field.
+
+        Returns:
+            The current value of the field.
+
+        Raises:
+            KeyError: If no field has the given name.
+        """
+        return self.values[self.schema.index_of(name)]
+
+    def set_value(self, name: str, value: Any) -> None:
+        """Sets the current value of a field by name.
+        No validation will be performed here.
+
+        Args:
+            name: The name of the field.
+            value: The value to set.
+
+        Raises:
+            KeyError: If no field has the given name.
+        """
+        self.values[self.schema.index_of(name)] = value
+
+    def reset(self) -> None:
+        """Resets all values to the default values of the schema."""
+        self.values = [f.default_value for f in self.schema.fields]
+
+    def copy(self) -> "FormState":
+        """Creates a shallow copy of this state sharing the same schema.
+
+        Returns:
+            A new FormState instance.
+        """
+        return FormState(self.schema, list(self.values))
+
+    def validate(self) -> bool:
+        """Validates the values for completeness and correctness.
+
+        Returns:
+            True if all values are valid, False otherwise.
+        """
+        okay = ValidationResultType.okay
+        for validator, value in zip(self.schema.validators, self.values):
+            if validator(value) is not okay:
+                return False
+        return True
+
+    def validate_and_dump(self) -> ValidationReport:
+        """Validates all values and collects them in a single pass.
+
+        Returns:
+            A ValidationReport with the data and the result of every field.
+        """
+        return validate_and_dump(self.schema.fields, self.values)
+
+    def dump_data(self, allow_invalid: bool = False) -> dict:
+        """Returns the JSON representation of the values.
+
+        Args:
+            allow_invalid: If False, raises ValueError if validation fails.
+
+        Returns:
+            Dictionary containing form data.
+
+        Raises:
+            ValueError: If validation fails and allow_invalid is False.
+        """
+        if allow_invalid:
+            return {field.name: value for field, value in zip(self.schema.fields, self.values)}
+
+        report = self.validate_and_dump()
+        if not report.is_valid:
+            raise ValueError(f"Form validation failed: {', '.join(report.errors)}")
+        return report.data
+
+    def dump_data_bin(self, allow_invalid: bool = False) -> bytes:
+        """Returns the compact binary representation of the values, see `DataCodec`.
+
+        Args:
+            allow_invalid: If False, raises ValueError if validation fails.
+
+        Returns:
+            Binary data tied to the fingerprint of the schema.
+
+        Raises:
+            ValueError: If validation fails and allow_invalid is False, or a value cannot be encoded.
+        """
+        if not allow_invalid:
+            report = self.validate_and_dump()
+            if not report.is_valid:
+                raise ValueError(f"Form validation failed: {', '.join(report.errors)}")
+        return self.schema.data_codec.encode(self.values)
+
+    def load_data_bin(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """Loads all values from binary data returned by `dump_data_bin`.
+
+        Args:
+            data: The binary data.
+
+        Raises:
+            ValueError: If the data is malformed or belongs to another schema.
+        """
+        self.values = self.schema.data_codec.decode(data)
+
+    def load_data(self, data: Dict[str, Any]) -> None:
+        """Loads values from dictionary. Unknown keys are ignored.
+
+        Args:
+            data: Dictionary containing field values.
+        """
+        index = self.schema._index
+        values = self.values
+        for name, value in data.items():
+            i = index.get(name)
+            if i is not None:
+                values[i] = value
@@ -0,0 +1,23 @@
+"""Persistence and processing of form submissions."""
+
+from .export import Record, export_columnar, export_csv, export_jsonl, iter_columnar, record_data
+from .results import RecordsSource, ResultsPage, ResultsSource, StoreSource
+from .stats import FieldSummary, FormStats
+from .store import Submission, SubmissionStore
+
+__all__ = [
+    "FieldSummary",
+    "FormStats",
+    "Record",
+    "RecordsSource",
+    "ResultsPage",
+    "ResultsSource",
+    "StoreSource",
+    "Submission",
+    "SubmissionStore",
+    "export_columnar",
+    "export_csv",
+    "export_jsonl",
+    "iter_columnar",
+    "record_data",
+]
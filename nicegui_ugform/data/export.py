@@ -0,0 +1,309 @@
+"""Streaming export of form submissions to CSV, JSON Lines and columnar files."""
+
+import csv
+import json
+import struct
+import sys
+from array import array
+from itertools import islice
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Literal, Mapping, Optional, TextIO, Tuple, Union
+
+from ..core.fields import BaseFormField, BooleanField, FloatField, IntegerField, TextField
+from ..core.form import Form
+from ..core.schema import FormSchema
+from .store import Submission
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:  # pragma: no cover - PyArrow is optional
+    pa = None
+
+Record = Union[Mapping[str, Any], Submission]
+
+_COLUMNAR_MAGIC = b"UGFC"
+_COLUMNAR_VERSION = 1
+_U32 = struct.Struct("<I")
+
+
+def record_data(record: Record) -> Mapping[str, Any]:
+    """Gets the field values of a record.
+
+    Args:
+        record: A dictionary mapping field names to values, or a stored submission.
+
+    Returns:
+        The dictionary mapping field names to values.
+    """
+    return record.data if isinstance(record, Submission) else record
+
+
+def column_type(field: BaseFormField) -> str:
+    """Gets the type of the column holding the values of a field.
+
+    Args:
+        field: The field.
+
+    Returns:
+        One of "string", "integer", "float" and "boolean".
+
+    Raises:
+        ValueError: If the field type is not supported.
+    """
+    if isinstance(field, TextField):
+        return "string"
+    if isinstance(field, IntegerField):
+        return "integer"
+    if isinstance(field, FloatField):
+        return "float"
+    if isinstance(field, BooleanField):
+        return "boolean"
+    raise ValueError(f"Unsupported field type for columns: {type(field).__name__}")
+
+
+def export_csv(
+    form: Union[Form, FormSchema],
+    records: Iterable[Record],
+    file: TextIO,
+    header: Literal["name", "label"] = "name",
+) -> int:
+    """Writes records as CSV, one column per field in schema order.
+
+    Header cells are typed, as `<name or label>:<column type>` (e.g. `age:integer`). Missing values
+    are written as empty cells and booleans as `true`/`false`.
+
+    Args:
+        form: The form or schema defining the columns.
+        records: Iterable of dictionaries mapping field names to values, or of stored submissions.
+        file: Text file to write to, opened with `newline=""`.
+        header: Whether header cells start with the field names or with the field labels.
+
+    Returns:
+        The number of records written.
+    """
+    fields = _fields_of(form)
+    names = [f.name for f in fields]
+    writer = csv.writer(file)
+    writer.writerow(f"{f.name if header == 'name' else f.label}:{column_type(f)}" for f in fields)
+
+    count = 0
+    for data in map(record_data, records):
+        writer.writerow([_csv_cell(data.get(name)) for name in names])
+        count += 1
+    return count
+
+
+def export_jsonl(form: Union[Form, FormSchema], records: Iterable[Record], file: TextIO) -> int:
+    """Writes records as JSON Lines, with the keys of every line in schema order.
+
+    Args:
+        form: The form or schema defining the keys.
+        records: Iterable of dictionaries mapping field names to values, or of stored submissions.
+        file: Text file to write to.
+
+    Returns:
+        The number of records written.
+    """
+    names = [f.name for f in _fields_of(form)]
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    count = 0
+    for data in map(record_data, records):
+        file.write(encoder.encode({name: data.get(name) for name in names}))
+        file.write("\n")
+        count += 1
+    return count
+
+
+def export_columnar(
+    form: Union[Form, FormSchema],
+    records: Iterable[Record],
+    file: BinaryIO,
+    batch_size: int = 65536,
+    arrow: Optional[bool] = None,
+) -> int:
+    """Writes records as batches of typed columns, holding at most one batch in memory.
+
+    With PyArrow, the output is an Arrow IPC stream. Otherwise, it is the simple columnar format read
+    by `iter_columnar`:
+    - 0x00~0x03: Magic number 'UGFC' (User Generated Form Columns)
+    - 0x04: Format version number
+    - 0x05~0x07: Reserved (0x00)
+    - 0x08~0x0B: Length of the header, then the UTF-8 encoded JSON header with the column names and types
+    - Batches, each as a row count (u32) followed by every column: a null bitmap (least significant bit
+      first), then int64 or float64 values, a boolean bitmap, or u32 string offsets and UTF-8 data
+    - A row count of 0 ends the stream
+    All integers are little-endian.
+
+    Args:
+        form: The form or schema defining the columns.
+        records: Iterable of dictionaries mapping field names to values, or of stored submissions.
+        file: Binary file to write to.
+        batch_size: Maximum number of records per batch.
+        arrow: Whether to write an Arrow IPC stream. If None, does so when PyArrow is installed.
+
+    Returns:
+        The number of records written.
+
+    Raises:
+        ValueError: If batch_size is not positive, arrow is True but PyArrow is not installed, or a value
+            does not match the type of its column.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    if arrow is None:
+        arrow = pa is not None
+    elif arrow and pa is None:
+        raise ValueError("Arrow output requires PyArrow to be installed")
+
+    fields = _fields_of(form)
+    columns = [(f.name, column_type(f)) for f in fields]
+    batches = _iter_batches(columns, map(record_data, records), batch_size)
+    if arrow:
+        return _write_arrow(columns, batches, file)
+
+    header = json.dumps({"columns": [{"name": name, "type": type_} for name, type_ in columns]}).encode("utf-8")
+    file.write(_COLUMNAR_MAGIC + bytes([_COLUMNAR_VERSION]) + b"\x00\x00\x00" + _U32.pack(len(header)) + header)
+    count = 0
+    for size, values in batches:
+        file.write(_U32.pack(size))
+        for (_, type_), column in zip(columns, values):
+            file.write(_encode_column(type_, column))
+        count += size
+    file.write(_U32.pack(0))
+    return count
+
+
+def iter_columnar(file: BinaryIO) -> Iterator[Dict[str, List[Any]]]:
+    """Reads the batches of a file written by `export_columnar` in the simple columnar format.
+
+    Args:
+        file: Binary file to read from.
+
+    Yields:
+        Dictionary mapping column names to lists of values, with None for missing values, per batch.
+
+    Raises:
+        ValueError: If the file format is invalid.
+    """
+    prefix = _read_exact(file, 12)
+    if prefix[0:4] != _COLUMNAR_MAGIC:
+        raise ValueError("Invalid columnar file: magic number mismatch")
+    if prefix[4] != _COLUMNAR_VERSION:
+        raise ValueError(f"Invalid columnar file: unsupported version {prefix[4]}")
+    header = json.loads(_read_exact(file, _U32.unpack_from(prefix, 8)[0]))
+    columns = [(c["name"], c["type"]) for c in header["columns"]]
+
+    while True:
+        (size,) = _U32.unpack(_read_exact(file, 4))
+        if size == 0:
+            return
+        yield {name: _decode_column(type_, file, size) for name, type_ in columns}
+
+
+def _fields_of(form: Union[Form, FormSchema]) -> List[BaseFormField]:
+    return [f for f in form.fields if isinstance(f, BaseFormField)]
+
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if value is True or value is False:
+        return "true" if value else "false"
+    return value
+
+
+def _iter_batches(
+    columns: List[Tuple[str, str]], records: Iterator[Mapping[str, Any]], batch_size: int
+) -> Iterator[Tuple[int, List[List[Any]]]]:
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        yield len(batch), [[data.get(name) for data in batch] for name, _ in columns]
+
+
+def _write_arrow(columns: List[Tuple[str, str]], batches: Iterable[Tuple[int, List[List[Any]]]], file: BinaryIO) -> int:
+    arrow_types = {"string": pa.string(), "integer": pa.int64(), "float": pa.float64(), "boolean": pa.bool_()}
+    schema = pa.schema([(name, arrow_types[type_]) for name, type_ in columns])
+    count = 0
+    with pa.ipc.new_stream(file, schema) as writer:
+        for size, values in batches:
+            try:
+                writer.write_batch(pa.record_batch(values, schema=schema))
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError) as e:
+                raise ValueError(f"Cannot export values as typed columns: {e}") from None
+            count += size
+    return count
+
+
+def _bitmap(flags: Iterable[bool], size: int) -> bytes:
+    bits = 0
+    for i, flag in enumerate(flags):
+        if flag:
+            bits |= 1 << i
+    return bits.to_bytes((size + 7) // 8, "little")
+
+
+def _encode_column(type_: str, column: List[Any]) -> bytes:
+    size = len(column)
+    parts = [_bitmap((value is None for value in column), size)]
+    try:
+        if type_ == "boolean":
+            if any(value is not None and not isinstance(value, bool) for value in column):
+                raise TypeError("expected bool")
+            parts.append(_bitmap(column, size))
+        elif type_ == "string":
+            encoded = [b"" if value is None else value.encode("utf-8") for value in column]
+            offsets = array("I", [0])
+            for value in encoded:
+                offsets.append(offsets[-1] + len(value))
+            parts.append(_little_endian(offsets))
+            parts.extend(encoded)
+        else:
+            typecode, python_types = ("q", (int,)) if type_ == "integer" else ("d", (int, float))
+            if any(
+                value is not None and (not isinstance(value, python_types) or value is True or value is False)
+                for value in column
+            ):
+                raise TypeError(f"expected {type_}")
+            parts.append(_little_endian(array(typecode, [0 if value is None else value for value in column])))
+    except (TypeError, AttributeError, OverflowError) as e:
+        raise ValueError(f"Cannot export values as typed {type_} column: {e}") from None
+    return b"".join(parts)
+
+
+def _decode_column(type_: str, file: BinaryIO, size: int) -> List[Any]:
+    nulls = int.from_bytes(_read_exact(file, (size + 7) // 8), "little")
+    if type_ == "boolean":
+        bits = int.from_bytes(_read_exact(file, (size + 7) // 8), "little")
+        values: List[Any] = [bool(bits >> i & 1) for i in range(size)]
+    elif type_ == "string":
+        offsets = _from_little_endian("I", _read_exact(file, 4 * (size + 1)))
+        data = _read_exact(file, offsets[-1])
+        values = [data[offsets[i] : offsets[i + 1]].decode("utf-8") for i in range(size)]
+    elif type_ in ("integer", "float"):
+        values = _from_little_endian("q" if type_ == "integer" else "d", _read_exact(file, 8 * size)).tolist()
+    else:
+        raise ValueError(f"Invalid columnar file: unknown column type {type_}")
+    return [None if nulls >> i & 1 else value for i, value in enumerate(values)]
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode: str, data: bytes) -> array:
+    values = array(typecode, data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _read_exact(file: BinaryIO, size: int) -> bytes:
+    data = file.read(size)
+    if len(data) != size:
+        raise ValueError("Invalid columnar file: truncated")
+    return data
@@ -0,0 +1,171 @@
+"""Paged, sorted and filtered access to form submissions."""
+
+import heapq
+from abc import ABC, abstractmethod
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from .store import SubmissionStore
+
+Row = Tuple[int, Mapping[str, Any]]
+
+
+class ResultsPage(NamedTuple):
+    """A page of submissions."""
+
+    rows: List[Row]
+    """Pairs of a key (e.g. the sequence number) and the data of each submission on the page."""
+    total: int
+    """Number of submissions matching the search, on all pages."""
+
+
+class ResultsSource(ABC):
+    """Source of submissions fetched page by page, e.g. by `FormResults`.
+
+    Implementations only need to hold the requested page in memory, however many submissions match.
+    """
+
+    @abstractmethod
+    def fetch(
+        self,
+        offset: int,
+        limit: int,
+        sort_by: Optional[str] = None,
+        descending: bool = False,
+        search: Optional[str] = None,
+    ) -> ResultsPage:
+        """Fetches a page of submissions.
+
+        Args:
+            offset: Number of matching submissions to skip.
+            limit: Maximum number of submissions on the page.
+            sort_by: Name of the field to sort by. If None, keeps the order of the source.
+            descending: Whether to sort in descending order. Missing values always come last.
+            search: If given, only includes submissions with a value containing this text, ignoring case.
+
+        Returns:
+            The ResultsPage.
+        """
+
+
+class RecordsSource(ResultsSource):
+    """Source of submissions held in a sequence, keyed by their index."""
+
+    def __init__(self, records: Sequence[Mapping[str, Any]]):
+        """Initializes the source.
+
+        Args:
+            records: Sequence of dictionaries mapping field names to values. Appended records are
+                included in the next fetches.
+        """
+        self.records = records
+
+    def fetch(
+        self,
+        offset: int,
+        limit: int,
+        sort_by: Optional[str] = None,
+        descending: bool = False,
+        search: Optional[str] = None,
+    ) -> ResultsPage:
+        if sort_by is None and not search:
+            count = len(self.records)
+            return ResultsPage([(i, self.records[i]) for i in _page_range(count, offset, limit, descending)], count)
+        return _select(enumerate(self.records), offset, limit, sort_by, descending, search)
+
+
+class StoreSource(ResultsSource):
+    """Source of the submissions of a `SubmissionStore`, keyed by their sequence numbers.
+
+    Without sort and search, pages are read by random access. Otherwise, the submissions are scanned,
+    keeping only the best `offset + limit` of them.
+    """
+
+    def __init__(self, store: SubmissionStore):
+        """Initializes the source.
+
+        Args:
+            store: The store to read from. New submissions are included in the next fetches.
+        """
+        self.store = store
+
+    def fetch(
+        self,
+        offset: int,
+        limit: int,
+        sort_by: Optional[str] = None,
+        descending: bool = False,
+        search: Optional[str] = None,
+    ) -> ResultsPage:
+        if sort_by is None and not search:
+            count = len(self.store)
+            submissions = map(self.store.get, _page_range(count, offset, limit, descending))
+            return ResultsPage([(s.sequence, s.data) for s in submissions], count)
+        rows = ((s.sequence, s.data) for s in self.store.scan())
+        return _select(rows, offset, limit, sort_by, descending, search)
+
+
+def _select(
+    rows: Iterator[Row],
+    offset: int,
+    limit: int,
+    sort_by: Optional[str],
+    descending: bool,
+    search: Optional[str],
+) -> ResultsPage:
+    if search:
+        rows = filter(_matches(search), rows)
+    total = 0
+
+    def counted() -> Iterator[Row]:
+        nonlocal total
+        for row in rows:
+            total += 1
+            yield row
+
+    if sort_by is None:
+        if descending:
+            # The last matches, in reverse order
+            page = list(reversed(deque(counted(), maxlen=offset + limit)))[offset:]
+        else:
+            page = list(islice(counted(), offset, offset + limit))
+            total += sum(1 for _ in rows)
+        return ResultsPage(page, total)
+
+    # Missing values sort last in both directions
+    missing = (-1,) if descending else (2,)
+    select = heapq.nlargest if descending else heapq.nsmallest
+    page = select(offset + limit, counted(), key=lambda row: _sort_key(row[1].get(sort_by), missing))[offset:]
+    return ResultsPage(page, total)
+
+
+def _page_range(count: int, offset: int, limit: int, descending: bool) -> range:
+    if descending:
+        return range(count - 1 - offset, max(count - 1 - offset - limit, -1), -1)
+    return range(offset, min(offset + limit, count))
+
+
+def _sort_key(value: Any, missing: Tuple[int]) -> Tuple[Any, ...]:
+    if value is None:
+        return missing
+    if isinstance(value, (int, float)):
+        return (0, 0, value)
+    if isinstance(value, str):
+        return (0, 1, value.casefold())
+    return (1, type(value).__name__, repr(value))
+
+
+def _matches(search: str) -> Callable[[Row], bool]:
+    needle = search.casefold()
+
+    def predicate(row: Row) -> bool:
+        return any(value is not None and needle in _text_of(value).casefold() for value in row[1].values())
+
+    return predicate
+
+
+def _text_of(value: Any) -> str:
+    if value is True or value is False:
+        return "true" if value else "false"
+    return str(value)
@@ -0,0 +1,282 @@
+"""Incremental per-field statistics of form submissions."""
+
+import math
+from array import array
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+from ..core.fields import BaseFormField
+from ..core.form import Form
+from ..core.schema import FormSchema
+from .export import Record, column_type, record_data
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+
+class FieldSummary(NamedTuple):
+    """Aggregates of the values of a field.
+
+    For text fields, `min`, `max` and `mean` describe the lengths of the values. For boolean fields,
+    `mean` is the ratio of true values and `min`/`max` are None.
+    """
+
+    name: str
+    type: str
+    """Column type of the field, as returned by `column_type`."""
+    count: int
+    """Number of values of the expected type."""
+    null_count: int
+    """Number of missing values."""
+    invalid_count: int
+    """Number of values of another type, which are left out of the aggregates."""
+    min: Optional[float]
+    max: Optional[float]
+    mean: Optional[float]
+    true_count: Optional[int]
+    """Number of true values of a boolean field, None for other fields."""
+
+
+class _FieldAggregate:
+    __slots__ = ("name", "type", "count", "null_count", "invalid_count", "total", "min", "max", "values")
+
+    def __init__(self, name: str, type_: str):
+        self.name = name
+        self.type = type_
+        self.count = self.null_count = self.invalid_count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        # Numbers, or lengths of texts, kept for quantiles and histograms. Booleans only need the total.
+        self.values = array("d")
+
+
+class FormStats:
+    """Per-field statistics of submissions, updated incrementally.
+
+    Counts, minimums, maximums and means are maintained on every update. Numbers (and lengths of texts)
+    are also appended to typed column arrays, from which quantiles and histograms are computed on demand,
+    with NumPy when it is available. New submissions are added with `update` without rescanning the
+    previous ones.
+    """
+
+    def __init__(self, form: Union[Form, FormSchema], batch_size: int = 65536):
+        """Initializes empty statistics for the fields of a form.
+
+        Args:
+            form: The form or schema defining the fields. Later changes of a form are not followed.
+            batch_size: Number of records converted to columns at once by `update`.
+
+        Raises:
+            ValueError: If batch_size is not positive or a field type is not supported.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self.batch_size = batch_size
+        self.size = 0
+        self._fields: Dict[str, _FieldAggregate] = {}
+        for field in form.fields:
+            if isinstance(field, BaseFormField):
+                self._fields[field.name] = _FieldAggregate(field.name, column_type(field))
+
+    def update(self, records: Iterable[Record]) -> None:
+        """Adds records to the statistics.
+
+        Args:
+            records: Iterable of dictionaries mapping field names to values, or of stored submissions.
+        """
+        iterator = map(record_data, records)
+        while True:
+            batch = list(islice(iterator, self.batch_size))
+            if not batch:
+                return
+            self.update_columns({name: [data.get(name) for data in batch] for name in self._fields})
+
+    def update_columns(self, columns: Mapping[str, Sequence[Any]]) -> None:
+        """Adds records given as columns to the statistics, e.g. batches of `iter_columnar`.
+
+        Args:
+            columns: Dictionary mapping field names to sequences of values, all of the same length.
+                Missing columns count as missing values.
+
+        Raises:
+            ValueError: If the columns differ in length.
+        """
+        sizes = {len(column) for column in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError("All columns must have the same length")
+        size = sizes.pop() if sizes else 0
+
+        for name, aggregate in self._fields.items():
+            column = columns.get(name)
+            if column is None:
+                aggregate.null_count += size
+                continue
+            _update_aggregate(aggregate, column)
+        self.size += size
+
+    def summary(self, name: str) -> FieldSummary:
+        """Gets the aggregates of a field.
+
+        Args:
+            name: The name of the field.
+
+        Returns:
+            The FieldSummary of the field.
+
+        Raises:
+            KeyError: If no field has the given name.
+        """
+        a = self._fields[name]
+        mean = a.total / a.count if a.count else None
+        if a.type == "boolean":
+            return FieldSummary(name, a.type, a.count, a.null_count, a.invalid_count, None, None, mean, int(a.total))
+        low, high = a.min, a.max
+        if a.type != "float" and a.count:
+            # Integers and lengths of texts
+            low, high = int(low), int(high)
+        return FieldSummary(name, a.type, a.count, a.null_count, a.invalid_count, low, high, mean, None)
+
+    def summaries(self) -> Dict[str, FieldSummary]:
+        """Gets the aggregates of all fields.
+
+        Returns:
+            Dictionary mapping field names to FieldSummary, in field order.
+        """
+        return {name: self.summary(name) for name in self._fields}
+
+    def quantiles(self, name: str, q: Sequence[float] = (0.25, 0.5, 0.75)) -> List[Optional[float]]:
+        """Computes quantiles of the numbers, or of the lengths of texts, of a field.
+
+        Quantiles are linearly interpolated between the closest values, as by `numpy.quantile`.
+
+        Args:
+            name: The name of the field.
+            q: The quantiles to compute, between 0 and 1.
+
+        Returns:
+            The quantiles in the order of q, or None for each if there is no value.
+
+        Raises:
+            KeyError: If no field has the given name.
+            ValueError: If the field is a boolean field or a quantile is out of range.
+        """
+        values = self._values_of(name)
+        if any(not 0 <= p <= 1 for p in q):
+            raise ValueError("Quantiles must be between 0 and 1")
+        if not values:
+            return [None] * len(q)
+        if np is not None:
+            return np.quantile(np.frombuffer(values, dtype=np.float64), q).tolist()
+
+        ordered = sorted(values)
+        result = []
+        for p in q:
+            position = p * (len(ordered) - 1)
+            low = math.floor(position)
+            high = min(low + 1, len(ordered) - 1)
+            result.append(ordered[low] + (ordered[high] - ordered[low]) * (position - low))
+        return result
+
+    def histogram(
+        self, name: str, bins: int = 10, bounds: Optional[Tuple[float, float]] = None
+    ) -> Tuple[List[int], List[float]]:
+        """Computes a histogram of the numbers, or of the lengths of texts, of a field.
+
+        Bins are equally wide and include their left edge, the last one also its right edge, as by
+        `numpy.histogram`.
+
+        Args:
+            name: The name of the field.
+            bins: Number of bins.
+            bounds: Lower and upper edges of the bins. If None, uses the minimum and maximum values.
+
+        Returns:
+            Tuple of the counts per bin and the bins+1 edges.
+
+        Raises:
+            KeyError: If no field has the given name.
+            ValueError: If the field is a boolean field or bins is not positive.
+        """
+        values = self._values_of(name)
+        if bins <= 0:
+            raise ValueError("bins must be positive")
+        if bounds is None:
+            a = self._fields[name]
+            low, high = (a.min, a.max) if a.count else (0.0, 1.0)
+        else:
+            low, high = bounds
+        if low == high:
+            low, high = low - 0.5, high + 0.5
+
+        if np is not None:
+            counts, edges = np.histogram(np.frombuffer(values, dtype=np.float64), bins=bins, range=(low, high))
+            return counts.tolist(), edges.tolist()
+
+        width = (high - low) / bins
+        counts = [0] * bins
+        for value in values:
+            if low <= value <= high:
+                counts[min(int((value - low) / width), bins - 1)] += 1
+        return counts, [low + width * i for i in range(bins)] + [high]
+
+    def _values_of(self, name: str) -> array:
+        aggregate = self._fields[name]
+        if aggregate.type == "boolean":
+            raise ValueError(f"Field '{name}' has no numbers to compute a distribution of")
+        return aggregate.values
+
+
+def _update_aggregate(aggregate: _FieldAggregate, column: Sequence[Any]) -> None:
+    type_ = aggregate.type
+    if (
+        np is not None
+        and isinstance(column, np.ndarray)
+        and column.dtype.kind in ("b" if type_ == "boolean" else "iuf")
+    ):
+        # Typed columns, e.g. of NumPy batches, are aggregated without going through Python objects
+        if type_ == "boolean":
+            aggregate.count += len(column)
+            aggregate.total += int(np.count_nonzero(column))
+            return
+        if type_ != "string":
+            numbers = column.astype(np.float64)
+            valid = numbers[~np.isnan(numbers)]
+            aggregate.null_count += len(numbers) - len(valid)
+            _add_numbers(aggregate, valid, len(valid))
+            return
+
+    if type_ == "boolean":
+        values = [value for value in column if value is True or value is False]
+        aggregate.total += values.count(True)
+    elif type_ == "string":
+        values = [len(value) for value in column if isinstance(value, str)]
+    else:
+        allowed = (int,) if type_ == "integer" else (int, float)
+        values = [value for value in column if isinstance(value, allowed) and not isinstance(value, bool)]
+
+    nulls = sum(value is None for value in column)
+    aggregate.null_count += nulls
+    aggregate.invalid_count += len(column) - nulls - len(values)
+    if type_ == "boolean":
+        aggregate.count += len(values)
+    else:
+        _add_numbers(aggregate, values, len(values))
+
+
+def _add_numbers(aggregate: _FieldAggregate, values: Any, count: int) -> None:
+    if not count:
+        return
+    if np is not None:
+        numbers = np.asarray(values, dtype=np.float64)
+        low, high, total = float(numbers.min()), float(numbers.max()), float(numbers.sum())
+        aggregate.values.frombytes(numbers.tobytes())
+    else:
+        low, high, total = float(min(values)), float(max(values)), math.fsum(values)
+        aggregate.values.extend(values)
+    aggregate.count += count
+    aggregate.total += total
+    aggregate.min = low if aggregate.min is None else min(aggregate.min, low)
+    aggregate.max = high if aggregate.max is None else max(aggregate.max, high)
@@ -0,0 +1,402 @@
+"""Append-only local store of form submissions."""
+
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+from ..core.encoding import DataCodec
+from ..core.fields import BaseFormField
+from ..core.form import Form
+from ..core.limits import NO_SCHEMA_LIMITS
+from ..core.schema import FormState
+
+# Frame of a submission in a segment: row length, CRC-32 of the row and timestamp, followed by the row
+_FRAME = struct.Struct("<IId")
+# Entry of a submission in the sidecar index of a segment: frame offset and timestamp
+_INDEX_ENTRY = struct.Struct("<Qd")
+
+_SEGMENT_SUFFIX = ".seg"
+_INDEX_SUFFIX = ".idx"
+_SCHEMA_SUFFIX = ".ugfs"
+
+Filter = Union[Mapping[str, Any], Callable[[Dict[str, Any]], bool]]
+
+
+class Submission(NamedTuple):
+    """A stored submission."""
+
+    sequence: int
+    """Position of the submission in the store, starting from 0."""
+    timestamp: float
+    """Time of the submission, in seconds since the epoch."""
+    data: Dict[str, Any]
+    """Dictionary mapping field names to values, as returned by `Form.dump_data`."""
+
+
+class SubmissionStore:
+    """Append-only store of the submissions of one form, in a local directory.
+
+    Submissions are encoded with `dump_data_bin` and appended to segment files, each with a sidecar
+    index of fixed-size entries for random access by sequence number. Segments are rotated once they
+    reach `segment_size`, and read back through `mmap`. Writes are buffered and synced to disk every
+    `sync_every` submissions or `sync_interval` seconds, whichever comes first, so a crash loses at
+    most the submissions since the last sync. Incomplete trailing writes are discarded when reopening.
+
+    The schema of every stored submission is kept next to the segments, so submissions made before
+    a change of the form keep loading with the fields they were made with.
+
+    Layout of the directory `<root>/<form uuid>`:
+    - `<first sequence number>.seg`: Frames of `<row length u32><row CRC-32 u32><timestamp f64><row>`
+    - `<first sequence number>.idx`: Entries of `<frame offset u64><timestamp f64>`
+    - `schemas/<fingerprint prefix>.ugfs`: Binary schemas, as returned by `Form.dump_schema_bin`
+    """
+
+    def __init__(
+        self,
+        root: Union[str, "os.PathLike[str]"],
+        form_uuid: str,
+        segment_size: int = 64 * 1024 * 1024,
+        sync_every: int = 1000,
+        sync_interval: float = 1.0,
+    ):
+        """Opens the store of a form, creating it if needed.
+
+        Args:
+            root: Directory holding the stores of all forms.
+            form_uuid: The UUID of the form.
+            segment_size: Size in bytes after which the current segment is closed and a new one started.
+            sync_every: Maximum number of submissions appended between two syncs to disk.
+            sync_interval: Maximum number of seconds between two syncs to disk, checked on append.
+
+        Raises:
+            ValueError: If segment_size or sync_every is not positive.
+        """
+        if segment_size <= 0:
+            raise ValueError("segment_size must be positive")
+        if sync_every <= 0:
+            raise ValueError("sync_every must be positive")
+
+        self.form_uuid = form_uuid
+        self.path = Path(root) / form_uuid
+        self.segment_size = segment_size
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self._schema_path = self.path / "schemas"
+        self._schema_path.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._codecs: Dict[bytes, DataCodec] = {}
+        self._sealed_maps: Dict[int, Tuple[mmap.mmap, mmap.mmap]] = {}
+        self._segments: List[int] = sorted(int(p.stem) for p in self.path.glob(f"*{_SEGMENT_SUFFIX}"))
+        if not self._segments:
+            self._segments.append(0)
+        self._count = self._segments[-1] + self._recover(self._segments[-1])
+        self._data_file: Optional[BinaryIO] = None
+        self._index_file: Optional[BinaryIO] = None
+        self._open_segment(self._segments[-1])
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def __enter__(self) -> "SubmissionStore":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, source: Union[Form, FormState], timestamp: Optional[float] = None) -> int:
+        """Validates and appends a submission.
+
+        Args:
+            source: The form or the session state holding the submitted values.
+            timestamp: Time of the submission, in seconds since the epoch. If None, uses the current time.
+
+        Returns:
+            The sequence number of the submission.
+
+        Raises:
+            ValueError: If the form does not belong to this store, or its values are invalid.
+        """
+        if isinstance(source, FormState):
+            uuid, fingerprint = source.schema.uuid, source.schema.fingerprint
+        else:
+            uuid, fingerprint = source.uuid, source.fingerprint
+        if uuid != self.form_uuid:
+            raise ValueError(f"Form '{uuid}' does not belong to the store of form '{self.form_uuid}'")
+
+        row = source.dump_data_bin()
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            if self._data_file is None or self._index_file is None:
+                raise ValueError("Submission store is closed")
+            if row[5:13] not in self._codecs:
+                self._register_schema(source, fingerprint)
+
+            offset = self._data_file.tell()
+            self._data_file.write(_FRAME.pack(len(row), zlib.crc32(row), timestamp))
+            self._data_file.write(row)
+            self._index_file.write(_INDEX_ENTRY.pack(offset, timestamp))
+            sequence = self._count
+            self._count += 1
+
+            self._unsynced += 1
+            if self._unsynced >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_interval:
+                self.sync()
+            if offset + _FRAME.size + len(row) >= self.segment_size:
+                self._rotate()
+        return sequence
+
+    def sync(self) -> None:
+        """Writes the buffered submissions and syncs them to disk."""
+        with self._lock:
+            if self._data_file is None or self._index_file is None:
+                return
+            # Data is made durable before the index entries pointing to it
+            self._data_file.flush()
+            os.fsync(self._data_file.fileno())
+            self._index_file.flush()
+            os.fsync(self._index_file.fileno())
+            self._unsynced = 0
+            self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Syncs and closes the store. It can no longer be appended to or read afterwards."""
+        with self._lock:
+            self.sync()
+            for file in (self._data_file, self._index_file):
+                if file is not None:
+                    file.close()
+            self._data_file = self._index_file = None
+            for data_map, index_map in self._sealed_maps.values():
+                data_map.close()
+                index_map.close()
+            self._sealed_maps.clear()
+
+    def get(self, sequence: int) -> Submission:
+        """Gets a submission by sequence number.
+
+        Args:
+            sequence: The sequence number of the submission.
+
+        Returns:
+            The submission.
+
+        Raises:
+            IndexError: If no submission has the given sequence number.
+        """
+        with self._lock:
+            if not 0 <= sequence < self._count:
+                raise IndexError(f"Submission {sequence} does not exist")
+            self.flush()
+            base = self._segments[bisect_right(self._segments, sequence) - 1]
+            maps = self._map_segment(base)
+        try:
+            offset, timestamp = _INDEX_ENTRY.unpack_from(maps[1], (sequence - base) * _INDEX_ENTRY.size)
+            return Submission(sequence, timestamp, self._decode(maps[0], offset))
+        finally:
+            if base not in self._sealed_maps:
+                maps[0].close()
+                maps[1].close()
+
+    def scan(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        where: Optional[Filter] = None,
+        start: int = 0,
+    ) -> Iterator[Submission]:
+        """Iterates over the stored submissions in sequence order.
+
+        Submissions appended during the iteration are not included. Timestamps are checked on the index
+        alone, so submissions outside of the time range are not decoded.
+
+        Args:
+            since: If given, skips submissions made before this time.
+            until: If given, skips submissions made at or after this time.
+            where: If given, only yields submissions whose data matches. Either a dictionary of values
+                that the fields must be equal to, or a predicate taking the data.
+            start: Sequence number to start from.
+
+        Yields:
+            The matching submissions.
+        """
+        predicate = where if where is None or callable(where) else _fields_equal(where)
+        with self._lock:
+            self.flush()
+            segments = list(self._segments)
+            count = self._count
+
+        first = max(bisect_right(segments, start) - 1, 0)
+        for i in range(first, len(segments)):
+            base = segments[i]
+            end = segments[i + 1] if i + 1 < len(segments) else count
+            if end <= start:
+                continue
+            with self._lock:
+                maps = self._map_segment(base)
+            sequence = max(start, base)
+            index = memoryview(maps[1])[(sequence - base) * _INDEX_ENTRY.size : (end - base) * _INDEX_ENTRY.size]
+            try:
+                for offset, timestamp in _INDEX_ENTRY.iter_unpack(index):
+                    if (since is None or timestamp >= since) and (until is None or timestamp < until):
+                        data = self._decode(maps[0], offset)
+                        if predicate is None or predicate(data):
+                            yield Submission(sequence, timestamp, data)
+                    sequence += 1
+            finally:
+                index.release()
+                if base not in self._sealed_maps:
+                    maps[0].close()
+                    maps[1].close()
+
+    def flush(self) -> None:
+        """Writes the buffered submissions to the operating system, without syncing them to disk."""
+        with self._lock:
+            if self._data_file is not None and self._index_file is not None:
+                self._data_file.flush()
+                self._index_file.flush()
+
+    def _segment_paths(self, base: int) -> Tuple[Path, Path]:
+        name = f"{base:020d}"
+        return self.path / (name + _SEGMENT_SUFFIX), self.path / (name + _INDEX_SUFFIX)
+
+    def _open_segment(self, base: int) -> None:
+        data_path, index_path = self._segment_paths(base)
+        self._data_file = open(data_path, "ab")
+        self._index_file = open(index_path, "ab")
+
+    def _rotate(self) -> None:
+        self.sync()
+        assert self._data_file is not None and self._index_file is not None
+        self._data_file.close()
+        self._index_file.close()
+        self._segments.append(self._count)
+        self._open_segment(self._count)
+
+    def _recover(self, base: int) -> int:
+        """Discards incomplete trailing writes of a segment and completes its index.
+
+        Returns:
+            The number of submissions in the segment.
+        """
+        data_path, index_path = self._segment_paths(base)
+        data_path.touch()
+        index_path.touch()
+        data = _map_file(data_path)
+        index = _map_file(index_path)
+        try:
+            size = os.path.getsize(data_path)
+            count = os.path.getsize(index_path) // _INDEX_ENTRY.size
+
+            # Drops the entries pointing past the complete frames, then indexes the frames written after them
+            end = 0
+            while count:
+                offset = _INDEX_ENTRY.unpack_from(index, (count - 1) * _INDEX_ENTRY.size)[0]
+                frame_end = _frame_end(data, size, offset)
+                if frame_end is not None:
+                    end = frame_end
+                    break
+                count -= 1
+            entries = []
+            while True:
+                frame_end = _frame_end(data, size, end)
+                if frame_end is None:
+                    break
+                entries.append(_INDEX_ENTRY.pack(end, _FRAME.unpack_from(data, end)[2]))
+                end = frame_end
+        finally:
+            data.close()
+            index.close()
+
+        with open(data_path, "r+b") as file:
+            file.truncate(end)
+        with open(index_path, "r+b") as file:
+            file.truncate(count * _INDEX_ENTRY.size)
+            file.seek(0, os.SEEK_END)
+            file.write(b"".join(entries))
+        return count + len(entries)
+
+    def _map_segment(self, base: int) -> Tuple[mmap.mmap, mmap.mmap]:
+        maps = self._sealed_maps.get(base)
+        if maps is not None:
+            return maps
+        data_path, index_path = self._segment_paths(base)
+        maps = (_map_file(data_path), _map_file(index_path))
+        if base != self._segments[-1]:
+            # Sealed segments never change, their maps are kept until the store is closed
+            self._sealed_maps[base] = maps
+        return maps
+
+    def _register_schema(self, source: Union[Form, FormState], fingerprint: str) -> None:
+        form = source.schema.to_form() if isinstance(source, FormState) else source
+        path = self._schema_path / (fingerprint[:16] + _SCHEMA_SUFFIX)
+        if not path.exists():
+            temp_path = path.with_suffix(".tmp")
+            with open(temp_path, "wb") as file:
+                file.write(form.dump_schema_bin(schema_version=2))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, path)
+        self._codecs[bytes.fromhex(fingerprint[:16])] = _new_codec(form, fingerprint[:16])
+
+    def _decode(self, data_map: mmap.mmap, offset: int) -> Dict[str, Any]:
+        length = _FRAME.unpack_from(data_map, offset)[0]
+        start = offset + _FRAME.size
+        row = data_map[start : start + length]
+        codec = self._codecs.get(row[5:13])
+        if codec is None:
+            codec = self._load_codec(row[5:13])
+        return dict(zip(codec.names, codec.decode(row)))
+
+    def _load_codec(self, prefix: bytes) -> DataCodec:
+        with self._lock:
+            codec = self._codecs.get(prefix)
+            if codec is None:
+                path = self._schema_path / (prefix.hex() + _SCHEMA_SUFFIX)
+                if not path.exists():
+                    raise ValueError(f"Unknown schema of stored submission: {prefix.hex()}")
+                with open(path, "rb") as file:
+                    form = Form.load_schema_bin(file, limits=NO_SCHEMA_LIMITS)
+                codec = _new_codec(form, prefix.hex())
+                self._codecs[prefix] = codec
+            return codec
+
+
+def _map_file(path: Path) -> mmap.mmap:
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            return mmap.mmap(-1, 1)
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _fields_equal(expected: Mapping[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    expected = dict(expected)
+
+    def predicate(data: Dict[str, Any]) -> bool:
+        return all(data.get(name) == value for name, value in expected.items())
+
+    return predicate
+
+
+def _new_codec(form: Form, fingerprint: str) -> DataCodec:
+    return DataCodec([f for f in form.fields if isinstance(f, BaseFormField)], fingerprint)
+
+
+def _frame_end(data: mmap.mmap, size: int, offset: int) -> Optional[int]:
+    """Gets the end of the frame at the given offset, or None if the frame is incomplete or corrupted."""
+    if offset + _FRAME.size > size:
+        return None
+    length, crc, _ = _FRAME.unpack_from(data, offset)
+    end = offset + _FRAME.size + length
+    if end > size or zlib.crc32(data[offset + _FRAME.size : end]) != crc:
+        return None
+    return end
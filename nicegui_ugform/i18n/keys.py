@@ -52,6 +52,7 @@ class TranslationMap(NamedTuple):
     tooShortTemplate: str
     tooLongTemplate: str
     regexPatternMismatch: str
+    duplicateFieldName: str
     tooSmallTemplate: str
     tooLargeTemplate: str
 
@@ -65,3 +66,27 @@ class TranslationMap(NamedTuple):
     formReset: str
     fieldRequiredTemplate: str
     fieldInvalidValueTemplate: str
+
+    # Results texts
+    searchResults: str
+    noResults: str
+
+    # Pagination texts
+    previousPage: str
+    nextPage: str
+    pageTemplate: str
+
+    # Grid texts
+    minimum: str
+    maximum: str
+    deleteSelected: str
+    duplicateSelected: str
+    toggleRequired: str
+    minGreaterThanMax: str
+
+    # Search texts
+    searchFields: str
+
+    # History texts
+    undo: str
+    redo: str
@@ -40,6 +40,7 @@ TRANSLATIONS = TranslationMap(
     tooShortTemplate="Input too short (min length is {0})",
     tooLongTemplate="Input too long (max length is {0})",
     regexPatternMismatch="Does not match the required pattern",
+    duplicateFieldName="Field name already exists",
     tooSmallTemplate="Value too small (min value is {0})",
     tooLargeTemplate="Value too large (max value is {0})",
     newFieldTemplate="New {0} Field",
@@ -49,4 +50,18 @@ TRANSLATIONS = TranslationMap(
     formReset="Form reset",
     fieldRequiredTemplate="{0}: This field is required",
     fieldInvalidValueTemplate="{0}: Invalid value",
+    searchResults="Search",
+    noResults="No submissions",
+    previousPage="Previous",
+    nextPage="Next",
+    pageTemplate="Page {0} of {1}",
+    minimum="Min",
+    maximum="Max",
+    deleteSelected="Delete Selected",
+    duplicateSelected="Duplicate Selected",
+    toggleRequired="Toggle Required",
+    minGreaterThanMax="Minimum must not be greater than maximum",
+    searchFields="Search fields",
+    undo="Undo",
+    redo="Redo",
 )
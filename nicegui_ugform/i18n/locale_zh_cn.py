@@ -40,6 +40,7 @@ TRANSLATIONS = TranslationMap(
     tooShortTemplate="内容太短（至少需要 {0} 字符）",
     tooLongTemplate="内容太长（最多接受 {0} 字符）",
     regexPatternMismatch="不符合所需的模式",
+    duplicateFieldName="字段名已存在",
     tooSmallTemplate="值太小（不应低于 {0}）",
     tooLargeTemplate="值太大（不应高于 {0}）",
     newFieldTemplate="新建{0}字段",
@@ -49,4 +50,18 @@ TRANSLATIONS = TranslationMap(
     formReset="表单已重置",
     fieldRequiredTemplate="{0}：此字段为必填项",
     fieldInvalidValueTemplate="{0}：无效的值",
+    searchResults="搜索",
+    noResults="暂无提交",
+    previousPage="上一页",
+    nextPage="下一页",
+    pageTemplate="第 {0} 页，共 {1} 页",
+    minimum="最小",
+    maximum="最大",
+    deleteSelected="删除所选",
+    duplicateSelected="复制所选",
+    toggleRequired="切换必填",
+    minGreaterThanMax="最小值不能大于最大值",
+    searchFields="搜索字段",
+    undo="撤销",
+    redo="重做",
 )
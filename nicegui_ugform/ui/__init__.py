@@ -2,8 +2,10 @@
 
 from .form_display import FormDisplay
 from .form_editor import FormEditor
+from .form_results import FormResults
 
 __all__ = [
     "FormDisplay",
     "FormEditor",
+    "FormResults",
 ]
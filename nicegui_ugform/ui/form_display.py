@@ -1,9 +1,10 @@
 """Form display component for rendering and submitting forms."""
 
+import asyncio
 import inspect
-from typing import Any, Awaitable, Callable, Optional, Tuple, Union
+from typing import Any, Awaitable, Callable, Dict, Literal, Mapping, Optional, Tuple, Union
 
-from nicegui import ui
+from nicegui import background_tasks, ui
 
 from ..core.fields import (
     BaseFormField,
@@ -14,7 +15,13 @@ from ..core.fields import (
     ValidationResultType,
 )
 from ..core.form import Form
+from ..core.schema import FormSchema, FormState
 from ..i18n.helper import I18nHelper
+from .rules import compile_rules
+
+ValidationTrigger = Union[Literal["change", "blur", "submit"], int]
+"""When an input is validated while the user edits it: on every change, when it loses focus, only on
+submit, or a number of milliseconds after the last change."""
 
 
 class FormDisplay:
@@ -22,24 +29,92 @@ class FormDisplay:
 
     def __init__(
         self,
-        form: Form,
+        form: Union[Form, FormSchema],
         on_submit: Optional[Union[Callable[[], None], Callable[[], Awaitable[None]]]] = None,
         locale: Optional[str] = None,
+        state: Optional[FormState] = None,
+        client_validation: bool = True,
+        validation_trigger: ValidationTrigger = "change",
+        field_triggers: Optional[Mapping[str, ValidationTrigger]] = None,
+        render_mode: Literal["eager", "lazy", "paged"] = "eager",
+        page_size: int = 20,
+        update_form: bool = False,
     ):
         """Initializes the form display.
 
+        The values entered by the user are kept in a per-session `FormState`, so one form or schema
+        can safely back any number of concurrent displays.
+
         Args:
-            form: The form to display.
+            form: The form or the immutable form schema to display.
             on_submit: Optional callback (sync or async) when form is submitted.
             locale: The locale code (e.g., 'en', 'zh_cn'). If None, uses form.locale or auto-detects from system.
+            state: Optional session state to display. If not provided, creates one with the current values of
+                the form, or with the default values of a schema.
+            client_validation: Whether inputs are validated by the browser while typing, with rules compiled
+                from the field constraints. If False, every change is validated on the server instead. In
+                both cases, all values are validated on the server on submit.
+            validation_trigger: When inputs are validated while the user edits them. A debounced validation
+                is dropped when newer input arrives before it runs.
+            field_triggers: Optional dictionary mapping field names to triggers overriding validation_trigger.
+            render_mode: How the fields are rendered. "eager" renders all fields at once. "lazy" renders blocks
+                of page_size fields when they scroll into view. "paged" shows page_size fields at a time, with
+                buttons to move between pages. Values of fields that are not rendered are kept in the state
+                and validated on submit, which shows the first invalid field.
+            page_size: Number of fields per block or page in the lazy and paged render modes.
+            update_form: Whether the field values of the given `Form` are also updated on submit, as in earlier
+                releases. Since the next displays of the form start from its values, only enable this when the
+                form backs a single session.
+
+        Raises:
+            ValueError: If the state does not belong to the form, a trigger, render_mode or page_size is
+                invalid, field_triggers names an unknown field, or update_form is set for a schema.
         """
-        self.form = form
+        if isinstance(form, Form):
+            self.form: Optional[Form] = form
+            self.schema = form.freeze()
+        else:
+            self.form = None
+            self.schema = form
+        if state is not None and state.schema is not self.schema:
+            raise ValueError("The state does not belong to the displayed form schema")
+        if update_form and self.form is None:
+            raise ValueError("update_form requires a Form, not a FormSchema")
+        if state is None:
+            state = self.schema.new_state() if self.form is None else self._state_of(self.form)
+        self.state = state
+        self.update_form = update_form
         self.on_submit = on_submit
+        self.client_validation = client_validation
+        self.validation_trigger = _check_trigger(validation_trigger)
+        self.field_triggers = {name: _check_trigger(trigger) for name, trigger in (field_triggers or {}).items()}
+        unknown = set(self.field_triggers) - {field.name for field in self.schema.fields}
+        if unknown:
+            raise ValueError(f"Unknown fields in field_triggers: {', '.join(sorted(unknown))}")
+        if render_mode not in ("eager", "lazy", "paged"):
+            raise ValueError(f"Invalid render mode: {render_mode!r}")
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        self.render_mode = render_mode
+        self.page_size = page_size
         self._input_elements = {}
+        self._pending_validations: Dict[str, asyncio.Task] = {}
+        self._placeholders: Dict[ui.element, range] = {}
+        self._page = 0
+        self._updating = False
         # Use provided locale, or fall back to form's locale, or auto-detect
-        display_locale = locale or form.locale
+        display_locale = locale or self.schema.locale
         self._t = I18nHelper(display_locale).translations
 
+    def _state_of(self, form: Form) -> FormState:
+        # Starts from the current values of the form, e.g. prefilled by the application
+        values = []
+        for field in form.fields:
+            if isinstance(field, BaseFormField):
+                value = field.get_value()
+                values.append(field.default_value if value is None else value)
+        return FormState(self.schema, values)
+
     def set_on_submit(self, callback: Union[Callable[[], None], Callable[[], Awaitable[None]]]) -> None:
         """Sets the callback for when the form is submitted.
 
@@ -52,51 +127,69 @@ class FormDisplay:
         """Renders the form display component in the NiceGUI application."""
         with ui.card().classes("w-full max-w-2xl mx-auto"):
             # Form header
-            ui.label(self.form.title).classes("text-2xl font-bold mb-2")
-            if self.form.description:
-                ui.label(self.form.description).classes("text-gray-600 mb-4")
+            ui.label(self.schema.title).classes("text-2xl font-bold mb-2")
+            if self.schema.description:
+                ui.label(self.schema.description).classes("text-gray-600 mb-4")
 
             # Form fields
-            with ui.column().classes("w-full gap-4 mt-4"):
-                for field in self.form.fields:
-                    if isinstance(field, BaseFormField):
-                        self._render_field(field)
+            self._fields_container = ui.column().classes("w-full gap-4 mt-4")
+            if self.render_mode == "paged":
+                with ui.row().classes("w-full items-center justify-between mt-4"):
+                    self._previous_button = ui.button(
+                        self._t.previousPage, on_click=lambda: self._show_page(self._page - 1), icon="chevron_left"
+                    ).props("flat")
+                    self._page_label = ui.label()
+                    self._next_button = ui.button(
+                        self._t.nextPage, on_click=lambda: self._show_page(self._page + 1)
+                    ).props("flat icon-right=chevron_right")
+                self._show_page(0)
+            elif self.render_mode == "lazy":
+                with self._fields_container:
+                    for start in range(0, len(self.schema.fields), self.page_size):
+                        self._render_placeholder(range(start, min(start + self.page_size, len(self.schema.fields))))
+            else:
+                with self._fields_container:
+                    for index, field in enumerate(self.schema.fields):
+                        self._render_field(field, self.state.values[index])
 
             # Buttons
             with ui.row().classes("w-full justify-end gap-2 mt-6"):
 
                 async def submit_form():
                     """Submits the form after validation."""
-                    # Trigger validation for all input fields and collect normalized values
-                    has_errors = False
-                    pending_values = {}
-                    for field_name, input_elem in self._input_elements.items():
-                        field = self.form.get_field(field_name)
-                        if not field or not isinstance(field, BaseFormField):
+                    # Validations scheduled while typing would be outdated by the result below
+                    for name in list(self._pending_validations):
+                        self._cancel_pending_validation(name)
+
+                    # Collect normalized values of all input fields, the others are kept in the session state
+                    pending = self.state.copy()
+                    malformed = set()
+                    for index, field in enumerate(self.schema.fields):
+                        input_elem = self._input_elements.get(field.name)
+                        if input_elem is None:
                             continue
-
-                        # Normalize once so we reuse for assignment after validation
-                        normalized_ok, normalized_value = self._normalize_input(field, input_elem.value)
-                        pending_values[field_name] = normalized_value
-
-                        if hasattr(input_elem, "validate"):
-                            result = input_elem.validate()
-                            if result is False:
-                                has_errors = True
-
-                        # If normalization already failed, mark error
+                        normalized_ok, pending.values[index] = self._normalize_input(field, input_elem.value)
                         if not normalized_ok:
-                            has_errors = True
+                            malformed.add(field.name)
+
+                    # Validate all fields at once and show the errors without validating again
+                    report = pending.validate_and_dump()
+                    errors = {}
+                    for field in self.schema.fields:
+                        if field.name in malformed:
+                            errors[field.name] = self._t.invalidTypeTemplate.format(field.label)
+                        else:
+                            errors[field.name] = self._convert_validation_message(report.results[field.name], field)
 
-                    if has_errors:
+                    if malformed or not report.is_valid:
+                        self._show_errors(errors)
                         ui.notify(self._t.pleaseFixValidationErrors, type="negative")
                         return
 
-                    # Update field values from normalized inputs
-                    for field_name, value in pending_values.items():
-                        field = self.form.get_field(field_name)
-                        if field and isinstance(field, BaseFormField):
-                            field.set_value(value)
+                    # Update session state from normalized inputs
+                    self.state.values = pending.values
+                    if self.update_form:
+                        self.form.load_data(report.data)
 
                     # Call submit callback
                     if self.on_submit:
@@ -107,27 +200,126 @@ class FormDisplay:
 
                 def reset_form():
                     """Resets the form to default values."""
-                    for field in self.form.fields:
-                        if isinstance(field, BaseFormField):
-                            field.set_value(field.default_value)
-
-                    # Update UI
-                    for field_name, input_elem in self._input_elements.items():
-                        field = self.form.get_field(field_name)
-                        if field and isinstance(field, BaseFormField):
-                            if isinstance(input_elem, ui.checkbox):
-                                input_elem.value = field.default_value or False
-                            else:
-                                input_elem.value = field.default_value
-
+                    self.reset()
                     ui.notify(self._t.formReset, type="info")
 
-                if self.form.show_reset_button:
+                if self.schema.show_reset_button:
                     ui.button(self._t.reset, on_click=reset_form, icon="refresh", color="warning")
-                if self.form.show_submit_button:
+                if self.schema.show_submit_button:
                     ui.button(self._t.submit, on_click=submit_form, icon="send", color="primary")
 
-    def _render_field(self, field: BaseFormField) -> None:
+    def set_values(self, values: Mapping[str, Any]) -> None:
+        """Sets the values of several fields at once, e.g. to load a saved draft.
+
+        All inputs are updated in one pass and validated once afterwards, instead of after each change.
+
+        Args:
+            values: Dictionary mapping field names to values.
+
+        Raises:
+            KeyError: If no field has one of the given names.
+        """
+        indices = {name: self.schema.index_of(name) for name in values}
+        for name, index in indices.items():
+            self.state.values[index] = values[name]
+        changed = self._update_inputs(indices)
+        if self.client_validation:
+            return
+        for name, input_elem in changed.items():
+            trigger = self.field_triggers.get(name, self.validation_trigger)
+            if trigger not in ("blur", "submit") and hasattr(input_elem, "validate"):
+                input_elem.validate(return_result=False)
+
+    def reset(self) -> None:
+        """Resets all fields to their default values and clears the errors shown.
+        With update_form, the values of the form are reset as well.
+        """
+        self.state.reset()
+        if self.update_form:
+            for field in self.form.fields:
+                if isinstance(field, BaseFormField):
+                    field.set_value(field.default_value)
+        self._update_inputs({field.name: index for index, field in enumerate(self.schema.fields)})
+
+    def _update_inputs(self, indices: Dict[str, int]) -> Dict[str, Any]:
+        # Validation is suppressed while the inputs change, the errors of the old values are cleared
+        changed = {}
+        self._updating = True
+        try:
+            for name, index in indices.items():
+                input_elem = self._input_elements.get(name)
+                if input_elem is None:
+                    continue
+                self._cancel_pending_validation(name)
+                input_elem.value = self._input_value(self.schema.fields[index], self.state.values[index])
+                if hasattr(input_elem, "validate"):
+                    input_elem.error = None
+                changed[name] = input_elem
+        finally:
+            self._updating = False
+        return changed
+
+    def _show_errors(self, errors: Dict[str, Optional[str]]) -> None:
+        hidden = [i for i, f in enumerate(self.schema.fields) if errors[f.name] and f.name not in self._input_elements]
+        if hidden and self.render_mode == "paged":
+            self._show_page(hidden[0] // self.page_size)
+        elif hidden and self.render_mode == "lazy":
+            for placeholder, indices in list(self._placeholders.items()):
+                if any(index in indices for index in hidden):
+                    self._materialize(placeholder)
+
+        first_error = None
+        for field in self.schema.fields:
+            input_elem = self._input_elements.get(field.name)
+            if input_elem is None or not hasattr(input_elem, "validate"):
+                continue
+            input_elem.error = errors[field.name]
+            if first_error is None and errors[field.name]:
+                first_error = input_elem
+        if hidden and first_error is not None:
+            # The invalid field may be far from the submit button
+            first_error.run_method("focus")
+
+    def _render_placeholder(self, indices: range) -> None:
+        # Fields are rendered once the placeholder, sized for the fields it stands for, scrolls into view
+        placeholder = (
+            ui.element("q-intersection").props("once").classes("w-full").style(f"min-height: {len(indices) * 72}px")
+        )
+        placeholder.on("visibility", lambda e: self._materialize(placeholder) if e.args else None)
+        self._placeholders[placeholder] = indices
+
+    def _materialize(self, placeholder: ui.element) -> None:
+        indices = self._placeholders.pop(placeholder, None)
+        if indices is None:
+            return
+        placeholder.style(remove=f"min-height: {len(indices) * 72}px")
+        with placeholder, ui.column().classes("w-full gap-4"):
+            for index in indices:
+                self._render_field(self.schema.fields[index], self.state.values[index])
+
+    def _show_page(self, page: int) -> None:
+        page_count = max((len(self.schema.fields) + self.page_size - 1) // self.page_size, 1)
+        page = min(max(page, 0), page_count - 1)
+
+        # Values of the fields leaving the page are kept in the session state
+        for index, field in enumerate(self.schema.fields):
+            input_elem = self._input_elements.pop(field.name, None)
+            if input_elem is None:
+                continue
+            self._cancel_pending_validation(field.name)
+            normalized_ok, value = self._normalize_input(field, input_elem.value)
+            self.state.values[index] = value if normalized_ok else input_elem.value
+
+        self._page = page
+        self._fields_container.clear()
+        with self._fields_container:
+            for index in range(page * self.page_size, min((page + 1) * self.page_size, len(self.schema.fields))):
+                self._render_field(self.schema.fields[index], self.state.values[index])
+        self._page_label.text = self._t.pageTemplate.format(page + 1, page_count)
+        self._previous_button.set_enabled(page > 0)
+        self._next_button.set_enabled(page < page_count - 1)
+
+    def _render_field(self, field: BaseFormField, value: Any) -> None:
         label_text = field.label
         if field.required:
             label_text += " *"
@@ -136,12 +328,13 @@ class FormDisplay:
             input_elem = ui.input(
                 label=label_text,
                 placeholder=field.description or "",
-                value=field.get_value() or field.default_value or "",
-                validation=lambda value, f=field: self._validate_internal(f, value),
+                value=self._input_value(field, value),
+                validation=self._server_validation(field),
             ).classes("w-full")
 
             if field.max_length:
                 input_elem.props(f"maxlength={field.max_length}")
+            self._setup_validation(field, input_elem)
 
             self._input_elements[field.name] = input_elem
 
@@ -149,15 +342,17 @@ class FormDisplay:
             input_elem = ui.number(
                 label=label_text,
                 placeholder=field.description or "",
-                value=field.get_value() or field.default_value,
+                value=value,
                 format="%.0f",
-                validation=lambda value, f=field: self._validate_internal(f, value),
+                validation=self._server_validation(field),
             ).classes("w-full")
 
+            # Numbers, since the element clamps its value to them on blur
             if field.min_value is not None:
-                input_elem.props(f"min={field.min_value}")
+                input_elem.props["min"] = field.min_value
             if field.max_value is not None:
-                input_elem.props(f"max={field.max_value}")
+                input_elem.props["max"] = field.max_value
+            self._setup_validation(field, input_elem)
 
             self._input_elements[field.name] = input_elem
 
@@ -165,32 +360,100 @@ class FormDisplay:
             input_elem = ui.number(
                 label=label_text,
                 placeholder=field.description or "",
-                value=field.get_value() or field.default_value,
+                value=value,
                 format="%.2f",
-                validation=lambda value, f=field: self._validate_internal(f, value),
+                validation=self._server_validation(field),
             ).classes("w-full")
 
+            # Numbers, since the element clamps its value to them on blur
             if field.min_value is not None:
-                input_elem.props(f"min={field.min_value}")
+                input_elem.props["min"] = field.min_value
             if field.max_value is not None:
-                input_elem.props(f"max={field.max_value}")
+                input_elem.props["max"] = field.max_value
+            self._setup_validation(field, input_elem)
 
             self._input_elements[field.name] = input_elem
 
         elif isinstance(field, BooleanField):
-            input_elem = ui.checkbox(text=label_text, value=field.get_value() or field.default_value or False)
+            input_elem = ui.checkbox(text=label_text, value=self._input_value(field, value))
 
             if field.description:
                 ui.label(field.description).classes("text-sm text-gray-500 -mt-4 mb-2 ml-2")
 
             self._input_elements[field.name] = input_elem
 
+    @staticmethod
+    def _input_value(field: BaseFormField, value: Any) -> Any:
+        if isinstance(field, TextField):
+            return value or ""
+        if isinstance(field, BooleanField):
+            return value or False
+        return value
+
+    def _server_validation(self, field: BaseFormField) -> Optional[Callable[[Any], Optional[str]]]:
+        if self.client_validation:
+            return None
+        return lambda value: None if self._updating else self._validate_internal(field, value)
+
+    def _setup_validation(self, field: BaseFormField, input_elem: Union[ui.input, ui.number]) -> None:
+        trigger = self.field_triggers.get(field.name, self.validation_trigger)
+
+        def clear_error() -> None:
+            # Errors found earlier are outdated once the value changes
+            input_elem.error = None
+
+        if not self.client_validation:
+            if trigger == "change":
+                return  # Validated by the element on every change
+            input_elem.without_auto_validation()
+            if trigger == "blur":
+                input_elem.on("blur", lambda: input_elem.validate(return_result=False))
+                input_elem.on_value_change(clear_error)
+            elif trigger == "submit":
+                input_elem.on_value_change(clear_error)
+            else:
+                input_elem.on_value_change(
+                    lambda: None if self._updating else self._validate_later(field.name, input_elem, trigger)
+                )
+            return
+
+        input_elem.on_value_change(clear_error)
+        if trigger == "submit":
+            return
+        rules = compile_rules(
+            field,
+            lambda result: self._convert_validation_message(result, field),
+            delay=trigger if isinstance(trigger, int) else 0,
+        )
+        if rules is None:
+            return
+        input_elem.props[":rules"] = rules
+        if trigger == "blur":
+            # The rules only run when validate is called, which the browser does when the input loses focus
+            input_elem.props["lazy-rules"] = "ondemand"
+            input_elem.on("blur", js_handler=f"() => runMethod({input_elem.id}, 'validate', [])")
+
+    def _validate_later(self, name: str, input_elem: Union[ui.input, ui.number], delay: int) -> None:
+        self._cancel_pending_validation(name)
+
+        async def validate() -> None:
+            await asyncio.sleep(delay / 1000)
+            del self._pending_validations[name]
+            input_elem.validate(return_result=False)
+
+        self._pending_validations[name] = background_tasks.create(validate(), name=f"validate {name}")
+
+    def _cancel_pending_validation(self, name: str) -> None:
+        task = self._pending_validations.pop(name, None)
+        if task is not None:
+            task.cancel()
+
     def _validate_internal(self, field: BaseFormField, raw_value: Any) -> Optional[str]:
         normalized_ok, normalized_value = self._normalize_input(field, raw_value)
         if not normalized_ok:
             return self._t.invalidTypeTemplate.format(field.label)
 
-        result = field.validate(normalized_value)
+        result = field.compile()(normalized_value)
         return self._convert_validation_message(result, field)
 
     def _normalize_input(self, field: BaseFormField, raw_value: Any) -> Tuple[bool, Any]:
@@ -253,3 +516,11 @@ class FormDisplay:
 
         # Fallback
         return self._t.invalidValueTemplate.format(field.label if field else "")
+
+
+def _check_trigger(trigger: ValidationTrigger) -> ValidationTrigger:
+    if trigger in ("change", "blur", "submit"):
+        return trigger
+    if isinstance(trigger, int) and not isinstance(trigger, bool) and trigger > 0:
+        return trigger
+    raise ValueError(f"Invalid validation trigger: {trigger!r}")
@@ -2,9 +2,10 @@
 
 import copy
 import inspect
-from typing import Awaitable, Callable, NamedTuple, Optional, Union
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Literal, NamedTuple, Optional, Union
 
-from nicegui import ui
+from nicegui import events, ui
 
 from ..core.fields import (
     BaseFormField,
@@ -15,6 +16,11 @@ from ..core.fields import (
 )
 from ..core.form import Form
 from ..i18n.helper import I18nHelper
+from .history import EditHistory, InsertField, MoveField, Operation, RemoveField, SetAttribute
+from .search import FieldIndex
+
+# Attributes of a field found by the field search, besides its type
+_SEARCHED_ATTRIBUTES = ("name", "label", "description")
 
 
 class FieldTypeInfo(NamedTuple):
@@ -24,6 +30,15 @@ class FieldTypeInfo(NamedTuple):
     icon: str
 
 
+class _FieldEditor(NamedTuple):
+    """Elements of the editor of a field, kept to update it in place."""
+
+    expansion: ui.expansion
+    body: ui.column
+    up_button: ui.button
+    down_button: ui.button
+
+
 class FormEditor:
     """Component for editing form structure and configuration."""
 
@@ -32,6 +47,10 @@ class FormEditor:
         form: Form,
         on_complete: Optional[Union[Callable[[], None], Callable[[], Awaitable[None]]]] = None,
         editor_locale: Optional[str] = None,
+        unload_closed: bool = False,
+        layout: Literal["expansions", "grid"] = "expansions",
+        search_debounce: int = 300,
+        history_depth: int = 100,
     ):
         """Initializes the form editor.
 
@@ -39,9 +58,20 @@ class FormEditor:
             form: The form to edit.
             on_complete: Optional callback (sync or async) when editing is complete.
             editor_locale: The locale code (e.g., 'en', 'zh_cn'). If None, auto-detects from system.
+            unload_closed: Whether the properties editor of a field is removed when its expansion is closed.
+                Either way, it is only built when the expansion is first opened.
+            layout: How the fields are edited. "expansions" shows an expansion with the properties of each
+                field. "grid" shows all fields as rows of a single grid with inline editing, sorting,
+                filtering and bulk actions on the selected rows, for forms with many fields.
+            search_debounce: Delay in milliseconds after the last keystroke in the field search before
+                filtering the fields.
+            history_depth: Maximum number of edits that can be undone.
         """
         self.form = form
         self.on_complete = on_complete
+        self.unload_closed = unload_closed
+        self.layout = layout
+        self.search_debounce = search_debounce
         self._t = I18nHelper(editor_locale).translations
         self._field_types = {
             self._t.text: FieldTypeInfo(TextField, "text_fields"),
@@ -49,6 +79,19 @@ class FormEditor:
             self._t.float: FieldTypeInfo(FloatField, "numbers"),
             self._t.boolean: FieldTypeInfo(BooleanField, "check_box"),
         }
+        # Editors of the fields by field identity, so changes of the field list only touch their editors
+        self._field_editors: Dict[int, _FieldEditor] = {}
+        # Fields of the grid layout by row key
+        self._grid_fields: Dict[str, BaseFormField] = {}
+        # Searched texts of the fields by field identity, maintained on edits
+        self._search_index = FieldIndex()
+        self._search = ""
+        self.history = EditHistory(form, max_depth=history_depth)
+        # Whether changes are made by undo or redo, and must not be recorded
+        self._replaying = False
+        self._form_inputs: Dict[str, Callable[[Any], None]] = {}
+        self._undo_button: Optional[ui.button] = None
+        self._redo_button: Optional[ui.button] = None
 
     def set_on_complete(self, callback: Union[Callable[[], None], Callable[[], Awaitable[None]]]) -> None:
         """Sets the callback for when editing is complete.
@@ -70,13 +113,13 @@ class FormEditor:
                 title_input = ui.input(
                     self._t.formTitle,
                     value=self.form.title,
-                    on_change=lambda e: setattr(self.form, "title", e.value),
+                    on_change=lambda e: self._set_form_attribute("title", e.value),
                 ).classes("w-full")
 
                 desc_input = ui.textarea(
                     self._t.formDescription,
                     value=self.form.description or "",
-                    on_change=lambda e: setattr(self.form, "description", e.value or None),
+                    on_change=lambda e: self._set_form_attribute("description", e.value or None),
                 ).classes("w-full")
 
                 # Locale selector
@@ -93,43 +136,53 @@ class FormEditor:
                     # Default to first locale (English)
                     current_locale_label = available_locales[0].native_name if available_locales else "English"
 
-                ui.select(
+                locale_select = ui.select(
                     options=list(locale_options.keys()),
                     value=current_locale_label,
                     label=self._t.formLocale,
-                    on_change=lambda e: setattr(self.form, "locale", locale_options.get(e.value)),
+                    on_change=lambda e: self._set_form_attribute("locale", locale_options.get(e.value)),
                 ).classes("w-full")
 
                 # Button visibility controls
                 with ui.row().classes("gap-4 mt-2"):
-                    ui.checkbox(
+                    reset_checkbox = ui.checkbox(
                         text=self._t.showResetButton,
                         value=self.form.show_reset_button,
-                        on_change=lambda e: setattr(self.form, "show_reset_button", e.value),
+                        on_change=lambda e: self._set_form_attribute("show_reset_button", e.value),
                     )
-                    ui.checkbox(
+                    submit_checkbox = ui.checkbox(
                         text=self._t.showSubmitButton,
                         value=self.form.show_submit_button,
-                        on_change=lambda e: setattr(self.form, "show_submit_button", e.value),
+                        on_change=lambda e: self._set_form_attribute("show_submit_button", e.value),
                     )
 
                 ui.label(f"{self._t.uuid}: {self.form.uuid}").classes("text-sm text-gray-500")
 
+                # Shows the attributes of the form again after undo or redo
+                locale_labels = {code: label for label, code in locale_options.items()}
+                self._form_inputs = {
+                    "title": title_input.set_value,
+                    "description": lambda v: desc_input.set_value(v or ""),
+                    "locale": lambda v: locale_select.set_value(locale_labels.get(v, current_locale_label)),
+                    "show_reset_button": reset_checkbox.set_value,
+                    "show_submit_button": submit_checkbox.set_value,
+                }
+
             # Fields editor
             with ui.card().classes("w-full mb-4"):
-                ui.label(self._t.formFields).classes("text-lg font-semibold mb-2")
-
-                fields_container = ui.column().classes("w-full gap-2")
-
-                def refresh_fields():
-                    """Refreshes the fields display."""
-                    fields_container.clear()
-                    with fields_container:
-                        for idx, field in enumerate(self.form.fields):
-                            if isinstance(field, BaseFormField):
-                                self._render_field_editor(field, idx, refresh_fields)
+                with ui.row().classes("w-full items-center justify-between mb-2"):
+                    ui.label(self._t.formFields).classes("text-lg font-semibold")
+                    ui.input(placeholder=self._t.searchFields, value=self._search, on_change=self._on_search).props(
+                        f"dense clearable debounce={self.search_debounce}"
+                    ).classes("w-64")
 
-                refresh_fields()
+                self._fields_container = ui.column().classes("w-full gap-2")
+                self._field_editors.clear()
+                self._search_index = FieldIndex()
+                if self.layout == "grid":
+                    with self._fields_container:
+                        self._render_fields_grid()
+                self.sync_fields()
 
                 # Add field controls
                 with ui.row().classes("gap-2"):
@@ -145,7 +198,7 @@ class FormEditor:
                         assert isinstance(field_type, str)
                         field_info = self._field_types[field_type]
                         field_class = field_info.field_class
-                        new_field_name = f"field_{len(self.form.fields)}"
+                        new_field_name = self._unique_field_name(f"field_{len(self.form.fields)}")
                         # Get the original field type name for the template
                         original_type = None
                         for k, v in self._field_types.items():
@@ -156,7 +209,8 @@ class FormEditor:
                             name=new_field_name, label=self._t.newFieldTemplate.format(original_type)
                         )
                         self.form.add_field(new_field)
-                        refresh_fields()
+                        self._record(InsertField(new_field, len(self.form.fields) - 1))
+                        self.sync_fields()
 
                     ui.button(self._t.addField, on_click=add_field, icon="add")
 
@@ -172,10 +226,16 @@ class FormEditor:
 
                     def export_schema_b64():
                         """Exports the form schema as base64."""
-                        schema_b64 = self.form.dump_schema_b64(compression_flag=1)
+                        schema_b64 = self.form.dump_schema_b64(compression_flag="auto")
                         ui.clipboard.write(schema_b64)
                         ui.notify(self._t.base64SchemaCopied)
 
+                    self._undo_button = ui.button(icon="undo", on_click=self.undo).props("flat")
+                    self._undo_button.tooltip(self._t.undo)
+                    self._redo_button = ui.button(icon="redo", on_click=self.redo).props("flat")
+                    self._redo_button.tooltip(self._t.redo)
+                    self._update_history_buttons()
+
                     ui.button(self._t.exportJson, on_click=export_schema, icon="data_object", color="secondary")
                     ui.button(self._t.exportBase64, on_click=export_schema_b64, icon="code", color="secondary")
 
@@ -188,36 +248,337 @@ class FormEditor:
 
                     ui.button(self._t.complete, on_click=handle_complete, icon="check")
 
-    def _move_field(self, index: int, direction: int, refresh_callback: Callable) -> None:
-        new_index = index + direction
-        if 0 <= new_index < len(self.form.fields):
-            self.form.fields[index], self.form.fields[new_index] = (
-                self.form.fields[new_index],
-                self.form.fields[index],
-            )
-            refresh_callback()
-
-    def _delete_field(self, field_name: str, refresh_callback: Callable) -> None:
-        self.form.remove_field(field_name)
-        refresh_callback()
-
-    def _duplicate_field(self, index: int, refresh_callback: Callable) -> None:
-        original_field = self.form.fields[index]
-        new_field = copy.deepcopy(original_field)
-
-        # Ensure unique name
-        base_name = original_field.name
+    def _unique_field_name(self, name: str) -> str:
         counter = 1
-        new_name = f"{base_name}_copy"
-        while self.form.get_field(new_name):
-            new_name = f"{base_name}_copy_{counter}"
+        new_name = name
+        while self.form.has_field(new_name):
+            new_name = f"{name}_{counter}"
             counter += 1
-        new_field.name = new_name
+        return new_name
+
+    def _rename_field(self, field: BaseFormField, new_name: str) -> None:
+        # Duplicate names are reported by the input validation and not applied
+        if not self.form.has_field(new_name):
+            self._set_field_attribute(field, "name", new_name)
+
+    def _set_field_attribute(self, field: BaseFormField, key: str, value: Any) -> None:
+        old = getattr(field, key)
+        setattr(field, key, value)
+        if old != value:
+            self._record(SetAttribute(field, key, old, value))
+        if key in _SEARCHED_ATTRIBUTES and id(field) in self._search_index:
+            # The field stays visible until the next search, even if it no longer matches
+            self._index_field(field)
+
+    def _set_form_attribute(self, key: str, value: Any) -> None:
+        old = getattr(self.form, key)
+        setattr(self.form, key, value)
+        if old != value:
+            self._record(SetAttribute(self.form, key, old, value))
+
+    def _record(self, operation: Operation) -> None:
+        if not self._replaying:
+            self.history.record(operation)
+            self._update_history_buttons()
+
+    def undo(self) -> None:
+        """Reverts the latest edit made in the editor, if any."""
+        self._replay(self.history.undo)
+
+    def redo(self) -> None:
+        """Applies the latest undone edit again, if any."""
+        self._replay(self.history.redo)
+
+    def _replay(self, step: Callable[[], Optional[List[Operation]]]) -> None:
+        self._replaying = True
+        try:
+            operations = step() or []
+        except ValueError as error:
+            # The form was changed elsewhere in a conflicting way
+            ui.notify(str(error), type="negative")
+            self.history.clear()
+            operations = []
+        try:
+            changed_fields: Dict[int, BaseFormField] = {}
+            for operation in operations:
+                if isinstance(operation, SetAttribute):
+                    if operation.target is self.form:
+                        if operation.key in self._form_inputs:
+                            self._form_inputs[operation.key](getattr(self.form, operation.key))
+                    elif isinstance(operation.target, BaseFormField):
+                        changed_fields[id(operation.target)] = operation.target
+            self.sync_fields()
+            for key, field in changed_fields.items():
+                self._refresh_field(field)
+        finally:
+            self._replaying = False
+        self._update_history_buttons()
+
+    def _refresh_field(self, field: BaseFormField) -> None:
+        # Shows the current attributes of the field in its editor
+        if id(field) in self._search_index:
+            self._index_field(field)
+        editor = self._field_editors.get(id(field))
+        if editor is not None and editor.body.default_slot.children:
+            editor.body.clear()
+            if editor.expansion.value:
+                with editor.body:
+                    self._render_field_properties(field)
+
+    def _update_history_buttons(self) -> None:
+        if self._undo_button is not None and self._redo_button is not None:
+            self._undo_button.set_enabled(self.history.can_undo)
+            self._redo_button.set_enabled(self.history.can_redo)
+
+    def _index_field(self, field: BaseFormField) -> None:
+        texts = [getattr(field, key) for key in _SEARCHED_ATTRIBUTES]
+        texts.append(self._type_name(field))
+        self._search_index.update(id(field), texts)
+
+    def _type_name(self, field: BaseFormField) -> str:
+        return next((name for name, info in self._field_types.items() if isinstance(field, info.field_class)), "")
+
+    def _on_search(self, e: events.ValueChangeEventArguments) -> None:
+        self._search = e.value or ""
+        if self.layout == "grid":
+            # The grid filters its rows in the browser
+            self._grid.run_grid_method("setGridOption", "quickFilterText", self._search)
+            return
+        matches = self._search_index.search(self._search)
+        for key, editor in self._field_editors.items():
+            editor.expansion.set_visibility(key in matches)
+
+    def _validate_field_name(self, field: BaseFormField, new_name: str) -> Optional[str]:
+        if new_name != field.name and self.form.has_field(new_name):
+            return self._t.duplicateFieldName
+        return None
+
+    def sync_fields(self) -> None:
+        """Updates the field editors to match the fields of the form.
+
+        Editors are kept per field, so only the editors of added or removed fields are created or deleted,
+        and only moved editors are moved. Call it after changing the fields of the form from elsewhere.
+        """
+        fields = [field for field in self.form.fields if isinstance(field, BaseFormField)]
+        if self.layout == "grid":
+            self._sync_grid(fields)
+            return
+        present = {id(field) for field in fields}
+        for key in [key for key in self._field_editors if key not in present]:
+            self._field_editors.pop(key).expansion.delete()
+            self._search_index.remove(key)
+
+        children = self._fields_container.default_slot.children
+        for position, field in enumerate(fields):
+            editor = self._field_editors.get(id(field))
+            if editor is None:
+                with self._fields_container:
+                    editor = self._field_editors[id(field)] = self._render_field_editor(field)
+                self._index_field(field)
+                if self._search:
+                    editor.expansion.set_visibility(self._search_index.matches(id(field), self._search))
+            if children[position] is not editor.expansion:
+                editor.expansion.move(self._fields_container, position)
+            # Only sent to the browser when the state changes
+            editor.up_button.set_enabled(position > 0)
+            editor.down_button.set_enabled(position < len(fields) - 1)
+
+    def _render_fields_grid(self) -> None:
+        with ui.row().classes("gap-2"):
+            ui.button(self._t.deleteSelected, on_click=self._delete_selected, icon="delete").props("flat color=red")
+            ui.button(self._t.duplicateSelected, on_click=self._duplicate_selected, icon="content_copy").props("flat")
+            ui.button(self._t.toggleRequired, on_click=self._toggle_required_selected, icon="rule").props("flat")
+
+        not_boolean = "params => params.data.kind !== 'boolean'"
+        self._grid = ui.aggrid(
+            {
+                "columnDefs": [
+                    {"field": "name", "headerName": self._t.fieldName, "pinned": "left"},
+                    {"field": "type", "headerName": self._t.fieldType, "editable": False, "width": 110},
+                    {"field": "label", "headerName": self._t.label},
+                    {"field": "description", "headerName": self._t.description},
+                    {"field": "required", "headerName": self._t.required, "cellDataType": "boolean", "width": 110},
+                    {"field": "min", "headerName": self._t.minimum, "cellDataType": "number", ":editable": not_boolean},
+                    {"field": "max", "headerName": self._t.maximum, "cellDataType": "number", ":editable": not_boolean},
+                    {
+                        "field": "regex",
+                        "headerName": self._t.regexPattern,
+                        ":editable": "params => params.data.kind === 'text'",
+                    },
+                ],
+                "defaultColDef": {"editable": True, "sortable": True, "filter": True, "resizable": True},
+                "rowData": [],
+                "quickFilterText": self._search,
+                "rowSelection": {"mode": "multiRow"},
+                ":getRowId": "params => params.data.key",
+                "stopEditingWhenCellsLoseFocus": True,
+            }
+        ).classes("w-full h-[60vh]")
+        self._grid.on("cellValueChanged", self._on_grid_cell_changed)
+
+    def _sync_grid(self, fields: List[BaseFormField]) -> None:
+        self._grid_fields = {str(id(field)): field for field in fields}
+        rows = [self._grid_row(field) for field in fields]
+        # The grid keeps its sort, filter and selection, and only redraws the rows that changed
+        self._grid.run_grid_method("setGridOption", "rowData", rows)
+        self._store_grid_rows(rows)
+
+    def _store_grid_rows(self, rows: List[Dict[str, Any]]) -> None:
+        # Kept for when the grid is rendered again, without sending the options to the browser now
+        with self._grid.props.suspend_updates():
+            self._grid.options["rowData"] = rows
+
+    def _grid_row(self, field: BaseFormField) -> Dict[str, Any]:
+        type_name = self._type_name(field)
+        if isinstance(field, TextField):
+            kind, low, high = "text", field.min_length, field.max_length
+        elif isinstance(field, (IntegerField, FloatField)):
+            kind, low, high = "number", field.min_value, field.max_value
+        else:
+            kind, low, high = "boolean", None, None
+        return {
+            "key": str(id(field)),
+            "kind": kind,
+            "name": field.name,
+            "type": type_name,
+            "label": field.label,
+            "description": field.description or "",
+            "required": field.required,
+            "min": low,
+            "max": high,
+            "regex": field.regex if isinstance(field, TextField) else None,
+        }
+
+    def _on_grid_cell_changed(self, e: events.GenericEventArguments) -> None:
+        field = self._grid_fields.get(e.args["rowId"])
+        if field is None:
+            return
+        try:
+            self._set_field_property(field, e.args["colId"], e.args["newValue"])
+        except ValueError as error:
+            ui.notify(str(error), type="negative")
+            # Show the unchanged value again
+            self._grid.run_row_method(e.args["rowId"], "setData", self._grid_row(field))
+        self._store_grid_rows([self._grid_row(f) for f in self._grid_fields.values()])
+
+    def _set_field_property(self, field: BaseFormField, column: str, value: Any) -> None:
+        if column == "name":
+            name = (value or "").strip()
+            if not name:
+                raise ValueError(self._t.invalidValueTemplate.format(self._t.fieldName))
+            if self._validate_field_name(field, name) is not None:
+                raise ValueError(self._t.duplicateFieldName)
+            self._set_field_attribute(field, "name", name)
+        elif column == "label":
+            self._set_field_attribute(field, "label", value or "")
+        elif column == "description":
+            self._set_field_attribute(field, "description", value or None)
+        elif column == "required":
+            self._set_field_attribute(field, "required", bool(value))
+        elif column in ("min", "max"):
+            if isinstance(field, TextField):
+                suffix = "_length"
+            elif isinstance(field, (IntegerField, FloatField)):
+                suffix = "_value"
+            else:
+                return
+            bound = self._parse_bound(field, value, self._t.minimum if column == "min" else self._t.maximum)
+            low = bound if column == "min" else getattr(field, f"min{suffix}")
+            high = bound if column == "max" else getattr(field, f"max{suffix}")
+            if low is not None and high is not None and low > high:
+                raise ValueError(self._t.minGreaterThanMax)
+            self._set_field_attribute(field, f"{column}{suffix}", bound)
+        elif column == "regex" and isinstance(field, TextField):
+            try:
+                re.compile(value or "")
+            except re.error:
+                raise ValueError(self._t.invalidValueTemplate.format(self._t.regexPattern)) from None
+            self._set_field_attribute(field, "regex", value or None)
+
+    def _apply_field_property(
+        self, input_elem: Union[ui.input, ui.number], field: BaseFormField, column: str, value: Any
+    ) -> None:
+        # Invalid values are reported on the input and not applied, as in the grid
+        try:
+            self._set_field_property(field, column, value)
+        except ValueError as error:
+            input_elem.error = str(error)
+        else:
+            input_elem.error = None
+
+    def _parse_bound(self, field: BaseFormField, value: Any, label: str) -> Optional[Union[int, float]]:
+        # Lengths and bounds of integer fields must be integers, which are not truncated
+        if value is None:
+            return None
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value != value:
+            raise ValueError(self._t.invalidValueTemplate.format(label))
+        if isinstance(field, FloatField):
+            return float(value)
+        if not float(value).is_integer() or (isinstance(field, TextField) and value < 0):
+            raise ValueError(self._t.invalidValueTemplate.format(label))
+        return int(value)
+
+    async def _selected_fields(self) -> List[BaseFormField]:
+        rows = await self._grid.get_selected_rows()
+        keys = {row["key"] for row in rows}
+        return [field for key, field in self._grid_fields.items() if key in keys]
+
+    async def _delete_selected(self) -> None:
+        fields = await self._selected_fields()
+        with self.history.transaction():
+            for field in fields:
+                self._remove_field(field)
+        self._update_history_buttons()
+        self.sync_fields()
+
+    async def _duplicate_selected(self) -> None:
+        fields = await self._selected_fields()
+        with self.history.transaction():
+            for field in fields:
+                self._insert_copy(field)
+        self._update_history_buttons()
+        self.sync_fields()
+
+    async def _toggle_required_selected(self) -> None:
+        fields = await self._selected_fields()
+        required = not all(field.required for field in fields)
+        with self.history.transaction():
+            for field in fields:
+                self._set_field_attribute(field, "required", required)
+        self._update_history_buttons()
+        self.sync_fields()
+
+    def _move_field(self, field: BaseFormField, direction: int) -> None:
+        index = self.form.fields.index(field)
+        new_index = index + direction
+        if 0 <= new_index < len(self.form.fields):
+            self.form.move_field(index, new_index)
+            self._record(MoveField(index, new_index))
+            self.sync_fields()
+
+    def _delete_field(self, field: BaseFormField) -> None:
+        self._remove_field(field)
+        self.sync_fields()
+
+    def _remove_field(self, field: BaseFormField) -> None:
+        index = self.form.fields.index(field)
+        self.form.remove_field(field.name)
+        self._record(RemoveField(field, index))
+
+    def _duplicate_field(self, field: BaseFormField) -> None:
+        self._insert_copy(field)
+        self.sync_fields()
+
+    def _insert_copy(self, field: BaseFormField) -> None:
+        new_field = copy.deepcopy(field)
+
+        new_field.name = self._unique_field_name(f"{field.name}_copy")
 
-        self.form.fields.insert(index + 1, new_field)
-        refresh_callback()
+        index = self.form.fields.index(field) + 1
+        self.form.insert_field(index, new_field)
+        self._record(InsertField(new_field, index))
 
-    def _render_field_editor(self, field: BaseFormField, index: int, refresh_callback: Callable) -> None:
+    def _render_field_editor(self, field: BaseFormField) -> _FieldEditor:
         # Get the icon for this field type
         field_icon = "edit"
         for type_name, type_info in self._field_types.items():
@@ -240,83 +601,97 @@ class FormEditor:
 
                     # Sort buttons
                     with ui.row().classes("gap-0 items-center mr-1"):
-                        up_btn = ui.button(
-                            icon="arrow_upward", on_click=lambda: self._move_field(index, -1, refresh_callback)
-                        ).props("flat dense color=grey")
-                        if index == 0:
-                            up_btn.disable()
-
-                        down_btn = ui.button(
-                            icon="arrow_downward", on_click=lambda: self._move_field(index, 1, refresh_callback)
-                        ).props("flat dense color=grey")
-                        if index == len(self.form.fields) - 1:
-                            down_btn.disable()
+                        up_btn = ui.button(icon="arrow_upward", on_click=lambda: self._move_field(field, -1)).props(
+                            "flat dense color=grey"
+                        )
+                        down_btn = ui.button(icon="arrow_downward", on_click=lambda: self._move_field(field, 1)).props(
+                            "flat dense color=grey"
+                        )
 
                         # Duplicate button
-                        ui.button(
-                            icon="content_copy", on_click=lambda: self._duplicate_field(index, refresh_callback)
-                        ).props("flat dense color=grey")
+                        ui.button(icon="content_copy", on_click=lambda: self._duplicate_field(field)).props(
+                            "flat dense color=grey"
+                        )
 
                         # Delete button
-                        ui.button(
-                            icon="delete", on_click=lambda: self._delete_field(field.name, refresh_callback)
-                        ).props("flat dense color=red")
-
-            with ui.column().classes("w-full gap-2 p-2"):
-                with ui.row().classes("w-full items-center gap-4"):
-                    ui.input(
-                        self._t.fieldName, value=field.name, on_change=lambda e, f=field: setattr(f, "name", e.value)
-                    ).classes("flex-grow")
-
-                    ui.checkbox(
-                        self._t.required,
-                        value=field.required,
-                        on_change=lambda e, f=field: setattr(f, "required", e.value),
-                    ).classes("mt-4")
-
-                ui.input(
-                    self._t.label, value=field.label, on_change=lambda e, f=field: setattr(f, "label", e.value)
-                ).classes("w-full")
-
-                ui.input(
-                    self._t.description,
-                    value=field.description or "",
-                    on_change=lambda e, f=field: setattr(f, "description", e.value or None),
-                ).classes("w-full")
+                        ui.button(icon="delete", on_click=lambda: self._delete_field(field)).props(
+                            "flat dense color=red"
+                        )
 
-                # Type-specific fields
-                if isinstance(field, TextField):
-                    # Min and Max length in the same row
-                    with ui.row().classes("w-full gap-2"):
-                        ui.number(
-                            self._t.minLength,
-                            value=field.min_length,
-                            on_change=lambda e, f=field: setattr(f, "min_length", int(e.value) if e.value else None),
-                        ).classes("flex-1")
-
-                        ui.number(
-                            self._t.maxLength,
-                            value=field.max_length,
-                            on_change=lambda e, f=field: setattr(f, "max_length", int(e.value) if e.value else None),
-                        ).classes("flex-1")
-
-                    ui.input(
-                        self._t.regexPattern,
-                        value=field.regex or "",
-                        on_change=lambda e, f=field: setattr(f, "regex", e.value or None),
-                    ).classes("w-full")
-
-                elif isinstance(field, (IntegerField, FloatField)):
-                    # Min and Max value in the same row
-                    with ui.row().classes("w-full gap-2"):
-                        ui.number(
-                            self._t.minValue,
-                            value=field.min_value,
-                            on_change=lambda e, f=field: setattr(f, "min_value", e.value),
-                        ).classes("flex-1")
-
-                        ui.number(
-                            self._t.maxValue,
-                            value=field.max_value,
-                            on_change=lambda e, f=field: setattr(f, "max_value", e.value),
-                        ).classes("flex-1")
+            # The properties are only built when the expansion is opened
+            body = ui.column().classes("w-full gap-2 p-2")
+
+        def toggle_body() -> None:
+            if expansion.value and not body.default_slot.children:
+                with body:
+                    self._render_field_properties(field)
+            elif not expansion.value and self.unload_closed:
+                body.clear()
+
+        expansion.on_value_change(toggle_body)
+
+        return _FieldEditor(expansion, body, up_btn, down_btn)
+
+    def _render_field_properties(self, field: BaseFormField) -> None:
+        with ui.row().classes("w-full items-center gap-4"):
+            ui.input(
+                self._t.fieldName,
+                value=field.name,
+                validation=lambda v, f=field: self._validate_field_name(f, v),
+                on_change=lambda e, f=field: self._rename_field(f, e.value),
+            ).classes("flex-grow")
+
+            ui.checkbox(
+                self._t.required,
+                value=field.required,
+                on_change=lambda e, f=field: self._set_field_attribute(f, "required", e.value),
+            ).classes("mt-4")
+
+        ui.input(
+            self._t.label,
+            value=field.label,
+            on_change=lambda e, f=field: self._set_field_attribute(f, "label", e.value),
+        ).classes("w-full")
+
+        ui.input(
+            self._t.description,
+            value=field.description or "",
+            on_change=lambda e, f=field: self._set_field_attribute(f, "description", e.value or None),
+        ).classes("w-full")
+
+        # Type-specific fields
+        if isinstance(field, TextField):
+            # Min and Max length in the same row
+            with ui.row().classes("w-full gap-2"):
+                ui.number(
+                    self._t.minLength,
+                    value=field.min_length,
+                    on_change=lambda e, f=field: self._apply_field_property(e.sender, f, "min", e.value),
+                ).without_auto_validation().classes("flex-1")
+
+                ui.number(
+                    self._t.maxLength,
+                    value=field.max_length,
+                    on_change=lambda e, f=field: self._apply_field_property(e.sender, f, "max", e.value),
+                ).without_auto_validation().classes("flex-1")
+
+            ui.input(
+                self._t.regexPattern,
+                value=field.regex or "",
+                on_change=lambda e, f=field: self._apply_field_property(e.sender, f, "regex", e.value),
+            ).without_auto_validation().classes("w-full")
+
+        elif isinstance(field, (IntegerField, FloatField)):
+            # Min and Max value in the same row
+            with ui.row().classes("w-full gap-2"):
+                ui.number(
+                    self._t.minValue,
+                    value=field.min_value,
+                    on_change=lambda e, f=field: self._apply_field_property(e.sender, f, "min", e.value),
+                ).without_auto_validation().classes("flex-1")
+
+                ui.number(
+                    self._t.maxValue,
+                    value=field.max_value,
+                    on_change=lambda e, f=field: self._apply_field_property(e.sender, f, "max", e.value),
+                ).without_auto_validation().classes("flex-1")
@@ -0,0 +1,144 @@
+"""Form results component for browsing submissions."""
+
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from nicegui import events, run, ui
+
+from ..core.fields import BaseFormField, FloatField, IntegerField
+from ..core.form import Form
+from ..core.schema import FormSchema
+from ..data.results import ResultsPage, ResultsSource
+from ..i18n.helper import I18nHelper
+
+_KEY_COLUMN = "__key"
+
+
+class FormResults:
+    """Component for browsing the submissions of a form, page by page."""
+
+    def __init__(
+        self,
+        form: Union[Form, FormSchema],
+        source: ResultsSource,
+        locale: Optional[str] = None,
+        page_size: int = 20,
+        page_size_options: Sequence[int] = (10, 20, 50, 100),
+        search_debounce: int = 300,
+    ):
+        """Initializes the form results.
+
+        Columns are derived from the fields of the form. Sorting and searching are done by the source on
+        the server, so the browser only ever receives the rows of the current page.
+
+        Args:
+            form: The form or the immutable form schema whose submissions are shown.
+            source: The source of the submissions, e.g. a `StoreSource` or a `RecordsSource`.
+            locale: The locale code (e.g., 'en', 'zh_cn'). If None, uses form.locale or auto-detects from system.
+            page_size: Initial number of rows per page.
+            page_size_options: Numbers of rows per page the user can choose from.
+            search_debounce: Delay in milliseconds after the last keystroke before searching.
+
+        Raises:
+            ValueError: If page_size or one of page_size_options is not positive.
+        """
+        if page_size <= 0 or any(size <= 0 for size in page_size_options):
+            raise ValueError("Page sizes must be positive")
+        self.schema = form.freeze() if isinstance(form, Form) else form
+        self.source = source
+        self.page_size = page_size
+        self.page_size_options = sorted({page_size, *page_size_options})
+        self.search_debounce = search_debounce
+        self._t = I18nHelper(locale or self.schema.locale).translations
+        self._table: Optional[ui.table] = None
+        self._search: Optional[str] = None
+        self._fetch_count = 0
+
+    def render(self) -> None:
+        """Renders the form results component in the NiceGUI application."""
+        fields = [f for f in self.schema.fields if isinstance(f, BaseFormField)]
+        columns = [{"name": _KEY_COLUMN, "label": "#", "field": _KEY_COLUMN, "sortable": True, "align": "left"}]
+        for field in fields:
+            numeric = isinstance(field, (IntegerField, FloatField))
+            columns.append(
+                {
+                    "name": field.name,
+                    "label": field.label,
+                    "field": field.name,
+                    "sortable": True,
+                    "align": "right" if numeric else "left",
+                }
+            )
+
+        with ui.card().classes("w-full"):
+            with ui.row().classes("w-full items-center justify-between"):
+                ui.label(self.schema.title).classes("text-2xl font-bold")
+                ui.input(placeholder=self._t.searchResults, on_change=self._on_search).props(
+                    f"dense clearable debounce={self.search_debounce}"
+                ).classes("w-64")
+
+            self._table = ui.table(
+                rows=[],
+                columns=columns,
+                row_key=_KEY_COLUMN,
+                pagination={
+                    "page": 1,
+                    "rowsPerPage": self.page_size,
+                    "rowsNumber": 0,
+                    "sortBy": None,
+                    "descending": False,
+                },
+            ).classes("w-full")
+            self._table.props["rows-per-page-options"] = self.page_size_options
+            self._table.props["no-data-label"] = self._t.noResults
+            self._table.on("request", self._on_request)
+
+        ui.timer(0, self.refresh, once=True)
+
+    async def refresh(self) -> None:
+        """Fetches the current page again, e.g. to show new submissions."""
+        if self._table is not None:
+            await self._fetch(self._table.pagination)
+
+    async def _on_search(self, e: events.ValueChangeEventArguments) -> None:
+        self._search = e.value or None
+        if self._table is not None:
+            await self._fetch({**self._table.pagination, "page": 1})
+
+    async def _on_request(self, e: events.GenericEventArguments) -> None:
+        await self._fetch(e.args["pagination"])
+
+    async def _fetch(self, pagination: Dict[str, Any]) -> None:
+        table = self._table
+        if table is None:
+            return
+        self._fetch_count += 1
+        fetch_id = self._fetch_count
+        rows_per_page = pagination.get("rowsPerPage") or self.page_size
+        page = max(int(pagination.get("page") or 1), 1)
+        sort_by = pagination.get("sortBy") or None
+        descending = bool(pagination.get("descending"))
+
+        result: ResultsPage = await run.io_bound(
+            self.source.fetch,
+            (page - 1) * rows_per_page,
+            rows_per_page,
+            None if sort_by == _KEY_COLUMN else sort_by,
+            descending,
+            self._search,
+        )
+        if fetch_id != self._fetch_count:
+            # A newer request has been made in the meantime
+            return
+
+        table.rows = self._to_rows(result)
+        table.pagination = {
+            "page": page,
+            "rowsPerPage": rows_per_page,
+            "rowsNumber": result.total,
+            "sortBy": sort_by,
+            "descending": descending,
+        }
+
+    @staticmethod
+    def _to_rows(result: ResultsPage) -> List[Dict[str, Any]]:
+        return [{**data, _KEY_COLUMN: key} for key, data in result.rows]
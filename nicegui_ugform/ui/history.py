@@ -0,0 +1,199 @@
+"""Undo and redo of form edits, recorded as an operation log."""
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Iterator, List, NamedTuple, Optional, Union
+
+from ..core.fields import BaseFormNode
+from ..core.form import Form
+
+
+class SetAttribute(NamedTuple):
+    """Change of an attribute of the form or of one of its fields."""
+
+    target: Union[Form, BaseFormNode]
+    key: str
+    old: Any
+    new: Any
+
+    def undo(self, form: Form) -> None:
+        setattr(self.target, self.key, self.old)
+
+    def redo(self, form: Form) -> None:
+        setattr(self.target, self.key, self.new)
+
+
+class InsertField(NamedTuple):
+    """Insertion of a field, e.g. a new or duplicated one."""
+
+    field: BaseFormNode
+    index: int
+
+    def undo(self, form: Form) -> None:
+        form.remove_field(self.field.name)
+
+    def redo(self, form: Form) -> None:
+        form.insert_field(self.index, self.field)
+
+
+class RemoveField(NamedTuple):
+    """Removal of a field. The removed field itself is kept to insert it again."""
+
+    field: BaseFormNode
+    index: int
+
+    def undo(self, form: Form) -> None:
+        form.insert_field(self.index, self.field)
+
+    def redo(self, form: Form) -> None:
+        form.remove_field(self.field.name)
+
+
+class MoveField(NamedTuple):
+    """Move of a field to another position."""
+
+    index: int
+    new_index: int
+
+    def undo(self, form: Form) -> None:
+        form.move_field(self.new_index, self.index)
+
+    def redo(self, form: Form) -> None:
+        form.move_field(self.index, self.new_index)
+
+
+Operation = Union[SetAttribute, InsertField, RemoveField, MoveField]
+
+
+class EditHistory:
+    """Bounded undo and redo history of the edits of a form.
+
+    Each step is a list of operations that hold only what they changed, such as the old and new value of
+    an attribute or a removed field, so recording a step costs about the size of the change rather than
+    of the form. Operations are recorded after they were applied to the form. Consecutive changes of the
+    same attribute in quick succession, like keystrokes in an input, are coalesced into one step.
+    """
+
+    def __init__(self, form: Form, max_depth: int = 100, coalesce_interval: float = 1.0):
+        """Initializes an empty history.
+
+        Args:
+            form: The form whose edits are recorded.
+            max_depth: Maximum number of steps that can be undone. The oldest steps are dropped first.
+            coalesce_interval: Maximum delay in seconds between two changes of the same attribute that
+                are coalesced into one step. 0 disables coalescing.
+
+        Raises:
+            ValueError: If max_depth is not positive or coalesce_interval is negative.
+        """
+        if max_depth <= 0:
+            raise ValueError("max_depth must be positive")
+        if coalesce_interval < 0:
+            raise ValueError("coalesce_interval must not be negative")
+        self.form = form
+        self.max_depth = max_depth
+        self.coalesce_interval = coalesce_interval
+        self._undo: Deque[List[Operation]] = deque(maxlen=max_depth)
+        self._redo: List[List[Operation]] = []
+        self._transaction: Optional[List[Operation]] = None
+        # Time of the last change of the latest step, while further changes may be coalesced into it
+        self._coalesce_time: Optional[float] = None
+
+    @property
+    def can_undo(self) -> bool:
+        """Whether there is a step to undo."""
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        """Whether there is an undone step to redo."""
+        return bool(self._redo)
+
+    def record(self, operation: Operation) -> None:
+        """Records an operation that was applied to the form, and discards the undone steps.
+
+        Args:
+            operation: The operation. Inside a transaction, it is added to the step of the transaction.
+        """
+        self._redo.clear()
+        if self._transaction is not None:
+            self._transaction.append(operation)
+            return
+
+        now = time.monotonic()
+        if isinstance(operation, SetAttribute) and self._can_coalesce(operation, now):
+            # Keeps the value before the first change of the step
+            self._undo[-1][0] = self._undo[-1][0]._replace(new=operation.new)
+            self._coalesce_time = now
+            return
+        self._undo.append([operation])
+        self._coalesce_time = now if isinstance(operation, SetAttribute) else None
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Groups the operations recorded within the context into a single step, e.g. of a bulk edit.
+
+        Nested transactions are part of the outermost one. Nothing is recorded if no operation was.
+
+        Yields:
+            None.
+        """
+        if self._transaction is not None:
+            yield
+            return
+        self._transaction = []
+        try:
+            yield
+        finally:
+            operations, self._transaction = self._transaction, None
+            if operations:
+                self._undo.append(operations)
+                self._coalesce_time = None
+
+    def undo(self) -> Optional[List[Operation]]:
+        """Reverts the latest step.
+
+        Returns:
+            The operations of the step, or None if there is nothing to undo.
+        """
+        if not self._undo:
+            return None
+        operations = self._undo.pop()
+        for operation in reversed(operations):
+            operation.undo(self.form)
+        self._redo.append(operations)
+        self._coalesce_time = None
+        return operations
+
+    def redo(self) -> Optional[List[Operation]]:
+        """Applies the latest undone step again.
+
+        Returns:
+            The operations of the step, or None if there is nothing to redo.
+        """
+        if not self._redo:
+            return None
+        operations = self._redo.pop()
+        for operation in operations:
+            operation.redo(self.form)
+        self._undo.append(operations)
+        self._coalesce_time = None
+        return operations
+
+    def clear(self) -> None:
+        """Discards all steps."""
+        self._undo.clear()
+        self._redo.clear()
+        self._coalesce_time = None
+
+    def _can_coalesce(self, operation: SetAttribute, now: float) -> bool:
+        if self._coalesce_time is None or now - self._coalesce_time > self.coalesce_interval:
+            return False
+        last = self._undo[-1]
+        return (
+            len(last) == 1
+            and isinstance(last[0], SetAttribute)
+            and last[0].target is operation.target
+            and last[0].key == operation.key
+        )
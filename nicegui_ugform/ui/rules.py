@@ -0,0 +1,168 @@
+"""Client-side validation rules compiled from field constraints."""
+
+import json
+from typing import Callable, List, Optional
+
+from ..core.fields import BaseFormField, FloatField, IntegerField, TextField, ValidationResultType
+
+MessageFunction = Callable[[ValidationResultType], Optional[str]]
+
+# Escapes of Python regular expressions that JavaScript lacks or reads differently
+_UNSUPPORTED_ESCAPES = frozenset("AZN")
+# Members of the Unicode classes of Python, for JavaScript patterns with the "u" flag. Characters
+# assigned in Unicode versions newer than the one of Python may still differ.
+_WORD = r"\p{L}\p{N}_"
+_SPACE = r"\t-\r\x1c-\x20\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000"
+_DIGIT = r"\p{Nd}"
+# Replacements of escapes outside of character classes
+_ESCAPES = {
+    "w": f"[{_WORD}]",
+    "W": f"[^{_WORD}]",
+    "d": _DIGIT,
+    "D": r"\P{Nd}",
+    "s": f"[{_SPACE}]",
+    "S": f"[^{_SPACE}]",
+    "b": f"(?:(?<=[{_WORD}])(?![{_WORD}])|(?<![{_WORD}])(?=[{_WORD}]))",
+    "B": f"(?:(?<=[{_WORD}])(?=[{_WORD}])|(?<![{_WORD}])(?![{_WORD}]))",
+}
+# Replacements of escapes within character classes, where negated classes cannot be expressed
+_CLASS_ESCAPES = {"w": _WORD, "d": _DIGIT, "D": r"\P{Nd}", "s": _SPACE, "W": None, "S": None}
+# Python matches "$" before a trailing newline too, and "." anything but a newline
+_ANCHOR_END = r"(?=\n?$)"
+_ANY = r"[^\n]"
+# Inline flags, comments and conditionals of Python regular expressions
+_UNSUPPORTED_GROUP_PREFIXES = frozenset("aiLmsux-#(")
+
+
+def compile_rules(field: BaseFormField, message: MessageFunction, delay: int = 0) -> Optional[str]:
+    """Compiles the constraints of a field into Quasar validation rules, run by the browser.
+
+    The rules check the same conditions, in the same order, as the validator of the field, so the user
+    sees the same messages as from server-side validation without a round-trip per keystroke. Regular
+    expressions are matched at the start of the value, like `re.match`. Patterns using syntax that
+    JavaScript does not share are left to the server.
+
+    Args:
+        field: The field.
+        message: Function giving the message of a validation result.
+        delay: If positive, the rules resolve this many milliseconds after a change. Quasar ignores the
+            results of earlier changes, so only the latest value is reported.
+
+    Returns:
+        A JavaScript expression of the rules array, for the `:rules` property, or None if the field type
+        has no client-side rules.
+    """
+    if isinstance(field, TextField):
+        checks = [f"if (typeof v !== 'string') return {_js(message(ValidationResultType.invalid_type))}"]
+        if field.min_length is not None or field.max_length is not None:
+            # Count code points, as Python does
+            checks.append("const length = [...v].length")
+        if field.min_length is not None:
+            checks.append(f"if (length < {field.min_length}) return {_js(message(ValidationResultType.too_short))}")
+        if field.max_length is not None:
+            checks.append(f"if (length > {field.max_length}) return {_js(message(ValidationResultType.to_long))}")
+        pattern = js_pattern(field.regex) if field.regex is not None else None
+        prelude = ""
+        if pattern is not None:
+            # Sticky matching anchors the pattern at the start of the value only
+            prelude = f"let re = null; try {{ re = new RegExp({_js(pattern)}, 'yu') }} catch (e) {{}} "
+            checks.append(
+                "if (re !== null) { re.lastIndex = 0; if (!re.test(v)) "
+                f"return {_js(message(ValidationResultType.regex_mismatch))} }}"
+            )
+        return _rules(field, "v === null || v === undefined", prelude, checks, message, delay)
+
+    if isinstance(field, (IntegerField, FloatField)):
+        invalid = _js(message(ValidationResultType.invalid_type))
+        checks = ["const n = Number(v)", f"if (Number.isNaN(n)) return {invalid}"]
+        if isinstance(field, IntegerField):
+            checks.append(f"if (!Number.isInteger(n)) return {invalid}")
+        if field.min_value is not None:
+            checks.append(f"if (n < {_js(field.min_value)}) return {_js(message(ValidationResultType.too_small))}")
+        if field.max_value is not None:
+            checks.append(f"if (n > {_js(field.max_value)}) return {_js(message(ValidationResultType.too_large))}")
+        return _rules(field, "v === null || v === undefined || v === ''", "", checks, message, delay)
+
+    return None
+
+
+def js_pattern(pattern: str) -> Optional[str]:
+    """Converts a Python regular expression to a JavaScript one with the same meaning.
+
+    The result is meant for the "u" flag. Named groups are rewritten to the JavaScript syntax, and the
+    constructs whose meaning differs are replaced: `\\w`, `\\d`, `\\s`, `\\b` and their negations follow
+    Unicode as in Python, `$` also matches before a trailing newline and `.` matches anything but a
+    newline. Other constructs are kept as they are, since the common syntax of both is the same.
+
+    Args:
+        pattern: The Python regular expression.
+
+    Returns:
+        The JavaScript regular expression source, or None if the pattern uses syntax of Python that
+        JavaScript does not have, such as `\\A`, `\\Z` or inline flags.
+    """
+    result: List[str] = []
+    i = 0
+    in_class = False
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escaped = pattern[i + 1 : i + 2]
+            if escaped in _UNSUPPORTED_ESCAPES:
+                return None
+            replacement = (_CLASS_ESCAPES if in_class else _ESCAPES).get(escaped, pattern[i : i + 2])
+            if replacement is None:
+                return None
+            result.append(replacement)
+            i += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # A leading "]" is a literal in Python but closes the class in JavaScript
+            start = i + 2 if pattern[i + 1 : i + 2] == "^" else i + 1
+            if pattern[start : start + 1] == "]":
+                return None
+        elif pattern.startswith("(?P<", i):
+            result.append("(?<")
+            i += 4
+            continue
+        elif pattern.startswith("(?P=", i):
+            end = pattern.find(")", i)
+            if end < 0:
+                return None
+            result.append(f"\\k<{pattern[i + 4 : end]}>")
+            i = end + 1
+            continue
+        elif pattern.startswith("(?", i) and pattern[i + 2 : i + 3] in _UNSUPPORTED_GROUP_PREFIXES:
+            return None
+        elif pattern.startswith("(?>", i) or (char == "+" and pattern[i - 1 : i] in ("*", "+", "?", "}")):
+            # Atomic groups and possessive quantifiers
+            return None
+        elif char == "$":
+            result.append(_ANCHOR_END)
+            i += 1
+            continue
+        elif char == ".":
+            result.append(_ANY)
+            i += 1
+            continue
+        result.append(char)
+        i += 1
+    return "".join(result)
+
+
+def _rules(
+    field: BaseFormField, empty: str, prelude: str, checks: List[str], message: MessageFunction, delay: int
+) -> str:
+    missing = _js(message(ValidationResultType.required_missing)) if field.required else "true"
+    body = "; ".join([f"if ({empty}) return {missing}", *checks, "return true"])
+    rule = f"v => {{ {body} }}"
+    if delay > 0:
+        rule = f"(check => v => new Promise(resolve => setTimeout(() => resolve(check(v)), {delay})))({rule})"
+    return f"[(() => {{ {prelude}return {rule} }})()]"
+
+
+def _js(value: object) -> str:
+    return json.dumps(value, ensure_ascii=False)
@@ -0,0 +1,115 @@
+"""Substring search over the texts of form fields."""
+
+from typing import Dict, Hashable, Iterable, Optional, Set, Tuple
+
+# Longest n-grams kept in the index. Longer terms are looked up by their n-grams of this length.
+_GRAM_LENGTH = 3
+
+
+class FieldIndex:
+    """Index of the texts of fields, such as their names and labels, for substring search.
+
+    Every n-gram of up to three characters of the texts is mapped to the keys of the fields containing
+    it. Terms of up to three characters are answered by a single lookup, and longer terms by the
+    intersection of the keys of their trigrams, verified against the texts of the few remaining fields.
+    Updating a field only touches the n-grams of its own texts.
+    """
+
+    def __init__(self):
+        """Initializes an empty index."""
+        self._texts: Dict[Hashable, Tuple[str, ...]] = {}
+        self._grams: Dict[str, Set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._texts
+
+    def update(self, key: Hashable, texts: Iterable[Optional[str]]) -> None:
+        """Adds a field to the index, or replaces its texts.
+
+        Args:
+            key: The key of the field, e.g. its identity.
+            texts: The texts of the field. None and empty texts are skipped.
+        """
+        self.remove(key)
+        folded = tuple(text.casefold() for text in texts if text)
+        self._texts[key] = folded
+        for gram in _grams_of(folded):
+            self._grams.setdefault(gram, set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Removes a field from the index. Unknown keys are ignored.
+
+        Args:
+            key: The key of the field.
+        """
+        texts = self._texts.pop(key, None)
+        if texts is None:
+            return
+        for gram in _grams_of(texts):
+            keys = self._grams[gram]
+            keys.discard(key)
+            if not keys:
+                del self._grams[gram]
+
+    def search(self, query: str) -> Set[Hashable]:
+        """Finds the fields matching a query, ignoring case.
+
+        Args:
+            query: Whitespace-separated terms. A field matches if each term is contained in one of its
+                texts.
+
+        Returns:
+            The keys of the matching fields, or of all fields if the query has no terms.
+        """
+        terms = query.casefold().split()
+        if not terms:
+            return set(self._texts)
+        # Long terms are the most selective, so the candidates shrink fastest
+        result: Optional[Set[Hashable]] = None
+        for term in sorted(terms, key=len, reverse=True):
+            matches = self._search_term(term, result)
+            result = matches if result is None else result & matches
+            if not result:
+                break
+        return result or set()
+
+    def matches(self, key: Hashable, query: str) -> bool:
+        """Checks whether a single field matches a query, as by `search`.
+
+        Args:
+            key: The key of the field.
+            query: Whitespace-separated terms.
+
+        Returns:
+            True if the field is indexed and each term is contained in one of its texts.
+        """
+        texts = self._texts.get(key)
+        if texts is None:
+            return False
+        return all(any(term in text for text in texts) for term in query.casefold().split())
+
+    def _search_term(self, term: str, candidates: Optional[Set[Hashable]]) -> Set[Hashable]:
+        if len(term) <= _GRAM_LENGTH:
+            return set(self._grams.get(term, ()))
+        keys = candidates
+        for i in range(len(term) - _GRAM_LENGTH + 1):
+            postings = self._grams.get(term[i : i + _GRAM_LENGTH])
+            if not postings:
+                return set()
+            keys = set(postings) if keys is None else keys & postings
+            if not keys:
+                return set()
+        assert keys is not None
+        # The trigrams may occur apart from each other, or in different texts
+        return {key for key in keys if any(term in text for text in self._texts[key])}
+
+
+def _grams_of(texts: Iterable[str]) -> Set[str]:
+    grams = set()
+    for text in texts:
+        for n in range(1, _GRAM_LENGTH + 1):
+            grams.update(text[i : i + n] for i in range(len(text) - n + 1))
+    return grams
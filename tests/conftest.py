@@ -0,0 +1,33 @@
+"""Shared fixtures of the tests."""
+
+import pytest
+from nicegui_ugform import BooleanField, FloatField, Form, IntegerField, TextField
+from nicegui_ugform.core import batch
+from nicegui_ugform.data import stats
+
+pytest_plugins = ["nicegui.testing.user_plugin"]
+
+
+@pytest.fixture
+def form() -> Form:
+    """A form with a required name, an age, a height and a subscription, without constraints."""
+    return Form(
+        title="Test",
+        fields=[
+            TextField(name="name", label="Name", required=True),
+            IntegerField(name="age", label="Age"),
+            FloatField(name="height", label="Height"),
+            BooleanField(name="subscribe", label="Subscribe"),
+        ],
+    )
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Runs a test with NumPy, if installed, and with the pure Python fallbacks."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(batch, "np", None)
+        monkeypatch.setattr(stats, "np", None)
+    return request.param
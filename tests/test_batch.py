@@ -0,0 +1,113 @@
+"""Tests for batch validation."""
+
+import random
+
+import pytest
+from nicegui_ugform import Form
+from nicegui_ugform.core.fields import ValidationResultType
+
+
+@pytest.fixture
+def form(form: Form) -> Form:
+    """The shared form, with a name of 2 to 5 lowercase letters, an age from 0 to 120 and a required height."""
+    name, age, height, _ = form.fields
+    name.min_length, name.max_length, name.regex = 2, 5, r"[a-z]+$"
+    age.min_value, age.max_value = 0, 120
+    height.required, height.min_value, height.max_value = True, 0.5, 3
+    return form
+
+
+def make_records(count: int) -> list:
+    rng = random.Random(42)
+    pools = {
+        "name": [None, "", "a", "ab", "abcde", "abcdef", "Ab", "ab1", 12],
+        "age": [None, -1, 0, 50, 120, 121, 2**70, 1.5, "30", True],
+        "height": [None, 0.1, 0.5, 1, 1.75, 3.0, 3.5, "1.7"],
+        "subscribe": [None, True, False, 1],
+    }
+    return [{name: rng.choice(pool) for name, pool in pools.items()} for _ in range(count)]
+
+
+class TestValidateBatch:
+    """Tests for Form.validate_batch."""
+
+    def test_matches_single_validation(self, form, backend):
+        records = make_records(500)
+        result = form.validate_batch(records)
+
+        assert result.size == 500
+        assert result.names == ("name", "age", "height", "subscribe")
+        for index, record in enumerate(records):
+            form.load_data(record)
+            assert result.record(index) == form.validate_and_dump().results
+
+    def test_uniform_columns(self, form, backend):
+        columns = {
+            "name": ["abc", None, "abcdefg"],
+            "age": [10, 200, None],
+            "height": [1.0, 2, 5.0],
+        }
+        result = form.validate_batch(columns=columns)
+
+        assert result.column("name") == [
+            ValidationResultType.okay,
+            ValidationResultType.required_missing,
+            ValidationResultType.to_long,
+        ]
+        assert result.column("age") == [
+            ValidationResultType.okay,
+            ValidationResultType.too_large,
+            ValidationResultType.okay,
+        ]
+        assert result.column("height")[2] == ValidationResultType.too_large
+        assert result.column("subscribe") == [ValidationResultType.okay] * 3
+        assert result.invalid_indices() == [1, 2]
+
+    def test_numpy_columns(self, form):
+        np = pytest.importorskip("numpy")
+        columns = {
+            "name": ["abc"] * 4,
+            "age": np.array([-5, 0, 120, 121]),
+            "height": np.array([0.4, 1.0, 3.0, np.nan]),
+        }
+        result = form.validate_batch(columns=columns)
+
+        assert isinstance(result.codes[1], np.ndarray)
+        assert result.column("age") == [
+            ValidationResultType.too_small,
+            ValidationResultType.okay,
+            ValidationResultType.okay,
+            ValidationResultType.too_large,
+        ]
+        assert result.invalid_indices() == [0, 3]
+
+    def test_invalid_arguments(self, form):
+        with pytest.raises(ValueError):
+            form.validate_batch()
+        with pytest.raises(ValueError):
+            form.validate_batch(records=[], columns={})
+        with pytest.raises(ValueError):
+            form.validate_batch(columns={"name": ["a"], "age": [1, 2]})
+
+
+class TestValidateBatchParallel:
+    """Tests for Form.validate_batch_parallel."""
+
+    def test_matches_serial_validation(self, form):
+        records = make_records(1000)
+        expected = form.validate_batch(records)
+
+        result = form.validate_batch_parallel(iter(records), chunk_size=64, max_workers=2)
+        assert result.names == expected.names
+        assert result.size == 1000
+        assert [list(codes) for codes in result.codes] == [list(codes) for codes in expected.codes]
+
+    def test_empty(self, form):
+        result = form.validate_batch_parallel([], max_workers=1)
+        assert result.size == 0
+        assert result.names == ("name", "age", "height", "subscribe")
+        assert result.invalid_indices() == []
+
+    def test_invalid_chunk_size(self, form):
+        with pytest.raises(ValueError):
+            form.validate_batch_parallel([], chunk_size=0)
@@ -0,0 +1,93 @@
+"""Tests for the schema cache."""
+
+import threading
+
+import pytest
+from nicegui_ugform import Form, SchemaCache
+
+
+class TestSchemaCache:
+    """Tests for SchemaCache."""
+
+    def test_hit_and_miss(self, form):
+        cache = SchemaCache()
+        payload = form.dump_schema_b64()
+
+        form1 = Form.load_schema_b64(payload, cache=cache)
+        form2 = Form.load_schema_b64(payload, cache=cache)
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+        # Every load gets an independent editable form
+        assert form1 is not form2
+        assert form1.fields[0] is not form2.fields[0]
+        form1.fields[0].label = "Changed"
+        form1.fields[0].set_value("john")
+        assert form2.fields[0].label == "Name"
+        assert form2.fields[0].get_value() is None
+        assert Form.load_schema_b64(payload, cache=cache).fields[0].label == "Name"
+
+    def test_binary_payload(self, form):
+        cache = SchemaCache()
+        payload = form.dump_schema_bin()
+
+        schema = cache.load_schema(payload)
+        assert cache.load_schema(payload) is schema
+        assert Form.load_schema_bin(payload, cache=cache).dump_schema() == Form.load_schema_bin(payload).dump_schema()
+
+    def test_eviction(self, form):
+        cache = SchemaCache(maxsize=2)
+        payloads = []
+        for i in range(3):
+            form.title = f"Form {i}"
+            payloads.append(form.dump_schema_b64())
+
+        cache.load_schema(payloads[0])
+        cache.load_schema(payloads[1])
+        cache.load_schema(payloads[0])
+        cache.load_schema(payloads[2])
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 3, 1, 2)
+        cache.load_schema(payloads[0])
+        assert cache.stats().hits == 2
+
+        cache.clear()
+        assert cache.stats() == (0, 0, 0, 0, 2)
+
+    def test_invalid_payload_not_cached(self):
+        cache = SchemaCache()
+        with pytest.raises(ValueError):
+            cache.load_schema(b"UGFS")
+        assert cache.stats().size == 0
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            SchemaCache(maxsize=0)
+
+    def test_concurrent_loads(self, form):
+        cache = SchemaCache(maxsize=4)
+        payloads = []
+        for i in range(8):
+            form.title = f"Form {i}"
+            payloads.append(form.dump_schema_b64())
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(20):
+                    for payload in payloads:
+                        assert cache.load_form(payload).title.startswith("Form")
+            except Exception as e:  # pragma: no cover
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        assert not errors
+        assert stats.size <= 4
+        assert stats.hits + stats.misses == 4 * 20 * 8
@@ -0,0 +1,297 @@
+"""Tests for the form display."""
+
+import asyncio
+
+import pytest
+from nicegui import ui
+from nicegui.testing import User
+from nicegui.testing.user_interaction import UserInteraction
+from nicegui_ugform import Form, FormDisplay, TextField
+
+
+class TestFormDisplayState:
+    """Tests for the initial state of FormDisplay."""
+
+    def test_form_values(self, form):
+        form.load_data({"name": "loaded", "age": 0, "subscribe": False})
+        display = FormDisplay(form)
+        assert display.state.values == ["loaded", 0, None, False]
+        assert display.state.schema is form.freeze()
+
+    def test_form_defaults(self, form):
+        form.get_field("name").default_value = "default"
+        form.get_field("age").default_value = 5
+        assert FormDisplay(form).state.values == ["default", 5, None, None]
+
+    def test_schema_defaults(self, form):
+        form.get_field("age").default_value = 5
+        form.load_data({"name": "loaded", "age": 1, "subscribe": False})
+        assert FormDisplay(form.freeze()).state.values == [None, 5, None, None]
+
+    def test_given_state(self, form):
+        state = form.new_state()
+        state.set_value("name", "mine")
+        assert FormDisplay(form, state=state).state is state
+
+
+async def show_display(user: User, form, **kwargs) -> FormDisplay:
+    displays = []
+
+    @ui.page("/")
+    def page():
+        display = FormDisplay(form, on_submit=lambda: ui.notify("Submitted"), **kwargs)
+        display.render()
+        displays.append(display)
+
+    await user.open("/")
+    return displays[0]
+
+
+class TestFormDisplaySubmit:
+    """Tests for the submission of FormDisplay."""
+
+    async def test_form_is_not_updated(self, user: User, form):
+        form.load_data({"name": "prefilled"})
+        display = await show_display(user, form)
+        user.find("Age").type("30")
+        user.find("Submit").click()
+        await user.should_see("Submitted")
+
+        assert display.state.dump_data() == {"name": "prefilled", "age": 30, "height": None, "subscribe": False}
+        assert form.get_field("age").get_value() is None
+        assert FormDisplay(form).state.values == ["prefilled", None, None, None]
+
+    async def test_update_form(self, user: User, form):
+        display = await show_display(user, form, update_form=True)
+        user.find("Name *").type("John")
+        user.find("Submit").click()
+        await user.should_see("Submitted")
+
+        assert form.get_field("name").get_value() == "John"
+        assert form.dump_data() == display.state.dump_data()
+
+    def test_update_schema(self, form):
+        with pytest.raises(ValueError):
+            FormDisplay(form.freeze(), update_form=True)
+
+
+def listeners(element, event: str) -> list:
+    return [listener for listener in element._event_listeners.values() if listener.type == event]
+
+
+class TestValidationTriggers:
+    """Tests for the validation triggers of FormDisplay."""
+
+    async def test_client_triggers(self, user: User, form):
+        await show_display(user, form, validation_trigger="blur", field_triggers={"age": 200, "height": "submit"})
+        name, age, height = input_of(user, "Name *"), input_of(user, "Age"), input_of(user, "Height")
+
+        # Rules run only when the input loses focus, by a handler in the browser
+        assert name.props["lazy-rules"] == "ondemand"
+        (blur,) = listeners(name, "blur")
+        assert blur.handler is None and f"runMethod({name.id}, 'validate'" in blur.js_handler
+        assert "setTimeout" in age.props[":rules"] and "lazy-rules" not in age.props
+        assert ":rules" not in height.props
+
+    async def test_server_blur(self, user: User, form):
+        form.get_field("name").min_length = 3
+        await show_display(user, form, client_validation=False, validation_trigger="blur")
+        user.find("Name *").type("ab")
+        assert input_of(user, "Name *").error is None
+
+        user.find("Name *").trigger("blur")
+        assert input_of(user, "Name *").error == "Input too short (min length is 3)"
+        user.find("Name *").type("c")
+        assert input_of(user, "Name *").error is None
+        user.find("Name *").trigger("blur")
+        assert input_of(user, "Name *").error is None
+
+    async def test_server_debounce(self, user: User, form):
+        form.get_field("name").min_length = 3
+        display = await show_display(user, form, client_validation=False, validation_trigger=50)
+        user.find("Name *").type("a")
+        user.find("Name *").type("b")
+        assert list(display._pending_validations) == ["name"]
+        assert input_of(user, "Name *").error is None
+
+        await asyncio.sleep(0.1)
+        assert input_of(user, "Name *").error == "Input too short (min length is 3)"
+
+        # Newer input drops the outdated validation
+        user.find("Name *").type("c")
+        user.find("Name *").clear()
+        user.find("Name *").type("abc")
+        await asyncio.sleep(0.1)
+        assert not display._pending_validations
+        assert input_of(user, "Name *").error is None
+
+    async def test_server_submit(self, user: User, form):
+        form.get_field("name").min_length = 3
+        await show_display(user, form, client_validation=False, validation_trigger="submit")
+        user.find("Name *").type("ab")
+        user.find("Name *").trigger("blur")
+        assert input_of(user, "Name *").error is None
+
+        user.find("Submit").click()
+        await user.should_see("Please fix validation errors")
+        assert input_of(user, "Name *").error == "Input too short (min length is 3)"
+
+    @pytest.mark.parametrize("trigger", ["focus", 0, -5, True, 1.5])
+    def test_invalid_trigger(self, form, trigger):
+        with pytest.raises(ValueError):
+            FormDisplay(form, validation_trigger=trigger)
+        with pytest.raises(ValueError):
+            FormDisplay(form, field_triggers={"name": trigger})
+
+    def test_unknown_field_trigger(self, form):
+        with pytest.raises(ValueError, match="nonexistent"):
+            FormDisplay(form, field_triggers={"nonexistent": "blur"})
+
+
+def make_long_form() -> Form:
+    return Form(
+        title="Long", fields=[TextField(name=f"f{i}", label=f"Field {i:02d}", required=i == 42) for i in range(50)]
+    )
+
+
+def input_of(user: User, label: str):
+    (input_elem,) = user.find(label).elements
+    return input_elem
+
+
+class TestRenderModes:
+    """Tests for the lazy and paged render modes of FormDisplay."""
+
+    async def test_paged_values_survive_page_switches(self, user: User):
+        display = await show_display(user, make_long_form(), render_mode="paged", page_size=10)
+        await user.should_see("Page 1 of 5")
+        await user.should_not_see("Field 10")
+        user.find("Field 03").type("three")
+
+        user.find("Next").click()
+        await user.should_see("Page 2 of 5")
+        await user.should_not_see("Field 03")
+        assert display.state.get_value("f3") == "three"
+        user.find("Field 12").type("twelve")
+
+        user.find("Previous").click()
+        await user.should_see("Page 1 of 5")
+        assert input_of(user, "Field 03").value == "three"
+        assert display.state.get_value("f12") == "twelve"
+
+    async def test_paged_hidden_required_field_blocks_submission(self, user: User):
+        display = await show_display(user, make_long_form(), render_mode="paged", page_size=10)
+        user.find("Field 03").type("three")
+        user.find("Submit").click()
+
+        # Shows the page of the first invalid field
+        await user.should_see("Page 5 of 5")
+        await user.should_see("Please fix validation errors")
+        await user.should_not_see("Submitted")
+        assert input_of(user, "Field 42 *").error == "This field is required"
+
+        user.find("Field 42 *").type("x")
+        user.find("Submit").click()
+        await user.should_see("Submitted")
+        assert display.state.get_value("f3") == "three"
+        assert display.state.get_value("f42") == "x"
+
+    async def test_lazy_renders_blocks_in_view(self, user: User):
+        display = await show_display(user, make_long_form(), render_mode="lazy", page_size=10)
+        await user.should_not_see("Field 00")
+        placeholders = list(display._placeholders)
+        assert len(placeholders) == 5
+
+        UserInteraction(user, {placeholders[1]}, None).trigger("visibility", False)
+        await user.should_not_see("Field 10")
+        UserInteraction(user, {placeholders[1]}, None).trigger("visibility", True)
+        await user.should_see("Field 10")
+        await user.should_not_see("Field 00")
+        assert len(display._placeholders) == 4
+
+    async def test_lazy_hidden_required_field_blocks_submission(self, user: User):
+        display = await show_display(user, make_long_form(), render_mode="lazy", page_size=10)
+        display.state.set_value("f3", "three")
+        user.find("Submit").click()
+
+        # Renders the block of the invalid field only
+        await user.should_see("Field 42 *")
+        await user.should_not_see("Submitted")
+        await user.should_not_see("Field 00")
+        assert input_of(user, "Field 42 *").error == "This field is required"
+
+        user.find("Field 42 *").type("x")
+        user.find("Submit").click()
+        await user.should_see("Submitted")
+        assert display.state.dump_data()["f3"] == "three"
+
+
+class TestSetValuesAndReset:
+    """Tests for setting the values of FormDisplay at once and resetting them."""
+
+    async def test_partial_update(self, user: User, form):
+        display = await show_display(user, form)
+        display.set_values({"name": "kept", "age": 1})
+        display.set_values({"age": 30, "height": 1.8})
+
+        assert display.state.values == ["kept", 30, 1.8, None]
+        assert input_of(user, "Name *").value == "kept"
+        assert input_of(user, "Age").value == 30
+        assert input_of(user, "Height").value == 1.8
+
+    async def test_unknown_name(self, user: User, form):
+        display = await show_display(user, form)
+        with pytest.raises(KeyError):
+            display.set_values({"age": 30, "nonexistent": 1})
+        assert display.state.values == [None, None, None, None]
+        assert input_of(user, "Age").value is None
+
+    async def test_invalid_values(self, user: User, form, monkeypatch):
+        form.get_field("name").min_length = 3
+        display = await show_display(user, form, client_validation=False)
+        validated = []
+        validate = display._validate_internal
+        monkeypatch.setattr(display, "_validate_internal", lambda f, v: validated.append(f.name) or validate(f, v))
+
+        display.set_values({"name": "ab", "age": 30})
+        assert sorted(validated) == ["age", "name"]
+        assert input_of(user, "Name *").error == "Input too short (min length is 3)"
+        assert input_of(user, "Age").error is None
+
+    async def test_invalid_values_blur_trigger(self, user: User, form):
+        form.get_field("name").min_length = 3
+        display = await show_display(user, form, client_validation=False, validation_trigger="blur")
+        display.set_values({"name": "ab"})
+        assert input_of(user, "Name *").error is None
+
+        user.find("Submit").click()
+        await user.should_see("Please fix validation errors")
+        assert input_of(user, "Name *").error == "Input too short (min length is 3)"
+
+    async def test_reset(self, user: User, form):
+        form.get_field("name").min_length = 3
+        form.get_field("age").default_value = 5
+        form.load_data({"name": "loaded"})
+        display = await show_display(user, form)
+        display.set_values({"name": "ab", "age": 30, "subscribe": True})
+        user.find("Submit").click()
+        await user.should_see("Please fix validation errors")
+
+        display.reset()
+        assert display.state.values == [None, 5, None, None]
+        assert input_of(user, "Name *").value == ""
+        assert input_of(user, "Name *").error is None
+        assert input_of(user, "Age").value == 5
+        assert input_of(user, "Subscribe").value is False
+        assert form.get_field("name").get_value() == "loaded"
+
+    async def test_reset_button_updates_form(self, user: User, form):
+        form.get_field("age").default_value = 5
+        form.load_data({"name": "loaded", "age": 30})
+        display = await show_display(user, form, update_form=True)
+        user.find("Reset").click()
+        await user.should_see("Form reset")
+
+        assert display.state.values == [None, 5, None, None]
+        assert form.get_field("name").get_value() is None
+        assert form.get_field("age").get_value() == 5
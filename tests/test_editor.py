@@ -0,0 +1,313 @@
+"""Tests for the form editor."""
+
+import pytest
+from nicegui import ui
+from nicegui.testing import User
+from nicegui_ugform import BooleanField, TextField
+from nicegui_ugform.i18n.locale_en import TRANSLATIONS
+from nicegui_ugform.ui.form_editor import FormEditor
+
+
+@pytest.fixture
+def editor(form) -> FormEditor:
+    """A grid editor of the shared form, which is not rendered, as the grid editing needs no page."""
+    return FormEditor(form, editor_locale="en", layout="grid")
+
+
+class TestGridRow:
+    def test_rows_of_each_kind(self, form, editor):
+        name, age, height, _ = form.fields
+        name.min_length, name.max_length, name.regex = 2, 5, r"[a-z]+$"
+        age.min_value, age.max_value = 0, 120
+        height.required = True
+        rows = {field.name: editor._grid_row(field) for field in form.fields}
+
+        assert rows["name"]["kind"] == "text"
+        assert (rows["name"]["min"], rows["name"]["max"], rows["name"]["regex"]) == (2, 5, r"[a-z]+$")
+        assert rows["name"]["key"] == str(id(form.get_field("name")))
+        assert (rows["age"]["kind"], rows["age"]["min"], rows["age"]["max"]) == ("number", 0, 120)
+        assert rows["height"]["required"] is True
+        assert (rows["subscribe"]["kind"], rows["subscribe"]["min"], rows["subscribe"]["max"]) == (
+            "boolean",
+            None,
+            None,
+        )
+        assert rows["subscribe"]["regex"] is None
+        assert rows["subscribe"]["description"] == ""
+        assert rows["age"]["label"] == "Age"
+
+
+class TestSetFieldProperty:
+    def test_texts_and_required(self, editor):
+        field = editor.form.get_field("name")
+
+        editor._set_field_property(field, "name", "  first ")
+        editor._set_field_property(field, "label", "First name")
+        editor._set_field_property(field, "description", "")
+        editor._set_field_property(field, "required", 0)
+
+        assert editor.form.get_field("first") is field
+        assert (field.label, field.description, field.required) == ("First name", None, False)
+
+    @pytest.mark.parametrize("name", ["", "   ", "age"])
+    def test_invalid_name(self, editor, name):
+        field = editor.form.get_field("name")
+
+        with pytest.raises(ValueError):
+            editor._set_field_property(field, "name", name)
+        assert field.name == "name"
+
+    def test_integer_bounds(self, editor):
+        text, age = editor.form.get_field("name"), editor.form.get_field("age")
+
+        editor._set_field_property(text, "max", 3.0)
+        editor._set_field_property(age, "min", 18)
+
+        assert text.max_length == 3 and isinstance(text.max_length, int)
+        assert age.min_value == 18 and isinstance(age.min_value, int)
+
+    @pytest.mark.parametrize("column", ["min", "max"])
+    @pytest.mark.parametrize("value", [2.5, -1, True, "3", float("nan")])
+    def test_invalid_length(self, editor, column, value):
+        field = editor.form.get_field("name")
+
+        with pytest.raises(ValueError):
+            editor._set_field_property(field, column, value)
+        assert (field.min_length, field.max_length) == (None, None)
+
+    def test_non_integer_bound_of_integer_field(self, editor):
+        field = editor.form.get_field("age")
+
+        with pytest.raises(ValueError):
+            editor._set_field_property(field, "max", 1.5)
+        assert field.max_value is None
+
+    def test_float_bounds(self, editor):
+        field = editor.form.get_field("height")
+
+        editor._set_field_property(field, "min", -0.5)
+        editor._set_field_property(field, "max", 2)
+
+        assert (field.min_value, field.max_value) == (-0.5, 2.0)
+        assert isinstance(field.max_value, float)
+
+    @pytest.mark.parametrize("name, column, value", [("name", "max", 1), ("name", "min", 6), ("age", "min", 121)])
+    def test_min_greater_than_max(self, editor, name, column, value):
+        text, age = editor.form.get_field("name"), editor.form.get_field("age")
+        text.min_length, text.max_length = 2, 5
+        age.min_value, age.max_value = 0, 120
+        field = editor.form.get_field(name)
+        before = editor._grid_row(field)
+
+        with pytest.raises(ValueError, match=TRANSLATIONS.minGreaterThanMax):
+            editor._set_field_property(field, column, value)
+        assert editor._grid_row(field) == before
+
+    def test_clear_bound(self, editor):
+        field = editor.form.get_field("age")
+        field.min_value, field.max_value = 0, 120
+
+        editor._set_field_property(field, "max", None)
+        editor._set_field_property(field, "min", 200)
+
+        assert (field.min_value, field.max_value) == (200, None)
+
+    def test_bounds_of_boolean_field_are_ignored(self, editor):
+        field = editor.form.get_field("subscribe")
+
+        editor._set_field_property(field, "min", 1)
+        editor._set_field_property(field, "regex", "x")
+
+        assert isinstance(field, BooleanField)
+        assert not editor.history.can_undo
+
+    def test_regex(self, editor):
+        field = editor.form.get_field("name")
+
+        editor._set_field_property(field, "regex", r"\d+")
+        with pytest.raises(ValueError):
+            editor._set_field_property(field, "regex", "[")
+        assert field.regex == r"\d+"
+
+        editor._set_field_property(field, "regex", "")
+        assert field.regex is None
+
+    def test_edits_are_undoable(self, editor):
+        field = editor.form.get_field("age")
+
+        editor._set_field_property(field, "min", 5)
+        editor.history.undo()
+
+        assert field.min_value is None
+
+
+async def show_editor(user: User, form, **kwargs) -> FormEditor:
+    editors = []
+
+    @ui.page("/")
+    def page():
+        editor = FormEditor(form, editor_locale="en", **kwargs)
+        editor.render()
+        editors.append(editor)
+
+    await user.open("/")
+    return editors[0]
+
+
+def expansions(editor: FormEditor) -> list:
+    return list(editor._fields_container.default_slot.children)
+
+
+def reused(editor: FormEditor, before: dict) -> bool:
+    return all(editor._field_editors.get(key) is field_editor for key, field_editor in before.items())
+
+
+class TestSyncFields:
+    """Tests for updating the field editors in place after the fields of the form changed."""
+
+    async def test_rename(self, user: User, form):
+        editor = await show_editor(user, form)
+        before = dict(editor._field_editors)
+        form.get_field("age").name = "years"
+        editor.sync_fields()
+
+        assert reused(editor, before) and len(editor._field_editors) == 4
+        await user.should_see("years")
+
+    async def test_reorder(self, user: User, form):
+        editor = await show_editor(user, form)
+        before = dict(editor._field_editors)
+        form.move_field(3, 0)
+        editor.sync_fields()
+
+        assert reused(editor, before) and len(editor._field_editors) == 4
+        assert expansions(editor) == [before[id(field)].expansion for field in form.fields]
+        assert not before[id(form.fields[0])].up_button.enabled
+        assert before[id(form.fields[3])].up_button.enabled and not before[id(form.fields[3])].down_button.enabled
+
+    async def test_insert(self, user: User, form):
+        editor = await show_editor(user, form)
+        before = dict(editor._field_editors)
+        form.insert_field(1, TextField(name="city", label="City"))
+        editor.sync_fields()
+
+        assert reused(editor, before) and len(editor._field_editors) == 5
+        assert expansions(editor) == [editor._field_editors[id(field)].expansion for field in form.fields]
+        await user.should_see("city")
+
+    async def test_remove(self, user: User, form):
+        editor = await show_editor(user, form)
+        before = dict(editor._field_editors)
+        age = form.get_field("age")
+        form.remove_field("age")
+        editor.sync_fields()
+
+        assert id(age) not in editor._field_editors
+        assert before[id(age)].expansion.is_deleted
+        before.pop(id(age))
+        assert reused(editor, before) and len(editor._field_editors) == 3
+        assert expansions(editor) == [before[id(field)].expansion for field in form.fields]
+
+
+def inputs_of(editor: FormEditor, field) -> dict:
+    body = editor._field_editors[id(field)].body
+    return {
+        element.props["label"]: element for element in body.descendants() if isinstance(element, (ui.input, ui.number))
+    }
+
+
+class TestToggleBody:
+    """Tests for building the properties editor of a field only when its expansion is opened."""
+
+    async def test_built_on_first_open(self, user: User, form):
+        editor = await show_editor(user, form)
+        name = form.get_field("name")
+        assert all(not field_editor.body.default_slot.children for field_editor in editor._field_editors.values())
+
+        editor._field_editors[id(name)].expansion.value = True
+        await user.should_see(TRANSLATIONS.regexPattern)
+        assert inputs_of(editor, name)[TRANSLATIONS.fieldName].value == "name"
+        assert not editor._field_editors[id(form.get_field("age"))].body.default_slot.children
+
+        # Kept when closed and opened again
+        properties = inputs_of(editor, name)
+        editor._field_editors[id(name)].expansion.value = False
+        editor._field_editors[id(name)].expansion.value = True
+        assert inputs_of(editor, name) == properties
+
+    async def test_edits_while_collapsed(self, user: User, form):
+        editor = await show_editor(user, form)
+        name = form.get_field("name")
+        editor._set_field_property(name, "label", "First name")
+        editor._set_field_property(name, "max", 5)
+        assert not editor._field_editors[id(name)].body.default_slot.children
+
+        editor._field_editors[id(name)].expansion.value = True
+        assert inputs_of(editor, name)[TRANSLATIONS.label].value == "First name"
+        assert inputs_of(editor, name)[TRANSLATIONS.maxLength].value == 5
+
+    async def test_unload_closed(self, user: User, form):
+        editor = await show_editor(user, form, unload_closed=True)
+        age = form.get_field("age")
+        editor._field_editors[id(age)].expansion.value = True
+        assert inputs_of(editor, age)
+
+        editor._field_editors[id(age)].expansion.value = False
+        assert not editor._field_editors[id(age)].body.default_slot.children
+        editor._set_field_property(age, "min", 18)
+        editor._field_editors[id(age)].expansion.value = True
+        assert inputs_of(editor, age)[TRANSLATIONS.minValue].value == 18
+
+
+class TestFieldProperties:
+    """Tests for the properties editor of a field, which checks values like the grid."""
+
+    async def open_properties(self, user: User, form, name: str) -> dict:
+        editor = await show_editor(user, form)
+        editor._field_editors[id(form.get_field(name))].expansion.value = True
+        return inputs_of(editor, form.get_field(name))
+
+    async def test_lengths(self, user: User, form):
+        inputs = await self.open_properties(user, form, "name")
+        field = form.get_field("name")
+
+        inputs[TRANSLATIONS.maxLength].value = 2.5
+        assert inputs[TRANSLATIONS.maxLength].error == TRANSLATIONS.invalidValueTemplate.format(TRANSLATIONS.maximum)
+        assert field.max_length is None
+
+        inputs[TRANSLATIONS.maxLength].value = 3
+        assert inputs[TRANSLATIONS.maxLength].error is None
+        assert field.max_length == 3
+
+        inputs[TRANSLATIONS.minLength].value = 5
+        assert inputs[TRANSLATIONS.minLength].error == TRANSLATIONS.minGreaterThanMax
+        assert field.min_length is None
+
+        inputs[TRANSLATIONS.minLength].value = 0
+        assert inputs[TRANSLATIONS.minLength].error is None
+        assert field.min_length == 0
+
+    async def test_integer_bounds(self, user: User, form):
+        inputs = await self.open_properties(user, form, "age")
+        field = form.get_field("age")
+
+        inputs[TRANSLATIONS.minValue].value = 1.5
+        assert inputs[TRANSLATIONS.minValue].error is not None
+        assert field.min_value is None
+
+        inputs[TRANSLATIONS.maxValue].value = 10
+        inputs[TRANSLATIONS.minValue].value = 11
+        assert inputs[TRANSLATIONS.minValue].error == TRANSLATIONS.minGreaterThanMax
+        assert (field.min_value, field.max_value) == (None, 10)
+
+    async def test_regex(self, user: User, form):
+        inputs = await self.open_properties(user, form, "name")
+        field = form.get_field("name")
+
+        inputs[TRANSLATIONS.regexPattern].value = "["
+        assert inputs[TRANSLATIONS.regexPattern].error is not None
+        assert field.regex is None
+
+        inputs[TRANSLATIONS.regexPattern].value = r"\d+"
+        assert inputs[TRANSLATIONS.regexPattern].error is None
+        assert field.regex == r"\d+"
@@ -0,0 +1,83 @@
+"""Tests for the export of submissions."""
+
+import csv
+import io
+import json
+
+import pytest
+from nicegui_ugform.data import SubmissionStore, export_columnar, export_csv, export_jsonl, iter_columnar
+from nicegui_ugform.data import export
+
+RECORDS = [
+    {"name": "John", "age": 30, "height": 1.8, "subscribe": True},
+    {"name": '张三, "Jr"', "age": None, "height": 2, "subscribe": False, "unknown": 1},
+    {"age": -(2**40)},
+]
+
+
+class TestExport:
+    """Tests for the CSV and JSON Lines exports."""
+
+    def test_csv(self, form):
+        output = io.StringIO(newline="")
+        assert export_csv(form, iter(RECORDS), output, header="label") == 3
+
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+        assert rows[0] == ["Name:string", "Age:integer", "Height:float", "Subscribe:boolean"]
+        assert rows[1] == ["John", "30", "1.8", "true"]
+        assert rows[2] == ['张三, "Jr"', "", "2", "false"]
+        assert rows[3] == ["", str(-(2**40)), "", ""]
+
+    def test_jsonl(self, form):
+        output = io.StringIO()
+        assert export_jsonl(form.freeze(), RECORDS, output) == 3
+
+        lines = output.getvalue().splitlines()
+        assert json.loads(lines[1]) == {"name": '张三, "Jr"', "age": None, "height": 2, "subscribe": False}
+        assert list(json.loads(lines[2])) == ["name", "age", "height", "subscribe"]
+
+    def test_submissions(self, form, tmp_path):
+        with SubmissionStore(tmp_path, form.uuid) as store:
+            form.load_data(RECORDS[0])
+            store.append(form)
+            output = io.StringIO()
+            export_jsonl(form, store.scan(), output)
+        assert json.loads(output.getvalue()) == RECORDS[0]
+
+
+class TestColumnarExport:
+    """Tests for the columnar export."""
+
+    def test_simple_format(self, form):
+        output = io.BytesIO()
+        assert export_columnar(form, RECORDS * 3, output, batch_size=4, arrow=False) == 9
+        output.seek(0)
+
+        batches = list(iter_columnar(output))
+        assert [len(batch["name"]) for batch in batches] == [4, 4, 1]
+        assert batches[0]["name"] == ["John", '张三, "Jr"', None, "John"]
+        assert batches[0]["age"] == [30, None, -(2**40), 30]
+        assert batches[0]["height"] == [1.8, 2.0, None, 1.8]
+        assert batches[0]["subscribe"] == [True, False, None, True]
+
+    def test_arrow(self, form):
+        pa = pytest.importorskip("pyarrow")
+        output = io.BytesIO()
+        assert export_columnar(form, RECORDS, output, batch_size=2) == 3
+        output.seek(0)
+
+        table = pa.ipc.open_stream(output).read_all()
+        assert table.schema.types == [pa.string(), pa.int64(), pa.float64(), pa.bool_()]
+        assert table.column("age").to_pylist() == [30, None, -(2**40)]
+
+    def test_arrow_unavailable(self, form, monkeypatch):
+        monkeypatch.setattr(export, "pa", None)
+        with pytest.raises(ValueError, match="PyArrow"):
+            export_columnar(form, RECORDS, io.BytesIO(), arrow=True)
+
+    @pytest.mark.parametrize("arrow", [False, True])
+    def test_type_mismatch(self, form, arrow):
+        if arrow:
+            pytest.importorskip("pyarrow")
+        with pytest.raises(ValueError, match="typed"):
+            export_columnar(form, [{"age": "30"}], io.BytesIO(), arrow=arrow)
@@ -1,7 +1,10 @@
 """Tests for field types and validation."""
 
+import copy
+
 import pytest
-from nicegui_ugform import TextField, IntegerField, FloatField, BooleanField
+from nicegui_ugform import Form, TextField, IntegerField, FloatField, BooleanField
+from nicegui_ugform.core.fields import BaseFormField, ValidationResultType
 
 
 class TestTextField:
@@ -153,3 +156,72 @@ class TestBooleanField:
         data = field.to_dict()
         assert data["type"] == "BooleanField"
         assert data["default_value"] is False
+
+
+class TestCompiledValidator:
+    """Tests for compiled field validators."""
+
+    def test_cached(self):
+        field = TextField(name="email", label="Email", regex=r"^[a-z]+@[a-z]+\.[a-z]+$")
+        validator = field.compile()
+        assert field.compile() is validator
+        assert validator("test@example.com") == ValidationResultType.okay
+        assert validator("invalid-email") == ValidationResultType.regex_mismatch
+
+    def test_invalidated_by_constraint_change(self):
+        field = TextField(name="username", label="Test", max_length=5)
+        validator = field.compile()
+        assert field.validate("abcdef") == ValidationResultType.to_long
+
+        field.label = "Other"
+        assert field.compile() is validator
+
+        field.max_length = 10
+        assert field.compile() is not validator
+        assert field.validate("abcdef") == ValidationResultType.okay
+
+        field.required = True
+        assert field.validate(None) == ValidationResultType.required_missing
+
+    def test_numeric_bounds(self):
+        field = IntegerField(name="age", label="Age", min_value=18)
+        assert field.validate(17) == ValidationResultType.too_small
+        field.min_value = 10
+        assert field.validate(17) == ValidationResultType.okay
+
+        field = FloatField(name="height", label="Height", max_value=3)
+        assert field.validate(2.5) == ValidationResultType.okay
+        assert field.validate(3.5) == ValidationResultType.too_large
+
+    def test_copy_recompiles(self):
+        field = TextField(name="username", label="Test", min_length=3)
+        field.compile()
+        copied = copy.deepcopy(field)
+        copied.min_length = 1
+        assert field.validate("ab") == ValidationResultType.too_short
+        assert copied.validate("ab") == ValidationResultType.okay
+
+    def test_custom_field_overriding_validate(self, backend):
+        class EvenField(IntegerField):
+            def validate(self, value):
+                if value is not None and value % 2:
+                    return ValidationResultType.invalid_type
+                return super().validate(value)
+
+        field = EvenField(name="even", label="Even", max_value=10)
+        assert field.compile()(3) == ValidationResultType.invalid_type
+        assert field.compile()(12) == ValidationResultType.too_large
+        assert field.is_validated(4)
+
+        form = Form(title="Test", fields=[field])
+        form.load_data({"even": 5})
+        assert form.validate() is False
+        assert form.validate_and_dump().errors == {"even": ValidationResultType.invalid_type}
+        assert form.validate_batch(columns={"even": [3, 4, 12]}).invalid_indices() == [0, 2]
+
+    def test_custom_field_without_validation(self):
+        class EmptyField(BaseFormField):
+            pass
+
+        with pytest.raises(NotImplementedError):
+            EmptyField(name="empty", label="Empty").validate(None)
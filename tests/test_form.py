@@ -1,7 +1,11 @@
 """Tests for Form class."""
 
+import copy
+import pickle
+
 import pytest
 from nicegui_ugform import Form, TextField, IntegerField
+from nicegui_ugform.core.fields import ValidationResultType
 
 
 class TestForm:
@@ -55,6 +59,79 @@ class TestForm:
         assert form.get_field("test") == field
         assert form.get_field("nonexistent") is None
 
+    def test_duplicate_field_name(self):
+        form = Form(title="Test")
+        form.add_field(TextField(name="test", label="Test"))
+
+        with pytest.raises(ValueError):
+            form.add_field(TextField(name="test", label="Other"))
+        with pytest.raises(ValueError):
+            Form(title="Test", fields=[TextField(name="a", label="A"), TextField(name="a", label="B")])
+
+    def test_rename_field(self):
+        form = Form(title="Test")
+        field1 = TextField(name="field1", label="Field 1")
+        field2 = TextField(name="field2", label="Field 2")
+        form.add_field(field1)
+        form.add_field(field2)
+
+        field1.name = "renamed"
+        assert form.get_field("renamed") is field1
+        assert form.get_field("field1") is None
+
+        with pytest.raises(ValueError):
+            field1.name = "field2"
+        assert field1.name == "renamed"
+
+        form.rename_field("field2", "field1")
+        assert form.get_field("field1") is field2
+
+    def test_insert_and_move_field(self):
+        form = Form(title="Test")
+        field1 = TextField(name="field1", label="Field 1")
+        field2 = TextField(name="field2", label="Field 2")
+        field3 = TextField(name="field3", label="Field 3")
+        form.add_field(field1)
+        form.add_field(field3)
+        form.insert_field(1, field2)
+        assert form.fields == [field1, field2, field3]
+
+        form.move_field(0, 2)
+        assert form.fields == [field2, field3, field1]
+        assert form.get_field("field1") is field1
+
+        with pytest.raises(IndexError):
+            form.move_field(0, 3)
+
+    def test_removed_field_detached(self):
+        form = Form(title="Test")
+        field = TextField(name="field", label="Field")
+        form.add_field(field)
+        form.remove_field("field")
+
+        # Renaming a removed field no longer affects the form
+        field.name = "other"
+        assert form.get_field("other") is None
+
+    def test_field_of_another_form_is_copied(self):
+        field = TextField(name="field", label="Field")
+        form = Form(title="Test", fields=[field])
+        other = Form(title="Other", fields=form.fields)
+
+        copied = other.get_field("field")
+        assert copied is not field and copied.label == "Field"
+        assert form.get_field("field") is field
+
+        copied.name = "renamed"
+        field.label = "Changed"
+        assert form.has_field("field") and not form.has_field("renamed")
+        assert copied.label == "Field"
+
+        third = Form(title="Third")
+        third.add_field(field)
+        third.fields.append(copied)
+        assert third.get_field("field") is not field and third.get_field("renamed") is not copied
+
     def test_validation_success(self):
         form = Form(title="Test")
         field1 = TextField(name="name", label="Name", required=True)
@@ -81,6 +158,45 @@ class TestForm:
 
         assert form.validate() is False
 
+    def test_compile(self):
+        form = Form(title="Test")
+        field1 = TextField(name="name", label="Name", regex=r"^[A-Z]")
+        field2 = IntegerField(name="age", label="Age", min_value=18)
+        form.add_field(field1)
+        form.add_field(field2)
+
+        validators = form.compile()
+        assert validators == (field1.compile(), field2.compile())
+
+        field2.set_value(15)
+        assert form.validate() is False
+        field2.min_value = 10
+        assert form.compile()[1] is not validators[1]
+        assert form.validate() is True
+
+    def test_validate_and_dump(self):
+        form = Form(title="Test")
+        form.add_field(TextField(name="name", label="Name", required=True))
+        form.add_field(IntegerField(name="age", label="Age", min_value=18))
+        form.add_field(TextField(name="note", label="Note"))
+        form.load_data({"age": 15, "note": "Hi"})
+
+        report = form.validate_and_dump()
+        assert report.is_valid is False
+        assert report.data == {"name": None, "age": 15, "note": "Hi"}
+        assert report.results == {
+            "name": ValidationResultType.required_missing,
+            "age": ValidationResultType.too_small,
+            "note": ValidationResultType.okay,
+        }
+        assert list(report.errors) == ["name", "age"]
+
+        with pytest.raises(ValueError, match="name, age"):
+            form.dump_data()
+
+        form.load_data({"name": "John", "age": 20})
+        assert form.validate_and_dump().is_valid is True
+
     def test_dump_data(self):
         form = Form(title="Test")
         field1 = TextField(name="name", label="Name")
@@ -178,3 +294,92 @@ class TestForm:
         field2 = form.fields[1]
         assert isinstance(field2, IntegerField)
         assert field2.name == "age"
+
+
+class TestFieldList:
+    """Tests for in-place changes of Form.fields."""
+
+    def test_append_and_insert(self):
+        form = Form(title="Test", fields=[TextField(name="a", label="A"), TextField(name="b", label="B")])
+        fingerprint = form.fingerprint
+        form.fields.append(TextField(name="x", label="X"))
+        form.fields.insert(0, TextField(name="y", label="Y"))
+        assert [f.name for f in form.fields] == ["y", "a", "b", "x"]
+        assert form.has_field("x") and form.get_field("y") is form.fields[0]
+        assert form.fingerprint != fingerprint
+        assert [f["name"] for f in form.dump_schema()["fields"]] == ["y", "a", "b", "x"]
+
+        with pytest.raises(ValueError):
+            form.fields.append(TextField(name="a", label="Duplicate"))
+        assert len(form.fields) == 4
+
+    def test_remove(self):
+        form = Form(title="Test", fields=[TextField(name="a", label="A"), TextField(name="b", label="B")])
+        removed = form.fields[0]
+        del form.fields[0]
+        assert not form.has_field("a") and form.get_field("a") is None
+        removed.name = "renamed"  # Detached from the form
+        assert not form.has_field("renamed")
+
+        form = Form(title="Test", fields=[TextField(name="a", label="A"), TextField(name="b", label="B")])
+        assert form.fields.pop().name == "b"
+        form.fields.remove(form.fields[0])
+        assert len(form.fields) == 0 and not form.has_field("a")
+        with pytest.raises(ValueError):
+            form.fields.remove(TextField(name="z", label="Z"))
+
+    def test_replace(self):
+        form = Form(title="Test", fields=[TextField(name="a", label="A"), TextField(name="b", label="B")])
+        form.fields[1] = TextField(name="c", label="C")
+        assert [f.name for f in form.fields] == ["a", "c"]
+        assert not form.has_field("b") and form.has_field("c")
+        with pytest.raises(ValueError):
+            form.fields[1] = TextField(name="a", label="Duplicate")
+        assert [f.name for f in form.fields] == ["a", "c"]
+
+        form.fields.clear()
+        assert len(form.fields) == 0 and not form.has_field("a")
+
+    def test_reorder(self):
+        form = Form(title="Test", fields=[TextField(name="a", label="A"), TextField(name="b", label="B")])
+        fingerprint = form.fingerprint
+        form.fields.reverse()
+        assert [f.name for f in form.fields] == ["b", "a"]
+        assert form.fingerprint != fingerprint
+        form.fields.sort(key=lambda f: f.name)
+        assert [f["name"] for f in form.dump_schema()["fields"]] == ["a", "b"]
+
+    def test_copies_are_plain_lists(self):
+        form = Form(title="Test", fields=[TextField(name="a", label="A"), TextField(name="b", label="B")])
+        fields = form.fields[:]
+        fields.append(TextField(name="x", label="X"))
+        assert len(form.fields) == 2 and not form.has_field("x")
+        assert type(list(form.fields)) is list
+
+
+class TestFormCopy:
+    """Tests for copies of forms."""
+
+    @pytest.mark.parametrize("copy_form", ["deepcopy", "pickle"])
+    def test_copy(self, copy_form):
+        form = Form(title="Test", fields=[TextField(name="a", label="A"), TextField(name="b", label="B")])
+        form.dump_schema()  # Fills the cache
+        fingerprint = form.fingerprint
+        other = copy.deepcopy(form) if copy_form == "deepcopy" else pickle.loads(pickle.dumps(form))
+        assert other.fingerprint == fingerprint
+        assert [f.name for f in other.fields] == ["a", "b"]
+        assert all(f is not g for f, g in zip(form.fields, other.fields))
+
+        other.fields[0].name = "zz"
+        assert other.has_field("zz") and not other.has_field("a")
+        assert form.has_field("a") and not form.has_field("zz")
+        with pytest.raises(ValueError):
+            other.fields[1].name = "zz"
+
+        other.fields[1].label = "Changed"
+        assert other.fingerprint != fingerprint
+        assert other.dump_schema()["fields"][1]["label"] == "Changed"
+        assert form.fingerprint == fingerprint
+
+        other.fields.append(TextField(name="c", label="C"))
+        assert other.get_field("c") is other.fields[2] and len(form.fields) == 2
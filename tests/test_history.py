@@ -0,0 +1,159 @@
+"""Tests for the undo and redo history of form edits."""
+
+import pytest
+from nicegui_ugform import BooleanField, Form, IntegerField, TextField
+from nicegui_ugform.ui import history as history_module
+from nicegui_ugform.ui.history import EditHistory, InsertField, MoveField, RemoveField, SetAttribute
+
+
+@pytest.fixture
+def form() -> Form:
+    return Form(
+        title="Test",
+        fields=[
+            TextField(name="a", label="A"),
+            IntegerField(name="b", label="B"),
+            BooleanField(name="c", label="C"),
+        ],
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(history_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def set_attribute(history: EditHistory, target, key: str, value) -> None:
+    old = getattr(target, key)
+    setattr(target, key, value)
+    history.record(SetAttribute(target, key, old, value))
+
+
+def names(form: Form):
+    return [field.name for field in form.fields]
+
+
+class TestEditHistory:
+    """Tests for EditHistory."""
+
+    def test_set_attribute(self, form):
+        history = EditHistory(form, coalesce_interval=0)
+        field = form.get_field("a")
+        set_attribute(history, field, "label", "First")
+        set_attribute(history, form, "title", "Renamed")
+        assert history.can_undo and not history.can_redo
+
+        history.undo()
+        assert form.title == "Test" and field.label == "First"
+        history.undo()
+        assert field.label == "A"
+        assert not history.can_undo and history.can_redo
+
+        history.redo()
+        history.redo()
+        assert form.title == "Renamed" and field.label == "First"
+        assert history.redo() is None
+
+    def test_structure(self, form):
+        history = EditHistory(form)
+        removed = form.get_field("a")
+        form.remove_field("a")
+        history.record(RemoveField(removed, 0))
+        form.move_field(0, 1)
+        history.record(MoveField(0, 1))
+        added = TextField(name="d", label="D")
+        form.insert_field(1, added)
+        history.record(InsertField(added, 1))
+        assert names(form) == ["c", "d", "b"]
+
+        history.undo()
+        assert names(form) == ["c", "b"]
+        history.undo()
+        assert names(form) == ["b", "c"]
+        history.undo()
+        assert names(form) == ["a", "b", "c"]
+        assert form.get_field("a") is removed
+
+        while history.can_redo:
+            history.redo()
+        assert names(form) == ["c", "d", "b"]
+
+    def test_rename_keeps_index(self, form):
+        history = EditHistory(form)
+        set_attribute(history, form.get_field("a"), "name", "x")
+        history.undo()
+        assert form.has_field("a") and not form.has_field("x")
+
+    def test_coalesce(self, form, clock):
+        history = EditHistory(form, coalesce_interval=1.0)
+        field = form.get_field("a")
+        for i, label in enumerate(["H", "He", "Hel", "Hell"]):
+            clock[0] = i * 0.5
+            set_attribute(history, field, "label", label)
+        history.undo()
+        assert field.label == "A"
+        assert not history.can_undo
+
+    def test_coalesce_limits(self, form, clock):
+        history = EditHistory(form, coalesce_interval=1.0)
+        field = form.get_field("a")
+        set_attribute(history, field, "label", "H")
+        clock[0] = 2.0
+        set_attribute(history, field, "label", "He")
+        set_attribute(history, field, "description", "D")
+        set_attribute(history, form.get_field("b"), "description", "D")
+        history.undo()
+        history.undo()
+        history.undo()
+        assert field.label == "H" and field.description is None
+
+        # Undo ends the step being typed
+        set_attribute(history, field, "label", "X")
+        history.undo()
+        set_attribute(history, field, "label", "Y")
+        history.undo()
+        assert field.label == "H"
+
+    def test_record_discards_redo(self, form):
+        history = EditHistory(form, coalesce_interval=0)
+        set_attribute(history, form, "title", "One")
+        history.undo()
+        set_attribute(history, form, "title", "Two")
+        assert not history.can_redo
+
+    def test_transaction(self, form):
+        history = EditHistory(form)
+        with history.transaction():
+            for field in form.fields:
+                set_attribute(history, field, "required", True)
+            with history.transaction():
+                set_attribute(history, form, "title", "Bulk")
+        with history.transaction():
+            pass
+        history.undo()
+        assert not any(field.required for field in form.fields)
+        assert form.title == "Test"
+        assert not history.can_undo
+
+    def test_max_depth(self, form):
+        history = EditHistory(form, max_depth=2, coalesce_interval=0)
+        for title in ["One", "Two", "Three"]:
+            set_attribute(history, form, "title", title)
+        history.undo()
+        history.undo()
+        assert history.undo() is None
+        assert form.title == "One"
+
+    def test_clear(self, form):
+        history = EditHistory(form)
+        set_attribute(history, form, "title", "One")
+        history.clear()
+        assert not history.can_undo and not history.can_redo
+
+    def test_invalid_arguments(self, form):
+        with pytest.raises(ValueError):
+            EditHistory(form, max_depth=0)
+        with pytest.raises(ValueError):
+            EditHistory(form, coalesce_interval=-1)
@@ -0,0 +1,63 @@
+"""Tests for paged access to submissions."""
+
+import pytest
+from nicegui_ugform.data import RecordsSource, StoreSource, SubmissionStore
+
+
+def make_records(count: int) -> list:
+    return [
+        {"name": f"User{i}", "age": None if i % 10 == 3 else (i * 7) % 50, "subscribe": i % 2 == 0}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(params=["records", "store"])
+def source(request, form, tmp_path):
+    records = make_records(100)
+    if request.param == "records":
+        yield RecordsSource(records)
+        return
+    with SubmissionStore(tmp_path, form.uuid) as store:
+        for data in records:
+            form.load_data(data)
+            store.append(form)
+        yield StoreSource(store)
+
+
+class TestResultsSource:
+    """Tests for RecordsSource and StoreSource."""
+
+    def test_pages(self, source):
+        page = source.fetch(20, 10)
+        assert page.total == 100
+        assert [key for key, _ in page.rows] == list(range(20, 30))
+        assert page.rows[0][1]["name"] == "User20"
+        assert [key for key, _ in source.fetch(95, 10).rows] == list(range(95, 100))
+        assert source.fetch(200, 10).rows == []
+        assert [key for key, _ in source.fetch(0, 3, descending=True).rows] == [99, 98, 97]
+
+    def test_sort(self, source):
+        records = make_records(100)
+        ages = sorted(r["age"] for r in records if r["age"] is not None)
+
+        page = source.fetch(0, 5, sort_by="age")
+        assert page.total == 100
+        assert [data["age"] for _, data in page.rows] == ages[:5]
+        assert [data["age"] for _, data in source.fetch(5, 5, sort_by="age", descending=True).rows] == ages[::-1][5:10]
+        # Missing values come last in both directions
+        assert [data["age"] for _, data in source.fetch(85, 100, sort_by="age").rows][-10:] == [None] * 10
+        assert [data["age"] for _, data in source.fetch(85, 100, sort_by="age", descending=True).rows][-10:] == [
+            None
+        ] * 10
+
+    def test_search(self, source):
+        page = source.fetch(0, 5, search="user1")
+        assert page.total == 11
+        assert [key for key, _ in page.rows] == [1, 10, 11, 12, 13]
+        assert [key for key, _ in source.fetch(0, 2, descending=True, search="USER1").rows] == [19, 18]
+        assert source.fetch(10, 5, search="user1").rows[0][0] == 19
+        assert source.fetch(0, 5, search="nobody") == ([], 0)
+
+        page = source.fetch(0, 3, sort_by="name", descending=True, search="user1")
+        assert [data["name"] for _, data in page.rows] == ["User19", "User18", "User17"]
+        assert page.total == 11
@@ -0,0 +1,127 @@
+"""Tests for client-side validation rules."""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+from nicegui_ugform import BooleanField, FloatField, IntegerField, TextField
+from nicegui_ugform.core.fields import ValidationResultType
+from nicegui_ugform.ui.rules import compile_rules, js_pattern
+
+
+def message(result: ValidationResultType) -> str:
+    return f"msg:{result.name}"
+
+
+def run_rules(rules: str, values: list) -> list:
+    # Delayed rules resolve through promises
+    script = (
+        f"const rules = {rules};"
+        f"Promise.all({json.dumps(values)}.map(v => rules[0](v))).then(r => console.log(JSON.stringify(r)))"
+    )
+    return json.loads(subprocess.run(["node", "-e", script], capture_output=True, check=True, text=True).stdout)
+
+
+def expected_results(field, values: list) -> list:
+    results = [field.compile()(value) for value in values]
+    return [True if result == ValidationResultType.okay else message(result) for result in results]
+
+
+class TestCompileRules:
+    """Tests for compile_rules."""
+
+    def test_text_rules(self):
+        field = TextField(name="code", label="Code", required=True, min_length=2, max_length=4, regex=r"[a-z]\d")
+        rules = compile_rules(field, message)
+        assert rules.startswith("[") and rules.endswith("]")
+        for result in ("required_missing", "invalid_type", "too_short", "to_long", "regex_mismatch"):
+            assert f'"msg:{result}"' in rules
+        assert "new RegExp(\"[a-z]\\\\p{Nd}\", 'yu')" in rules
+
+    def test_number_rules(self):
+        rules = compile_rules(IntegerField(name="age", label="Age", min_value=0, max_value=120), message)
+        assert "Number.isInteger(n)" in rules
+        assert "n < 0" in rules and "n > 120" in rules
+        assert "msg:required_missing" not in rules
+
+        rules = compile_rules(FloatField(name="height", label="Height", min_value=0.5), message)
+        assert "Number.isInteger" not in rules
+        assert "n < 0.5" in rules and "msg:too_large" not in rules
+
+    def test_delayed_rules(self):
+        field = IntegerField(name="age", label="Age", min_value=0)
+        assert "setTimeout" not in compile_rules(field, message)
+        rules = compile_rules(field, message, delay=250)
+        assert "new Promise" in rules and "setTimeout(() => resolve(check(v)), 250)" in rules
+
+    def test_unsupported_pattern_left_to_server(self):
+        rules = compile_rules(TextField(name="code", label="Code", regex=r"(?i)abc"), message)
+        assert "RegExp" not in rules and "msg:regex_mismatch" not in rules
+
+    def test_boolean_has_no_rules(self):
+        assert compile_rules(BooleanField(name="ok", label="OK"), message) is None
+
+    def test_messages_are_escaped(self):
+        rules = compile_rules(TextField(name="t", label="T", required=True), lambda result: 'a "quoted"\n message')
+        assert '"a \\"quoted\\"\\n message"' in rules
+
+
+class TestJsPattern:
+    """Tests for js_pattern."""
+
+    @pytest.mark.parametrize(
+        "pattern, expected",
+        [
+            (r"^[\w.+-]+@example\.com$", r"^[\p{L}\p{N}_.+-]+@example\.com(?=\n?$)"),
+            (r"(?P<word>\w+) (?P=word)", r"(?<word>[\p{L}\p{N}_]+) \k<word>"),
+            (r"\d\D[\d\b]", r"\p{Nd}\P{Nd}[\p{Nd}\b]"),
+            (r"a.b[.$]", r"a[^\n]b[.$]"),
+            (r"[\W]", None),
+            (r"[^\S]", None),
+            (r"(?:ab)+(?=c)", r"(?:ab)+(?=c)"),
+            (r"\A\d+\Z", None),
+            (r"(?i)abc", None),
+            (r"(?#comment)abc", None),
+            (r"[]a]", None),
+            (r"(?>a)b", None),
+            (r"a*+", None),
+        ],
+    )
+    def test_conversion(self, pattern, expected):
+        assert js_pattern(pattern) == expected
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="Node.js is not installed")
+class TestRulesInJavaScript:
+    """Tests running the compiled rules, compared with the validators of the fields."""
+
+    @pytest.mark.parametrize(
+        "regex, values",
+        [
+            (r"^\w+$", ["张三", "abc_1", "a b", "", "x\n", "ß٣"]),
+            (r"\d+", ["123", "٣٤", "１２", "a1", "\u00b2"]),
+            (r"\s\S", [" a", "\u3000a", "\x1ca", "\ufeffa", "\u00a0 "]),
+            (r".*\bend\b", ["the end", "legend", "末end", "end_", "éend"]),
+            (r"a.c$", ["abc", "a\nc", "a\rc", "a\u2028c", "abc\n", "abc\n\n", "abcd"]),
+            (r"[\w-]+@[^\s]+", ["名字@例子", "a-b@c", "a b@c", "@c"]),
+        ],
+    )
+    def test_regex_matches_python(self, regex, values):
+        field = TextField(name="t", label="T", regex=regex)
+        assert run_rules(compile_rules(field, message), values) == expected_results(field, values)
+
+    def test_constraints_match_python(self):
+        field = TextField(name="t", label="T", required=True, min_length=2, max_length=3)
+        values = [None, "", "a", "😀😀", "abcd"]
+        assert run_rules(compile_rules(field, message), values) == expected_results(field, values)
+
+        field = IntegerField(name="n", label="N", min_value=0, max_value=10)
+        # Empty number inputs give None to the server, but may give "" in the browser
+        values = [None, 5, 5.5, -1, 11]
+        assert run_rules(compile_rules(field, message), values) == expected_results(field, values)
+
+    def test_delayed_rules_match_python(self):
+        field = IntegerField(name="n", label="N", required=True, min_value=0)
+        values = [None, 5, -1]
+        assert run_rules(compile_rules(field, message, delay=20), values) == expected_results(field, values)
@@ -0,0 +1,121 @@
+"""Tests for immutable form schemas and per-session form states."""
+
+import pytest
+from nicegui_ugform import Form, FormSchema, FormState
+from nicegui_ugform.core.fields import ValidationResultType
+
+
+@pytest.fixture
+def form(form: Form) -> Form:
+    """The shared form with a description, a name of at least 2 characters and a non-negative age of 18 by default."""
+    form.description = "Description"
+    form.get_field("name").min_length = 2
+    age = form.get_field("age")
+    age.min_value, age.default_value = 0, 18
+    return form
+
+
+class TestFormSchema:
+    """Tests for FormSchema."""
+
+    def test_snapshot(self, form):
+        schema = form.freeze()
+
+        assert schema.uuid == form.uuid
+        assert schema.title == "Test"
+        assert schema.description == "Description"
+        assert len(schema) == 4
+        assert schema.index_of("age") == 1
+        assert schema.get_field("name").min_length == 2
+        assert schema.get_field("nonexistent") is None
+
+    def test_shared_until_changed(self, form):
+        schema = form.freeze()
+
+        assert form.freeze() is schema
+
+        form.title = "Changed"
+        changed = form.freeze()
+        assert changed is not schema
+        assert changed.title == "Changed"
+        assert schema.title == "Test"
+
+    def test_immutable(self, form):
+        schema = form.freeze()
+
+        with pytest.raises(AttributeError):
+            schema.title = "Changed"
+        with pytest.raises(AttributeError):
+            schema.fields[0].label = "Changed"
+
+        # The snapshot is detached from the editable form
+        form.fields[0].label = "Changed"
+        assert schema.fields[0].label == "Name"
+
+    def test_hashable(self, form):
+        schema = form.freeze()
+        other = FormSchema(form)
+
+        assert schema is not other
+        assert schema == other
+        assert len({schema, other}) == 1
+
+
+class TestFormState:
+    """Tests for FormState."""
+
+    def test_defaults(self, form):
+        state = form.new_state()
+        assert state.values == [None, 18, None, None]
+        assert state.get_value("age") == 18
+
+    def test_isolated_sessions(self, form):
+        state1 = form.new_state()
+        state2 = form.new_state()
+
+        state1.set_value("name", "John")
+        assert state1.schema is state2.schema
+        assert state2.get_value("name") is None
+        assert form.fields[0].get_value() is None
+
+    def test_validate_and_dump(self, form):
+        state = form.new_state()
+
+        assert form.validate(state) is False
+        with pytest.raises(ValueError):
+            form.dump_data(state=state)
+
+        form.load_data({"name": "john", "age": 30, "unknown": 1}, state=state)
+        assert form.validate(state) is True
+        assert form.dump_data(state=state) == {"name": "john", "age": 30, "height": None, "subscribe": None}
+
+    def test_validation_report(self, form):
+        state = form.new_state()
+        state.set_value("age", -1)
+
+        report = form.validate_and_dump(state)
+        assert report.is_valid is False
+        assert report.data == {"name": None, "age": -1, "height": None, "subscribe": None}
+        assert report.errors == {
+            "name": ValidationResultType.required_missing,
+            "age": ValidationResultType.too_small,
+        }
+
+    def test_reset_and_copy(self, form):
+        state = form.new_state()
+        state.set_value("age", 40)
+        copied = state.copy()
+
+        state.reset()
+        assert state.get_value("age") == 18
+        assert copied.get_value("age") == 40
+
+    def test_unknown_field(self, form):
+        state = form.new_state()
+        with pytest.raises(KeyError):
+            state.set_value("nonexistent", 1)
+
+    def test_wrong_value_count(self, form):
+        schema = form.freeze()
+        with pytest.raises(ValueError):
+            FormState(schema, [None])
@@ -0,0 +1,66 @@
+"""Tests for the field search index."""
+
+from nicegui_ugform.ui.search import FieldIndex
+
+
+def make_index() -> FieldIndex:
+    index = FieldIndex()
+    index.update(1, ["username", "User Name", "Login of the user", "Text"])
+    index.update(2, ["age", "Age", None, "Integer"])
+    index.update(3, ["email", "E-Mail", "Contact address", "Text"])
+    return index
+
+
+class TestFieldIndex:
+    """Tests for FieldIndex."""
+
+    def test_short_terms(self):
+        index = make_index()
+        assert index.search("a") == {1, 2, 3}
+        assert index.search("ag") == {2}
+        assert index.search("AGE") == {2}
+        assert index.search("zz") == set()
+
+    def test_long_terms(self):
+        index = make_index()
+        assert index.search("name") == {1}
+        assert index.search("address") == {3}
+        assert index.search("integer") == {2}
+        assert index.search("usera") == set()
+
+    def test_trigrams_in_different_texts(self):
+        index = FieldIndex()
+        # Both trigrams of "abcd" occur, but not the term itself
+        index.update(1, ["abc", "bcd"])
+        assert index.search("abcd") == set()
+        index.update(2, ["xabcdx"])
+        assert index.search("abcd") == {2}
+
+    def test_multiple_terms(self):
+        index = make_index()
+        assert index.search("text user") == {1}
+        assert index.search("  text   ") == {1, 3}
+        assert index.search("text age") == set()
+
+    def test_empty_query(self):
+        index = make_index()
+        assert index.search("") == {1, 2, 3}
+        assert index.search("   ") == {1, 2, 3}
+
+    def test_update_and_remove(self):
+        index = make_index()
+        index.update(2, ["years", "Years"])
+        assert index.search("age") == set()
+        assert index.search("year") == {2}
+        index.remove(2)
+        assert index.search("year") == set()
+        assert 2 not in index and len(index) == 2
+        index.remove(2)
+        assert not any(2 in keys for keys in index._grams.values())
+
+    def test_matches(self):
+        index = make_index()
+        assert index.matches(1, "login user")
+        assert not index.matches(2, "login")
+        assert index.matches(3, "")
+        assert not index.matches(4, "")
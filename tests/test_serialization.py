@@ -1,7 +1,26 @@
 """Tests for form serialization and deserialization."""
 
+import base64
+import gzip
+import io
+import json
+
 import pytest
-from nicegui_ugform import Form, TextField, IntegerField, FloatField
+from nicegui_ugform import BooleanField, Form, TextField, IntegerField, FloatField, SchemaLimitError, SchemaLimits
+from nicegui_ugform.core import CompressionType
+from nicegui_ugform.core import fields as fields_module
+from nicegui_ugform.core.compression import decompress
+from nicegui_ugform.core.encoding import decode_schema, encode_schema
+
+
+def make_large_form(repeat: int) -> Form:
+    form = Form(title="Survey", description="Description", locale="en")
+    for i in range(repeat):
+        form.add_field(TextField(name=f"name_{i}", label="Name", required=True, min_length=2, max_length=50))
+        form.add_field(IntegerField(name=f"age_{i}", label="Age", min_value=0, max_value=120))
+        form.add_field(FloatField(name=f"height_{i}", label="Height", min_value=0.5))
+        form.add_field(BooleanField(name=f"subscribe_{i}", label="Subscribe", default_value=False))
+    return form
 
 
 class TestSerialization:
@@ -31,6 +50,15 @@ class TestSerialization:
         assert getattr(field2, "min_value") == 18
         assert getattr(field2, "max_value") == 120
 
+    def test_load_schema_keeps_input(self):
+        form = Form(title="Test")
+        form.add_field(TextField(name="name", label="Name"))
+        schema = form.dump_schema()
+
+        Form.load_schema(schema)
+        assert schema["fields"][0]["type"] == "TextField"
+        assert len(Form.load_schema(schema).fields) == 1
+
     def test_roundtrip_binary_uncompressed(self):
         form = Form(title="Test Form")
         form.add_field(TextField(name="field", label="Field"))
@@ -76,3 +104,321 @@ class TestSerialization:
     def test_invalid_compression_flag(self):
         with pytest.raises(ValueError, match="compression flag"):
             Form.load_schema_bin(b"UGFS\x01\xff\x00\x00" + b"{}")
+
+
+class TestSchemaDumpCache:
+    """Tests for the cached schema dumps."""
+
+    def test_cached_until_changed(self, form):
+        binary = form.dump_schema_bin()
+        b64_string = form.dump_schema_b64()
+        fingerprint = form.fingerprint
+
+        assert form.dump_schema_bin() is binary
+        assert form.dump_schema_b64() is b64_string
+        assert form.fingerprint == fingerprint
+
+        form.title = "Changed"
+        assert form.dump_schema_bin() is not binary
+        assert form.fingerprint != fingerprint
+        assert Form.load_schema_b64(form.dump_schema_b64()).title == "Changed"
+
+    def test_field_changes_invalidate(self, form):
+        field = form.fields[0]
+
+        changes = [
+            lambda: setattr(field, "min_length", 3),
+            lambda: setattr(field, "name", "username"),
+            lambda: form.move_field(0, 1),
+            lambda: form.add_field(FloatField(name="weight", label="Weight")),
+            lambda: form.remove_field("weight"),
+        ]
+        for change in changes:
+            fingerprint = form.fingerprint
+            revision = form.revision
+            change()
+            assert form.revision > revision
+            assert form.fingerprint != fingerprint
+
+        assert form.dump_schema()["fields"][1] == {
+            "type": "TextField",
+            "name": "username",
+            "label": "Name",
+            "required": True,
+            "min_length": 3,
+        }
+
+    def test_values_do_not_invalidate(self, form):
+        binary = form.dump_schema_bin()
+        form.load_data({"name": "John", "age": 20})
+        assert form.dump_schema_bin() is binary
+
+    def test_detached_field_does_not_invalidate(self, form):
+        field = form.fields[1]
+        form.remove_field("age")
+        revision = form.revision
+        field.label = "Changed"
+        assert form.revision == revision
+
+    def test_dump_schema_returns_copy(self, form):
+        schema = form.dump_schema()
+        schema["title"] = "Corrupted"
+        schema["fields"][0]["label"] = "Corrupted"
+
+        assert form.dump_schema()["title"] == "Test"
+        assert form.dump_schema()["fields"][0]["label"] == "Name"
+
+    def test_fingerprint_is_stable(self, form):
+        form1 = Form(title="Test Form", form_uuid="same-uuid")
+        form2 = Form(title="Test Form", form_uuid="same-uuid")
+        assert form1.fingerprint == form2.fingerprint
+        assert len(form1.fingerprint) == 64
+
+
+class TestSchemaCompression:
+    """Tests for the compression flags of binary schemas."""
+
+    @pytest.mark.parametrize("compression_flag", [0, 1, 2, 3, "auto"])
+    def test_roundtrip(self, compression_flag):
+        form = make_large_form(5)
+        binary = form.dump_schema_bin(compression_flag=compression_flag)
+        loaded_form = Form.load_schema_bin(binary)
+
+        assert loaded_form.dump_schema() == form.dump_schema()
+
+    def test_auto_picks_smallest(self):
+        for form in (make_large_form(1), make_large_form(200)):
+            sizes = {flag: len(form.dump_schema_bin(compression_flag=flag)) for flag in CompressionType}
+            binary = form.dump_schema_bin(compression_flag="auto")
+
+            assert len(binary) == min(sizes.values())
+            assert sizes[binary[5]] == len(binary)
+
+    def test_preset_dictionary_helps_small_schemas(self):
+        form = make_large_form(1)
+        assert len(form.dump_schema_bin(compression_flag=2)) < len(form.dump_schema_bin(compression_flag=1))
+
+    def test_invalid_dump_flag(self):
+        with pytest.raises(ValueError, match="compression flag"):
+            make_large_form(1).dump_schema_bin(compression_flag=9)
+
+
+class TestCompactSchemaEncoding:
+    """Tests for the compact binary body of schema version 2."""
+
+    @pytest.mark.parametrize("compression_flag", [0, 1, 2, 3])
+    def test_roundtrip(self, compression_flag):
+        form = make_large_form(5)
+        form.add_field(TextField(name="email", label="电子邮件", regex=r"^\S+@\S+$", default_value="a@b.c"))
+        form.add_field(IntegerField(name="offset", label="Offset", min_value=-(2**70), max_value=-1))
+        binary = form.dump_schema_bin(compression_flag=compression_flag, schema_version=2)
+        loaded_form = Form.load_schema_bin(binary)
+
+        assert binary[4] == 2
+        assert loaded_form.dump_schema() == form.dump_schema()
+        assert type(loaded_form.get_field("height_0").min_value) is float
+        assert loaded_form.get_field("offset").min_value == -(2**70)
+
+    def test_smaller_than_json(self):
+        form = make_large_form(20)
+        assert len(form.dump_schema_bin(0, schema_version=2)) * 2 < len(form.dump_schema_bin(0, schema_version=1))
+
+    def test_version_1_still_loads(self):
+        form = make_large_form(2)
+        binary = b"UGFS\x01\x00\x00\x00" + json.dumps(form.dump_schema()).encode("utf-8")
+        assert Form.load_schema_bin(binary).dump_schema() == form.dump_schema()
+
+    def test_unsupported_version(self):
+        with pytest.raises(ValueError, match="version"):
+            Form.load_schema_bin(b"UGFS\x03\x00\x00\x00")
+        with pytest.raises(ValueError, match="version"):
+            make_large_form(1).dump_schema_bin(schema_version=3)
+
+    def test_malformed_body(self):
+        binary = make_large_form(1).dump_schema_bin(compression_flag=0, schema_version=2)
+        with pytest.raises(ValueError, match="truncated"):
+            Form.load_schema_bin(binary[:-3])
+        with pytest.raises(ValueError, match="trailing"):
+            Form.load_schema_bin(binary + b"\x00")
+
+
+class TestCompactSchemaDecoding:
+    """Tests for decoding field records of schema version 2."""
+
+    def decode(self, schema: dict):
+        return decode_schema(memoryview(encode_schema(schema)))
+
+    def test_fields_equal_constructed(self):
+        form = make_large_form(1)
+        form.add_field(TextField(name="code", label="Code", regex=r"[a-z]+", default_value="abc"))
+        attributes, fields = self.decode(form.dump_schema())
+        assert attributes["title"] == "Survey"
+        for field, expected in zip(fields, form.fields):
+            assert type(field) is type(expected)
+            assert field.__dict__ == {k: v for k, v in expected.__dict__.items() if not k.startswith("_")}
+        assert fields[-1].get_value() == "abc"
+        assert fields[-1].validate("123").name == "regex_mismatch"
+
+        loaded = Form(title="Loaded", fields=fields)
+        loaded.fields[0].name = "renamed"
+        assert loaded.has_field("renamed")
+
+    def test_type_not_first(self):
+        schema = {"title": "T", "fields": [{"name": "a", "label": "A", "type": "TextField", "max_length": 3}]}
+        _, fields = self.decode(schema)
+        assert isinstance(fields[0], TextField) and fields[0].max_length == 3
+
+    def test_unknown_type_is_skipped(self):
+        schema = {
+            "title": "T",
+            "fields": [{"type": "Unknown", "name": "a"}, {"type": "BooleanField", "name": "b", "label": "B"}],
+        }
+        _, fields = self.decode(schema)
+        assert [field.name for field in fields] == ["b"]
+
+    def test_invalid_records(self):
+        with pytest.raises(ValueError, match="unknown attribute"):
+            self.decode({"title": "T", "fields": [{"type": "TextField", "name": "a", "label": "A", "min_value": 1}]})
+        with pytest.raises(ValueError, match="current_value"):
+            self.decode(
+                {"title": "T", "fields": [{"type": "TextField", "name": "a", "label": "A", "current_value": "x"}]}
+            )
+        with pytest.raises(ValueError, match="without a name"):
+            self.decode({"title": "T", "fields": [{"type": "TextField", "name": "a"}]})
+
+    def test_replaced_type_uses_constructor(self, monkeypatch):
+        class CustomTextField(TextField):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.custom = True
+
+        monkeypatch.setitem(fields_module.FIELD_TYPES, "TextField", CustomTextField)
+        _, fields = self.decode({"title": "T", "fields": [{"type": "TextField", "name": "a", "label": "A"}]})
+        assert isinstance(fields[0], CustomTextField) and fields[0].custom
+
+
+class TestSchemaLimits:
+    """Tests for the limits applied when loading binary schemas."""
+
+    @pytest.mark.parametrize("compression_flag", [0, 1, 2, 3])
+    def test_max_bytes(self, compression_flag):
+        form = make_large_form(2)
+        binary = form.dump_schema_bin(compression_flag=compression_flag)
+        size = len(form.dump_schema_bin(compression_flag=0)) - 8
+
+        assert Form.load_schema_bin(binary, limits=SchemaLimits(max_bytes=size)).title == "Survey"
+        with pytest.raises(SchemaLimitError, match="decompressed bytes"):
+            Form.load_schema_bin(binary, limits=SchemaLimits(max_bytes=size - 1))
+
+    def test_decompression_bomb(self):
+        bomb = b"UGFS\x01\x01\x00\x00" + gzip.compress(b'{"title":"' + b" " * (32 * 1024 * 1024) + b'"}')
+        assert len(bomb) < 64 * 1024
+        with pytest.raises(SchemaLimitError):
+            Form.load_schema_b64(base64.b64encode(bomb).decode("ascii"))
+
+    @pytest.mark.parametrize("schema_version", [1, 2])
+    def test_max_fields(self, schema_version):
+        binary = make_large_form(3).dump_schema_bin(schema_version=schema_version)
+
+        assert len(Form.load_schema_bin(binary, limits=SchemaLimits(max_fields=12)).fields) == 12
+        with pytest.raises(SchemaLimitError, match="fields"):
+            Form.load_schema_bin(binary, limits=SchemaLimits(max_fields=11))
+
+    @pytest.mark.parametrize("schema_version", [1, 2])
+    def test_max_string_length(self, schema_version):
+        form = make_large_form(1)
+        form.add_field(TextField(name="long", label="x" * 100))
+        binary = form.dump_schema_bin(schema_version=schema_version)
+
+        assert Form.load_schema_bin(binary, limits=SchemaLimits(max_string_length=100)).get_field("long")
+        with pytest.raises(SchemaLimitError, match="per string"):
+            Form.load_schema_bin(binary, limits=SchemaLimits(max_string_length=99))
+
+    def test_no_limits(self):
+        binary = make_large_form(3).dump_schema_bin()
+        assert Form.load_schema_bin(binary, limits=SchemaLimits(None, None, None)).title == "Survey"
+
+    @pytest.mark.parametrize("compression_flag", [0, 1, 2, 3])
+    def test_file_like(self, compression_flag, monkeypatch):
+        monkeypatch.setattr(Form, "_READ_CHUNK_SIZE", 7)
+        form = make_large_form(3)
+        binary = form.dump_schema_bin(compression_flag=compression_flag, schema_version=2)
+
+        assert Form.load_schema_bin(io.BytesIO(binary)).dump_schema() == form.dump_schema()
+        assert Form.load_schema_bin(memoryview(bytearray(binary))).dump_schema() == form.dump_schema()
+
+    def test_uncompressed_chunks(self):
+        chunks = [memoryview(b"__abc")[2:], b"def"]
+        assert decompress(chunks, 0, max_size=6) == b"abcdef"
+        assert type(decompress(chunks[:1], 0)) is bytes
+        with pytest.raises(SchemaLimitError):
+            decompress(chunks, 0, max_size=5)
+
+    def test_concatenated_gzip_members(self):
+        json_bytes = json.dumps(make_large_form(1).dump_schema()).encode("utf-8")
+        binary = b"UGFS\x01\x01\x00\x00" + gzip.compress(json_bytes[:10]) + gzip.compress(json_bytes[10:])
+        assert Form.load_schema_bin(binary).title == "Survey"
+
+    @pytest.mark.parametrize("compression_flag", [1, 2, 3])
+    def test_corrupted_data(self, compression_flag):
+        binary = make_large_form(3).dump_schema_bin(compression_flag=compression_flag)
+        with pytest.raises(ValueError, match="compressed data"):
+            Form.load_schema_bin(binary[:-4])
+        with pytest.raises(ValueError):
+            Form.load_schema_bin(binary[:8] + bytes(b ^ 0x55 for b in binary[8:]))
+
+
+class TestDataBinary:
+    """Tests for the compact binary representation of form data."""
+
+    def test_roundtrip(self, form):
+        form.add_field(BooleanField(name="agree", label="Agree"))
+        data = {"name": "张三 John", "age": -(2**40), "height": 1.75, "subscribe": None, "agree": True}
+        form.load_data(data)
+        binary = form.dump_data_bin()
+
+        loaded_form = Form.load_schema(form.dump_schema())
+        loaded_form.load_data_bin(binary)
+        assert loaded_form.dump_data() == data
+        assert len(binary) * 2 < len(json.dumps(data).encode("utf-8"))
+
+    def test_roundtrip_state(self, form):
+        state = form.new_state()
+        form.load_data({"name": "John", "age": 30, "height": 2, "subscribe": False}, state=state)
+        binary = form.dump_data_bin(state=state)
+
+        other = form.new_state()
+        form.load_data_bin(binary, state=other)
+        assert other.values == ["John", 30, 2.0, False]
+
+    def test_schema_mismatch(self, form):
+        form.load_data({"name": "John"})
+        binary = form.dump_data_bin()
+
+        form.get_field("age").max_value = 100
+        with pytest.raises(ValueError, match="fingerprint"):
+            form.load_data_bin(binary)
+
+    def test_invalid_values(self, form):
+        with pytest.raises(ValueError, match="validation failed"):
+            form.dump_data_bin()
+        assert len(form.dump_data_bin(allow_invalid=True)) > 0
+
+        form.load_data({"name": "John", "age": "30"})
+        with pytest.raises(ValueError, match="Cannot encode"):
+            form.dump_data_bin(allow_invalid=True)
+
+        form.load_data({"name": "John", "height": 10**400})
+        with pytest.raises(ValueError, match="Cannot encode"):
+            form.dump_data_bin(allow_invalid=True)
+
+    def test_malformed_data(self, form):
+        form.load_data({"name": "John", "age": 30})
+        binary = form.dump_data_bin()
+
+        with pytest.raises(ValueError, match="magic"):
+            form.load_data_bin(b"UGFS" + binary[4:])
+        with pytest.raises(ValueError, match="truncated"):
+            form.load_data_bin(binary[:-1])
+        with pytest.raises(ValueError, match="trailing"):
+            form.load_data_bin(binary + b"\x00")
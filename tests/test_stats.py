@@ -0,0 +1,69 @@
+"""Tests for submission statistics."""
+
+import pytest
+from nicegui_ugform.data import FormStats
+from nicegui_ugform.data import stats
+
+RECORDS = [
+    {"name": "Al", "age": 20, "height": 1.5, "subscribe": True},
+    {"name": "Bob", "age": 30, "height": None, "subscribe": False},
+    {"name": "Carol", "age": "40", "height": 2, "subscribe": True},
+    {"age": 50, "height": 1.75},
+]
+
+
+class TestFormStats:
+    """Tests for FormStats."""
+
+    def test_summaries(self, form, backend):
+        form_stats = FormStats(form)
+        form_stats.update(RECORDS)
+        summaries = form_stats.summaries()
+
+        assert form_stats.size == 4
+        assert summaries["age"] == (stats.FieldSummary("age", "integer", 3, 0, 1, 20, 50, pytest.approx(100 / 3), None))
+        assert summaries["height"].null_count == 1
+        assert summaries["height"].mean == pytest.approx(1.75)
+        assert summaries["name"][3:8] == (1, 0, 2, 5, pytest.approx(10 / 3))
+        assert summaries["subscribe"].true_count == 2
+        assert summaries["subscribe"].mean == pytest.approx(2 / 3)
+
+    def test_incremental(self, form, backend):
+        form_stats = FormStats(form, batch_size=3)
+        form_stats.update(RECORDS[:2])
+        assert form_stats.summary("age").max == 30
+
+        form_stats.update(RECORDS[2:])
+        assert form_stats.summary("age").max == 50
+        assert form_stats.quantiles("age", [0, 0.5, 1]) == [20, 30, 50]
+
+    def test_distributions(self, form, backend):
+        form_stats = FormStats(form)
+        form_stats.update({"age": age} for age in range(100))
+
+        assert form_stats.quantiles("age", [0.25, 0.9]) == pytest.approx([24.75, 89.1])
+        counts, edges = form_stats.histogram("age", bins=4)
+        assert counts == [25, 25, 25, 25]
+        assert edges == pytest.approx([0, 24.75, 49.5, 74.25, 99])
+        counts, _ = form_stats.histogram("age", bins=2, bounds=(0, 10))
+        assert counts == [5, 6]
+
+        with pytest.raises(ValueError):
+            form_stats.histogram("subscribe")
+        assert form_stats.quantiles("height", [0.5]) == [None]
+
+    def test_numpy_columns(self, form):
+        np = pytest.importorskip("numpy")
+        form_stats = FormStats(form)
+        form_stats.update_columns(
+            {
+                "age": np.array([1, 2, 3]),
+                "height": np.array([1.0, np.nan, 2.0]),
+                "subscribe": np.array([True, False, True]),
+            }
+        )
+
+        assert form_stats.summary("age").mean == 2
+        assert form_stats.summary("height").null_count == 1
+        assert form_stats.summary("subscribe").true_count == 2
+        assert form_stats.summary("name").null_count == 3
@@ -0,0 +1,87 @@
+"""Tests for the submission store."""
+
+import pytest
+from nicegui_ugform import Form, TextField
+from nicegui_ugform.data import SubmissionStore
+
+
+def append_many(store: SubmissionStore, form: Form, count: int) -> None:
+    state = form.new_state()
+    for i in range(count):
+        state.values = [f"user{i}", i, None, i % 2 == 0]
+        store.append(state, timestamp=1000.0 + i)
+
+
+class TestSubmissionStore:
+    """Tests for SubmissionStore."""
+
+    def test_append_and_read(self, form, tmp_path):
+        with SubmissionStore(tmp_path, form.uuid) as store:
+            form.load_data({"name": "John", "age": 30})
+            assert store.append(form, timestamp=1.5) == 0
+            append_many(store, form, 10)
+
+            assert len(store) == 11
+            submission = store.get(0)
+            assert submission.sequence == 0
+            assert submission.timestamp == 1.5
+            assert submission.data == {"name": "John", "age": 30, "height": None, "subscribe": None}
+            assert store.get(5).data == {"name": "user4", "age": 4, "height": None, "subscribe": True}
+            with pytest.raises(IndexError):
+                store.get(11)
+
+    def test_scan_filters(self, form, tmp_path):
+        with SubmissionStore(tmp_path, form.uuid) as store:
+            append_many(store, form, 100)
+
+            assert [s.sequence for s in store.scan()] == list(range(100))
+            assert [s.data["age"] for s in store.scan(since=1010, until=1015)] == [10, 11, 12, 13, 14]
+            assert len(list(store.scan(where={"subscribe": True}))) == 50
+            assert [s.sequence for s in store.scan(start=95, where=lambda data: data["age"] % 2)] == [95, 97, 99]
+
+    def test_rotation_and_reopen(self, form, tmp_path):
+        with SubmissionStore(tmp_path, form.uuid, segment_size=1024) as store:
+            append_many(store, form, 200)
+        assert len(list((tmp_path / form.uuid).glob("*.seg"))) > 1
+
+        with SubmissionStore(tmp_path, form.uuid, segment_size=1024) as store:
+            assert len(store) == 200
+            append_many(store, form, 10)
+            assert len(store) == 210
+            assert [s.data["age"] for s in store.scan(start=195)] == [195, 196, 197, 198, 199] + list(range(10))
+            assert store.get(150).data["name"] == "user150"
+
+    def test_recover_torn_write(self, form, tmp_path):
+        with SubmissionStore(tmp_path, form.uuid) as store:
+            append_many(store, form, 10)
+
+        segment = next((tmp_path / form.uuid).glob("*.seg"))
+        index = next((tmp_path / form.uuid).glob("*.idx"))
+        # A crash may leave a partial frame behind, and an index missing the last entries
+        segment.write_bytes(segment.read_bytes() + b"\x10\x00\x00")
+        index.write_bytes(index.read_bytes()[:-20])
+
+        with SubmissionStore(tmp_path, form.uuid) as store:
+            assert len(store) == 10
+            assert store.get(9).data["age"] == 9
+            append_many(store, form, 1)
+            assert store.get(10).data["age"] == 0
+
+    def test_schema_change(self, form, tmp_path):
+        with SubmissionStore(tmp_path, form.uuid) as store:
+            append_many(store, form, 2)
+            form.remove_field("subscribe")
+            form.load_data({"name": "Jane", "age": 20})
+            store.append(form)
+
+        with SubmissionStore(tmp_path, form.uuid) as store:
+            assert store.get(0).data == {"name": "user0", "age": 0, "height": None, "subscribe": True}
+            assert store.get(2).data == {"name": "Jane", "age": 20, "height": None}
+
+    def test_rejects_other_form_and_invalid_data(self, form, tmp_path):
+        with SubmissionStore(tmp_path, form.uuid) as store:
+            with pytest.raises(ValueError, match="does not belong"):
+                store.append(Form(title="Other", fields=[TextField(name="name", label="Name")]))
+            with pytest.raises(ValueError, match="validation failed"):
+                store.append(form)
+            assert len(store) == 0